@@ -5,6 +5,7 @@ from sqlalchemy import pool
 
 from alembic import context
 
+from core.settings import get_settings
 from database import Base
 
 # this is the Alembic Config object, which provides
@@ -16,6 +17,9 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
+# The application settings (DATABASE_URL) take precedence over alembic.ini.
+config.set_main_option("sqlalchemy.url", get_settings().database_url)
+
 # add your model's MetaData object here
 # for 'autogenerate' support
 # from myapp import mymodel
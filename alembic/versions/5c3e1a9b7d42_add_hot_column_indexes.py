@@ -0,0 +1,48 @@
+"""Add hot column indexes
+
+Revision ID: 5c3e1a9b7d42
+Revises: 09eebf8935d7
+Create Date: 2026-10-18 10:12:31.482610
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5c3e1a9b7d42"
+down_revision: Union[str, Sequence[str], None] = "09eebf8935d7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_transactions_properties_concepts_id_period",
+        "transactions",
+        ["properties_concepts_id", "period"],
+    )
+    op.create_index("ix_transactions_date", "transactions", ["date"])
+    op.create_index("ix_contracts_end_date", "contracts", ["end_date"])
+    op.create_index(
+        "uq_properties_concepts_property_id_concept_id",
+        "properties_concepts",
+        ["property_id", "concept_id"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "uq_properties_concepts_property_id_concept_id",
+        table_name="properties_concepts",
+    )
+    op.drop_index("ix_contracts_end_date", table_name="contracts")
+    op.drop_index("ix_transactions_date", table_name="transactions")
+    op.drop_index(
+        "ix_transactions_properties_concepts_id_period", table_name="transactions"
+    )
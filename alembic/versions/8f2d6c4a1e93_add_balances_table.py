@@ -0,0 +1,65 @@
+"""Add balances table
+
+Revision ID: 8f2d6c4a1e93
+Revises: 5c3e1a9b7d42
+Create Date: 2026-10-18 11:40:07.915234
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "8f2d6c4a1e93"
+down_revision: Union[str, Sequence[str], None] = "5c3e1a9b7d42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Self-contained on purpose: this revision must keep working however the models
+# and repositories change later. BalanceRepository.rebuild() fills the table the
+# same way for the reconcile command.
+SUMS = ", ".join(
+    f"COALESCE(SUM(CASE WHEN t.transaction_type = '{transaction_type}' "
+    "THEN t.amount ELSE 0 END), 0)"
+    for transaction_type in ("income", "expense")
+)
+INSERT = "INSERT INTO balances (scope, scope_key, income, expense) "
+JOINED = (
+    "FROM transactions t "
+    "JOIN properties_concepts pc ON pc.id = t.properties_concepts_id "
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "balances",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("scope", sa.String(), nullable=False),
+        sa.Column("scope_key", sa.String(), nullable=False),
+        sa.Column("income", sa.Numeric(precision=19, scale=2), nullable=False),
+        sa.Column("expense", sa.Numeric(precision=19, scale=2), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("scope", "scope_key"),
+    )
+
+    op.execute(f"{INSERT}SELECT 'global', '', {SUMS} FROM transactions t")
+    op.execute(
+        f"{INSERT}SELECT 'property', CAST(pc.property_id AS VARCHAR), {SUMS} "
+        f"{JOINED}GROUP BY pc.property_id"
+    )
+    op.execute(
+        f"{INSERT}SELECT 'concept', CAST(pc.concept_id AS VARCHAR), {SUMS} "
+        f"{JOINED}GROUP BY pc.concept_id"
+    )
+    op.execute(
+        f"{INSERT}SELECT 'period', t.period, {SUMS} FROM transactions t "
+        "GROUP BY t.period"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("balances")
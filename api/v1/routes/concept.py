@@ -1,9 +1,12 @@
 from typing import Annotated
 from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from core.dependencies.conditional_get import etag_guard
 from core.dependencies.logger import get_request_logger
+from core.dependencies.service_runner import ServiceRunner, get_runner_db
 from core.logging.logger_with_correlation_id import CorrelationLoggerAdapter
-from database import get_db
+from models.concept import Concept
 from schemas.concept import CreateConcept, ConceptResponse, UpdateConcept
 from services.concept_service import ConceptService
 
@@ -11,51 +14,59 @@ router = APIRouter(prefix="/concept", tags=["Concept"])
 
 
 def get_concept_service(
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[Session | AsyncSession, Depends(get_runner_db)],
     logger: Annotated[CorrelationLoggerAdapter, Depends(get_request_logger)],
-) -> ConceptService:
-    return ConceptService(db, logger)
+) -> ServiceRunner[ConceptService]:
+    return ServiceRunner(lambda session: ConceptService(session, logger), db)
 
 
 @router.get(
-    "/{concept_id}", response_model=ConceptResponse, status_code=status.HTTP_200_OK
+    "/{concept_id}",
+    response_model=ConceptResponse,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(etag_guard(Concept.__tablename__))],
 )
-def get_concept(
+async def get_concept(
     concept_id: int,
-    service: Annotated[ConceptService, Depends(get_concept_service)],
+    service: Annotated[ServiceRunner[ConceptService], Depends(get_concept_service)],
 ) -> None | ConceptResponse:
-    return service.get_concept_by_id(concept_id)
+    return await service.run(ConceptService.get_concept_by_id, concept_id)
 
 
-@router.get("/", response_model=list[ConceptResponse], status_code=status.HTTP_200_OK)
-def list_concepts(
-    service: Annotated[ConceptService, Depends(get_concept_service)],
+@router.get(
+    "/",
+    response_model=list[ConceptResponse],
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(etag_guard(Concept.__tablename__))],
+)
+async def list_concepts(
+    service: Annotated[ServiceRunner[ConceptService], Depends(get_concept_service)],
 ) -> list[ConceptResponse]:
-    return service.get_all_concepts()
+    return await service.run(ConceptService.get_all_concepts)
 
 
 @router.post("/", response_model=ConceptResponse, status_code=status.HTTP_201_CREATED)
-def create_concept(
+async def create_concept(
     concept: CreateConcept,
-    service: Annotated[ConceptService, Depends(get_concept_service)],
+    service: Annotated[ServiceRunner[ConceptService], Depends(get_concept_service)],
 ) -> ConceptResponse:
-    return service.create_concept(concept)
+    return await service.run(ConceptService.create_concept, concept)
 
 
 @router.put(
     "/{concept_id}", response_model=ConceptResponse, status_code=status.HTTP_200_OK
 )
-def update_concept(
+async def update_concept(
     concept_id: int,
     concept: UpdateConcept,
-    service: Annotated[ConceptService, Depends(get_concept_service)],
+    service: Annotated[ServiceRunner[ConceptService], Depends(get_concept_service)],
 ) -> ConceptResponse:
-    return service.update_concept(concept_id, concept)
+    return await service.run(ConceptService.update_concept, concept_id, concept)
 
 
 @router.delete("/{concept_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_concept(
+async def delete_concept(
     concept_id: int,
-    service: Annotated[ConceptService, Depends(get_concept_service)],
+    service: Annotated[ServiceRunner[ConceptService], Depends(get_concept_service)],
 ) -> None:
-    service.delete_concept(concept_id)
+    await service.run(ConceptService.delete_concept, concept_id)
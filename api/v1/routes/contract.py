@@ -1,9 +1,12 @@
 from typing import Annotated
 from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from core.dependencies.conditional_get import etag_guard
 from core.dependencies.logger import get_request_logger
+from core.dependencies.service_runner import ServiceRunner, get_runner_db
 from core.logging.logger_with_correlation_id import CorrelationLoggerAdapter
-from database import get_db
+from models.contract import Contract
 from schemas.contract import CreateContract, ContractResponse, UpdateContract
 from services.contract_service import ContractService
 
@@ -11,58 +14,67 @@ router = APIRouter(prefix="/contract", tags=["Contract"])
 
 
 def get_contract_service(
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[Session | AsyncSession, Depends(get_runner_db)],
     logger: Annotated[CorrelationLoggerAdapter, Depends(get_request_logger)],
-) -> ContractService:
-    return ContractService(db, logger)
+) -> ServiceRunner[ContractService]:
+    return ServiceRunner(lambda session: ContractService(session, logger), db)
 
 
 @router.get("/ending-in/{months}", response_model=list[ContractResponse])
-def get_contracts_ending_in(
-    months: int, service: ContractService = Depends(get_contract_service)
+async def get_contracts_ending_in(
+    months: int,
+    service: Annotated[ServiceRunner[ContractService], Depends(get_contract_service)],
 ) -> list[ContractResponse]:
-    return service.get_contracts_ending_within(months)
+    return await service.run(ContractService.get_contracts_ending_within, months)
 
 
 @router.get(
-    "/{contract_id}", response_model=ContractResponse, status_code=status.HTTP_200_OK
+    "/{contract_id}",
+    response_model=ContractResponse,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(etag_guard(Contract.__tablename__))],
 )
-def get_contract(
+async def get_contract(
     contract_id: int,
-    service: Annotated[ContractService, Depends(get_contract_service)],
+    service: Annotated[ServiceRunner[ContractService], Depends(get_contract_service)],
 ) -> None | ContractResponse:
-    return service.get_contract_by_id(contract_id)
+    return await service.run(ContractService.get_contract_by_id, contract_id)
 
 
-@router.get("/", response_model=list[ContractResponse], status_code=status.HTTP_200_OK)
-def list_contracts(
-    service: Annotated[ContractService, Depends(get_contract_service)],
+@router.get(
+    "/",
+    response_model=list[ContractResponse],
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(etag_guard(Contract.__tablename__))],
+)
+async def list_contracts(
+    service: Annotated[ServiceRunner[ContractService], Depends(get_contract_service)],
 ) -> list[ContractResponse]:
-    return service.get_all_contracts()
+    return await service.run(ContractService.get_all_contracts)
 
 
 @router.post("/", response_model=ContractResponse, status_code=status.HTTP_201_CREATED)
-def create_contract(
+async def create_contract(
     contract: CreateContract,
-    service: Annotated[ContractService, Depends(get_contract_service)],
+    service: Annotated[ServiceRunner[ContractService], Depends(get_contract_service)],
 ) -> ContractResponse:
-    return service.create_contract(contract)
+    return await service.run(ContractService.create_contract, contract)
 
 
 @router.put(
     "/{contract_id}", response_model=ContractResponse, status_code=status.HTTP_200_OK
 )
-def update_contract(
+async def update_contract(
     contract_id: int,
     contract: UpdateContract,
-    service: Annotated[ContractService, Depends(get_contract_service)],
+    service: Annotated[ServiceRunner[ContractService], Depends(get_contract_service)],
 ) -> ContractResponse:
-    return service.update_contract(contract_id, contract)
+    return await service.run(ContractService.update_contract, contract_id, contract)
 
 
 @router.delete("/{contract_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_contract(
+async def delete_contract(
     contract_id: int,
-    service: Annotated[ContractService, Depends(get_contract_service)],
+    service: Annotated[ServiceRunner[ContractService], Depends(get_contract_service)],
 ) -> None:
-    service.delete_contract(contract_id)
+    await service.run(ContractService.delete_contract, contract_id)
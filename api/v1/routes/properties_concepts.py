@@ -1,9 +1,14 @@
 from typing import Annotated
 from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from core.dependencies.conditional_get import etag_guard
 from core.dependencies.logger import get_request_logger
+from core.dependencies.service_runner import ServiceRunner, get_runner_db
 from core.logging.logger_with_correlation_id import CorrelationLoggerAdapter
-from database import get_db
+from models.concept import Concept
+from models.properties_concepts import PropertiesConcepts
+from models.property import Property
 from schemas.properties_concepts import (
     CreatePropertiesConcepts,
     PropertiesConceptsResponse,
@@ -13,62 +18,97 @@ from services.properties_concepts_service import PropertiesConceptsService
 
 router = APIRouter(prefix="/properties-concepts", tags=["Properties Concepts"])
 
+# Responses embed the related property and concept.
+COMBO_TABLES = (
+    PropertiesConcepts.__tablename__,
+    Property.__tablename__,
+    Concept.__tablename__,
+)
+
 
 def get_properties_concepts_service(
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[Session | AsyncSession, Depends(get_runner_db)],
     logger: Annotated[CorrelationLoggerAdapter, Depends(get_request_logger)],
-) -> PropertiesConceptsService:
-    return PropertiesConceptsService(db, logger)
+) -> ServiceRunner[PropertiesConceptsService]:
+    return ServiceRunner(lambda session: PropertiesConceptsService(session, logger), db)
 
 
 @router.get(
     "/get-combos",
     response_model=list[PropertiesConceptsResponse],
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(etag_guard(*COMBO_TABLES))],
 )
-def list_properties_concepts_combos(
+async def list_properties_concepts_combos(
     service: Annotated[
-        PropertiesConceptsService, Depends(get_properties_concepts_service)
+        ServiceRunner[PropertiesConceptsService],
+        Depends(get_properties_concepts_service),
     ],
 ) -> list[PropertiesConceptsResponse]:
-    return service.get_combos()
+    return await service.run(PropertiesConceptsService.get_combos)
+
+
+@router.get(
+    "/lookup",
+    response_model=list[tuple[int, str]],
+    status_code=status.HTTP_200_OK,
+    summary="Compact [id, 'location - concept'] pairs for select boxes",
+    dependencies=[Depends(etag_guard(*COMBO_TABLES))],
+)
+async def list_properties_concepts_lookup(
+    service: Annotated[
+        ServiceRunner[PropertiesConceptsService],
+        Depends(get_properties_concepts_service),
+    ],
+    enabled_only: bool = False,
+) -> list[tuple[int, str]]:
+    return await service.run(PropertiesConceptsService.get_lookup, enabled_only)
 
 
 @router.get(
     "/{properties_concepts_id}",
     response_model=PropertiesConceptsResponse,
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(etag_guard(*COMBO_TABLES))],
 )
-def get_properties_concepts(
+async def get_properties_concepts(
     properties_concepts_id: int,
     service: Annotated[
-        PropertiesConceptsService, Depends(get_properties_concepts_service)
+        ServiceRunner[PropertiesConceptsService],
+        Depends(get_properties_concepts_service),
     ],
 ) -> None | PropertiesConceptsResponse:
-    return service.get_by_id(properties_concepts_id)
+    return await service.run(
+        PropertiesConceptsService.get_by_id, properties_concepts_id
+    )
 
 
 @router.get(
-    "/", response_model=list[PropertiesConceptsResponse], status_code=status.HTTP_200_OK
+    "/",
+    response_model=list[PropertiesConceptsResponse],
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(etag_guard(*COMBO_TABLES))],
 )
-def list_properties_concepts(
+async def list_properties_concepts(
     service: Annotated[
-        PropertiesConceptsService, Depends(get_properties_concepts_service)
+        ServiceRunner[PropertiesConceptsService],
+        Depends(get_properties_concepts_service),
     ],
 ) -> list[PropertiesConceptsResponse]:
-    return service.get_all()
+    return await service.run(PropertiesConceptsService.get_all)
 
 
 @router.post(
     "/", response_model=PropertiesConceptsResponse, status_code=status.HTTP_201_CREATED
 )
-def create_properties_concepts(
+async def create_properties_concepts(
     properties_concepts: CreatePropertiesConcepts,
     service: Annotated[
-        PropertiesConceptsService, Depends(get_properties_concepts_service)
+        ServiceRunner[PropertiesConceptsService],
+        Depends(get_properties_concepts_service),
     ],
 ) -> PropertiesConceptsResponse:
-    return service.create(properties_concepts)
+    return await service.run(PropertiesConceptsService.create, properties_concepts)
 
 
 @router.put(
@@ -76,21 +116,25 @@ def create_properties_concepts(
     response_model=PropertiesConceptsResponse,
     status_code=status.HTTP_200_OK,
 )
-def update_properties_concepts(
+async def update_properties_concepts(
     properties_concepts_id: int,
     properties_concepts: UpdatePropertiesConcepts,
     service: Annotated[
-        PropertiesConceptsService, Depends(get_properties_concepts_service)
+        ServiceRunner[PropertiesConceptsService],
+        Depends(get_properties_concepts_service),
     ],
 ) -> PropertiesConceptsResponse:
-    return service.update(properties_concepts_id, properties_concepts)
+    return await service.run(
+        PropertiesConceptsService.update, properties_concepts_id, properties_concepts
+    )
 
 
 @router.delete("/{properties_concepts_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_properties_concepts(
+async def delete_properties_concepts(
     properties_concepts_id: int,
     service: Annotated[
-        PropertiesConceptsService, Depends(get_properties_concepts_service)
+        ServiceRunner[PropertiesConceptsService],
+        Depends(get_properties_concepts_service),
     ],
 ) -> None:
-    service.delete(properties_concepts_id)
+    await service.run(PropertiesConceptsService.delete, properties_concepts_id)
@@ -0,0 +1,51 @@
+from typing import Annotated
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from core.dependencies.logger import get_request_logger
+from core.dependencies.service_runner import ServiceRunner, get_runner_db
+from core.dependencies.transaction_filters import get_transaction_filters
+from core.logging.logger_with_correlation_id import CorrelationLoggerAdapter
+from schemas.report import ArrearsResponse, CashflowGroup, CashflowResponse
+from schemas.transaction import TransactionFilters
+from services.report_service import ReportService
+
+router = APIRouter(prefix="/reports", tags=["Reports"])
+
+
+def get_report_service(
+    db: Annotated[Session | AsyncSession, Depends(get_runner_db)],
+    logger: Annotated[CorrelationLoggerAdapter, Depends(get_request_logger)],
+) -> ServiceRunner[ReportService]:
+    return ServiceRunner(lambda session: ReportService(session, logger), db)
+
+
+@router.get(
+    "/arrears",
+    summary="Due periods of enabled combos without a recorded transaction",
+    response_model=list[ArrearsResponse],
+    status_code=status.HTTP_200_OK,
+)
+async def get_arrears(
+    start_period: Annotated[str, Query(alias="from")],
+    end_period: Annotated[str, Query(alias="to")],
+    service: Annotated[ServiceRunner[ReportService], Depends(get_report_service)],
+) -> list[ArrearsResponse]:
+    return await service.run(ReportService.get_arrears, start_period, end_period)
+
+
+@router.get(
+    "/cashflow",
+    summary="Income, expense and net grouped by property, concept, period or date",
+    response_model=CashflowResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_cashflow(
+    filters: Annotated[TransactionFilters, Depends(get_transaction_filters)],
+    service: Annotated[ServiceRunner[ReportService], Depends(get_report_service)],
+    group_by: Annotated[None | list[CashflowGroup], Query()] = None,
+    rollup: bool = False,
+) -> CashflowResponse:
+    return await service.run(
+        ReportService.get_cashflow, group_by or [], filters, rollup
+    )
@@ -1,69 +1,255 @@
-from typing import Annotated
-from fastapi import APIRouter, Depends, status
+import csv
+import io
+import json
+from typing import Annotated, Any, Literal
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from core.dependencies.conditional_get import etag_guard
 from core.dependencies.logger import get_request_logger
+from core.dependencies.service_runner import ServiceRunner, get_runner_db
+from core.dependencies.transaction_filters import get_transaction_filters
 from core.logging.logger_with_correlation_id import CorrelationLoggerAdapter
+from core.responses import ORJSONResponse
+from api.v1.routes.properties_concepts import COMBO_TABLES
+from models.transaction import Transaction
 from database import get_db
 from schemas.transaction import (
+    BulkTransactionResponse,
+    RecurringTransactionsResponse,
     CreateTransaction,
+    TransactionFilters,
+    TransactionPageResponse,
     TransactionResponse,
+    TransactionViewPageResponse,
+    TransactionViewSort,
     TransactionsBalanceResponse,
     UpdateTransaction,
 )
+from services.recurrence_service import RecurrenceService
 from services.transaction_service import TransactionService
 
 router = APIRouter(prefix="/transaction", tags=["Transaction"])
 
 
 def get_transaction_service(
+    db: Annotated[Session | AsyncSession, Depends(get_runner_db)],
+    logger: Annotated[CorrelationLoggerAdapter, Depends(get_request_logger)],
+) -> ServiceRunner[TransactionService]:
+    return ServiceRunner(lambda session: TransactionService(session, logger), db)
+
+
+# Streaming responses iterate a blocking generator in the threadpool, so the
+# export keeps a regular Session that stays open until the body is sent.
+def get_transaction_stream_service(
     db: Annotated[Session, Depends(get_db)],
     logger: Annotated[CorrelationLoggerAdapter, Depends(get_request_logger)],
 ) -> TransactionService:
     return TransactionService(db, logger)
 
 
+def get_recurrence_service(
+    db: Annotated[Session | AsyncSession, Depends(get_runner_db)],
+    logger: Annotated[CorrelationLoggerAdapter, Depends(get_request_logger)],
+) -> ServiceRunner[RecurrenceService]:
+    return ServiceRunner(lambda session: RecurrenceService(session, logger), db)
+
+
 @router.get(
     "/balance",
     summary="Get transactions balance",
     response_model=TransactionsBalanceResponse,
     status_code=status.HTTP_200_OK,
 )
-def get_transactions_balance(
-    service: Annotated[TransactionService, Depends(get_transaction_service)],
+async def get_transactions_balance(
+    service: Annotated[
+        ServiceRunner[TransactionService], Depends(get_transaction_service)
+    ],
+    property_id: Annotated[None | int, Query(ge=1)] = None,
+    concept_id: Annotated[None | int, Query(ge=1)] = None,
+    period: Annotated[None | str, Query(pattern=r"^\d{4}-(0[1-9]|1[0-2])$")] = None,
 ):
-    balance = service.get_balance()
+    balance = await service.run(
+        TransactionService.get_balance, property_id, concept_id, period
+    )
     return {"balance": balance}
 
 
+async def get_bulk_rows(request: Request) -> list[Any]:
+    body = await request.body()
+
+    if request.headers.get("content-type", "").startswith("text/csv"):
+        try:
+            return list(csv.DictReader(io.StringIO(body.decode("utf-8-sig"))))
+        except (UnicodeDecodeError, csv.Error):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid CSV body"
+            )
+
+    try:
+        rows = json.loads(body)
+    except ValueError:
+        rows = None
+    if not isinstance(rows, list):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Body must be a JSON array or a text/csv document",
+        )
+    return rows
+
+
+@router.get(
+    "/export",
+    summary="Stream transactions as NDJSON or CSV",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+)
+def export_transactions(
+    filters: Annotated[TransactionFilters, Depends(get_transaction_filters)],
+    service: Annotated[TransactionService, Depends(get_transaction_stream_service)],
+    export_format: Annotated[
+        Literal["ndjson", "csv"], Query(alias="format")
+    ] = "ndjson",
+) -> StreamingResponse:
+    media_type = "text/csv" if export_format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        service.export_transactions(filters, export_format),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f"attachment; filename=transactions.{export_format}"
+        },
+    )
+
+
+@router.get(
+    "/view",
+    summary="Paginated transactions joined with their property and concept",
+    response_model=TransactionViewPageResponse,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(etag_guard(Transaction.__tablename__, *COMBO_TABLES))],
+)
+async def list_transactions_view(
+    filters: Annotated[TransactionFilters, Depends(get_transaction_filters)],
+    service: Annotated[
+        ServiceRunner[TransactionService], Depends(get_transaction_service)
+    ],
+    response: Response,
+    sort: TransactionViewSort = "date",
+    order: Literal["asc", "desc"] = "desc",
+    page: Annotated[int, Query(ge=1)] = 1,
+    page_size: Annotated[int, Query(ge=1, le=500)] = 50,
+) -> ORJSONResponse:
+    view = await service.run(
+        TransactionService.get_transactions_view,
+        filters,
+        sort,
+        order,
+        page,
+        page_size,
+    )
+    return ORJSONResponse(view, headers=response.headers)
+
+
 @router.get(
     "/{transaction_id}",
     response_model=TransactionResponse,
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(etag_guard(Transaction.__tablename__))],
 )
-def get_transaction(
+async def get_transaction(
     transaction_id: int,
-    service: Annotated[TransactionService, Depends(get_transaction_service)],
+    service: Annotated[
+        ServiceRunner[TransactionService], Depends(get_transaction_service)
+    ],
 ) -> None | TransactionResponse:
-    return service.get_transaction_by_id(transaction_id)
+    return await service.run(TransactionService.get_transaction_by_id, transaction_id)
 
 
 @router.get(
-    "/", response_model=list[TransactionResponse], status_code=status.HTTP_200_OK
+    "/",
+    response_model=TransactionPageResponse,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(etag_guard(Transaction.__tablename__))],
 )
-def list_transactions(
-    service: Annotated[TransactionService, Depends(get_transaction_service)],
-) -> list[TransactionResponse]:
-    return service.get_all_transactions()
+async def list_transactions(
+    filters: Annotated[TransactionFilters, Depends(get_transaction_filters)],
+    service: Annotated[
+        ServiceRunner[TransactionService], Depends(get_transaction_service)
+    ],
+    response: Response,
+    limit: Annotated[int, Query(ge=1, le=500)] = 100,
+    cursor: None | str = None,
+) -> ORJSONResponse:
+    page = await service.run(
+        TransactionService.get_transactions_page, filters, limit, cursor
+    )
+    return ORJSONResponse(page, headers=response.headers)
 
 
 @router.post(
     "/", response_model=TransactionResponse, status_code=status.HTTP_201_CREATED
 )
-def create_transaction(
+async def create_transaction(
     transaction: CreateTransaction,
-    service: Annotated[TransactionService, Depends(get_transaction_service)],
+    service: Annotated[
+        ServiceRunner[TransactionService], Depends(get_transaction_service)
+    ],
 ) -> TransactionResponse:
-    return service.create_transaction(transaction)
+    return await service.run(TransactionService.create_transaction, transaction)
+
+
+@router.post(
+    "/bulk",
+    summary="Create many transactions from a JSON array or CSV",
+    response_model=BulkTransactionResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={422: {"model": BulkTransactionResponse}},
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/CreateTransaction"},
+                    }
+                },
+                "text/csv": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def create_transactions_bulk(
+    rows: Annotated[list[Any], Depends(get_bulk_rows)],
+    response: Response,
+    service: Annotated[
+        ServiceRunner[TransactionService], Depends(get_transaction_service)
+    ],
+) -> BulkTransactionResponse:
+    result = await service.run(TransactionService.create_transactions_bulk, rows)
+    if result.errors:
+        response.status_code = status.HTTP_422_UNPROCESSABLE_CONTENT
+    return result
+
+
+@router.post(
+    "/recurring",
+    summary="Generate missing transactions of recurring concepts",
+    response_model=RecurringTransactionsResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def generate_recurring_transactions(
+    start_period: Annotated[str, Query(alias="from")],
+    end_period: Annotated[str, Query(alias="to")],
+    service: Annotated[
+        ServiceRunner[RecurrenceService], Depends(get_recurrence_service)
+    ],
+) -> RecurringTransactionsResponse:
+    created = await service.run(
+        RecurrenceService.generate_missing_transactions, start_period, end_period
+    )
+    return RecurringTransactionsResponse(created=created)
 
 
 @router.put(
@@ -71,17 +257,23 @@ def create_transaction(
     response_model=TransactionResponse,
     status_code=status.HTTP_200_OK,
 )
-def update_transaction(
+async def update_transaction(
     transaction_id: int,
     transaction: UpdateTransaction,
-    service: Annotated[TransactionService, Depends(get_transaction_service)],
+    service: Annotated[
+        ServiceRunner[TransactionService], Depends(get_transaction_service)
+    ],
 ) -> TransactionResponse:
-    return service.update_transaction(transaction_id, transaction)
+    return await service.run(
+        TransactionService.update_transaction, transaction_id, transaction
+    )
 
 
 @router.delete("/{transaction_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_transaction(
+async def delete_transaction(
     transaction_id: int,
-    service: Annotated[TransactionService, Depends(get_transaction_service)],
+    service: Annotated[
+        ServiceRunner[TransactionService], Depends(get_transaction_service)
+    ],
 ) -> None:
-    service.delete_transaction(transaction_id)
+    await service.run(TransactionService.delete_transaction, transaction_id)
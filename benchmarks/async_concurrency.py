@@ -0,0 +1,121 @@
+"""Compare throughput and tail latency of the blocking (threadpool) and the
+AsyncSession database modes under concurrent load.
+
+A paginated listing endpoint is hammered by many concurrent clients while a probe
+keeps hitting /health, so the table shows both the endpoint throughput and
+how much the rest of the app is starved while the database is busy.
+
+Run from the repository root:
+
+    python -m benchmarks.async_concurrency --concurrency 64 --requests 512
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
+
+import database
+from benchmarks.query_plans import seed
+from main import API_V1_PREFIX, health, routers_v1
+
+ENDPOINT = f"{API_V1_PREFIX}/transaction/?limit=100&transaction_type=income"
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    for r in routers_v1:
+        app.include_router(r, prefix=API_V1_PREFIX)
+    app.get("/health")(health)
+    return app
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def run_load(
+    app: FastAPI, concurrency: int, requests: int
+) -> tuple[float, list[float], list[float]]:
+    transport = httpx.ASGITransport(app=app)
+    latencies: list[float] = []
+    probes: list[float] = []
+    pending = iter(range(requests))
+    done = asyncio.Event()
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as c:
+
+        async def worker() -> None:
+            for _ in pending:
+                started = time.perf_counter()
+                response = await c.get(ENDPOINT)
+                response.raise_for_status()
+                latencies.append((time.perf_counter() - started) * 1000)
+
+        async def probe() -> None:
+            while not done.is_set():
+                started = time.perf_counter()
+                (await c.get("/health")).raise_for_status()
+                probes.append((time.perf_counter() - started) * 1000)
+                await asyncio.sleep(0.01)
+
+        probe_task = asyncio.create_task(probe())
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await probe_task
+
+    return requests / elapsed, latencies, probes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--properties", type=int, default=500)
+    parser.add_argument("--transactions", type=int, default=50000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=512)
+    args = parser.parse_args()
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{Path(tmp) / 'bench.db'}"
+        engine = create_engine(url, connect_args={"check_same_thread": False})
+        database.Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            seed(conn, args.properties, args.transactions)
+        async_engine = create_async_engine(database.to_async_url(url))
+
+        database.SessionLocal.configure(bind=engine)
+        database.AsyncSessionLocal.configure(bind=async_engine)
+        app = build_app()
+
+        results = {}
+        for mode, enabled in (("threadpool", False), ("async", True)):
+            database.DATABASE_ASYNC = enabled
+            results[mode] = asyncio.run(run_load(app, args.concurrency, args.requests))
+
+        asyncio.run(async_engine.dispose())
+        engine.dispose()
+
+    print(f"{args.requests} x GET {ENDPOINT} at concurrency {args.concurrency}")
+    for mode, (throughput, latencies, probes) in results.items():
+        print(
+            f"{mode:>10}: {throughput:8.1f} req/s"
+            f" | p50 {statistics.median(latencies):8.1f} ms"
+            f" | p95 {percentile(latencies, 95):8.1f} ms"
+            f" | /health p95 {percentile(probes, 95):6.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Compare building and serializing a large list of transaction DTOs through
+the validated path (ORM entities + model_validate) and the trusted path
+(column rows + model_construct), and the JSON encoders a route can use.
+
+Run from the repository root:
+
+    python -m benchmarks.dto_serialization --transactions 100000
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from starlette.responses import JSONResponse
+
+from benchmarks.query_plans import seed
+from core.responses import ORJSONResponse
+from database import Base
+from models.transaction import Transaction
+from repositories.transaction_repository import TransactionRepository
+from schemas.transaction import TransactionResponse
+
+
+def timed(fn: Callable[[], Any], repeat: int) -> tuple[Any, float]:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return result, best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--transactions", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            seed(conn, 100, args.transactions)
+
+        with Session(engine) as db:
+            repository = TransactionRepository(db)
+
+            def validated() -> list[TransactionResponse]:
+                db.expunge_all()
+                return repository.to_dto_list(db.query(Transaction).all())
+
+            dtos, validated_ms = timed(validated, args.repeat)
+            _, trusted_ms = timed(repository.get_all, args.repeat)
+
+        engine.dispose()
+
+    adapter = TypeAdapter(list[TransactionResponse])
+    encoders = {
+        "JSONResponse(jsonable_encoder)": lambda: (
+            JSONResponse(jsonable_encoder(dtos)).body
+        ),
+        "TypeAdapter.dump_json": lambda: adapter.dump_json(dtos),
+        "ORJSONResponse": lambda: ORJSONResponse(dtos).body,
+    }
+
+    print(f"{len(dtos)} transactions (best of {args.repeat})")
+    print(f"  load + DTOs, ORM + model_validate       : {validated_ms:9.1f} ms")
+    print(f"  load + DTOs, rows + model_construct     : {trusted_ms:9.1f} ms")
+    for name, encode in encoders.items():
+        _, encode_ms = timed(encode, args.repeat)
+        print(f"  serialize, {name:<30}: {encode_ms:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,686 @@
+"""Load-test every API route and store the latencies for regression comparison.
+
+A synthetic portfolio is seeded (by default 10k properties, each with a
+contract and four combos, and 1M transactions) and the app is driven in two
+ways:
+
+- isolated: each route gets --requests requests at --concurrency, one route at
+  a time, so every row of the table measures that route alone;
+- mix: --users locust-style clients keep picking weighted routes (reads plus
+  transaction writes) with --think-time-ms between requests for --duration
+  seconds, so the table shows each route under mixed traffic.
+
+Both report throughput and p50/p95/p99 per route. Requests go through the ASGI
+transport in-process, or to a running server with --base-url; note that the
+write routes then modify the server's database.
+
+Run from the repository root:
+
+    python -m benchmarks.load_test --db bench.db --output results.json
+    python -m benchmarks.load_test --db bench.db --compare results.json
+
+--db keeps the seeded database between runs, as seeding 1M transactions
+takes a while. --compare exits with status 1 when a route's p95 or throughput
+regresses by more than --tolerance against the given results file.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import Session
+
+import database
+from benchmarks.async_concurrency import percentile
+from benchmarks.query_plans import seed
+from core.middlewares.correlation import CorrelationIdMiddleware
+from core.middlewares.metrics import MetricsMiddleware
+from main import API_V1_PREFIX, routers_v1
+from repositories.balance_repository import BalanceRepository
+
+
+class Pool:
+    # Ids the requests are built from: existing rows are sampled, rows created
+    # by the POST scenarios are handed to the PUT and DELETE ones.
+    def __init__(self, ids: dict[str, list[int]], seed_value: int = 0) -> None:
+        self.rng = random.Random(seed_value)
+        self.ids = ids
+        self.created: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        self.claimed: dict[str, int] = defaultdict(int)
+
+    def pick(self, kind: str) -> int:
+        return self.rng.choice(self.ids[kind])
+
+    def period(self) -> str:
+        return f"{self.rng.randint(2016, 2026)}-{self.rng.randint(1, 12):02d}"
+
+    def day(self) -> date:
+        return date.today() - timedelta(days=self.rng.randint(0, 3650))
+
+    def claim(self, kind: str) -> dict[str, Any]:
+        # Hands out each created row once, e.g. one contract per new property.
+        index = self.claimed[kind]
+        self.claimed[kind] += 1
+        return self.created[kind][index]
+
+    def edit(self, kind: str) -> dict[str, Any]:
+        return self.rng.choice(self.created[kind])
+
+    def release(self, kind: str) -> dict[str, Any]:
+        return self.created[kind].pop()
+
+    def transaction(self) -> dict[str, Any]:
+        return {
+            "date": self.day().isoformat(),
+            "properties_concepts_id": self.pick("properties_concepts"),
+            "transaction_type": self.rng.choice(("income", "expense")),
+            "period": self.period(),
+            "amount": f"{self.rng.randint(1, 100000)}.00",
+        }
+
+
+@dataclass
+class Scenario:
+    route: str
+    build: Callable[[Pool], tuple[str, Any]]
+    # Share of the mixed traffic; 0 keeps the route out of the mix.
+    weight: int = 0
+    # Created rows are stored under this key for later scenarios.
+    creates: None | str = None
+
+    @property
+    def method(self) -> str:
+        return self.route.split(" ", 1)[0]
+
+
+def property_body(pool: Pool) -> dict[str, Any]:
+    return {
+        "location": f"Load test {pool.rng.randint(1, 10**9)}",
+        "area": pool.rng.randint(30, 500),
+        "valuation": pool.rng.randint(50000, 500000),
+    }
+
+
+def concept_body(pool: Pool) -> dict[str, Any]:
+    return {
+        "name": f"Load test {pool.rng.randint(1, 10**9)}",
+        "is_ordinary": True,
+        "periodicity": pool.rng.randint(1, 12),
+    }
+
+
+def contract_body(property_id: int, pool: Pool) -> dict[str, Any]:
+    start = pool.day()
+    return {
+        "property_id": property_id,
+        "start_date": start.isoformat(),
+        "end_date": (start + timedelta(days=pool.rng.randint(30, 1000))).isoformat(),
+    }
+
+
+def combo_body(property_id: int, enabled: bool) -> dict[str, Any]:
+    return {"property_id": property_id, "concept_id": 1, "enabled": enabled}
+
+
+def month_range(pool: Pool) -> str:
+    first = pool.day().replace(day=1)
+    last = (first + timedelta(days=31)).replace(day=1) - timedelta(days=1)
+    return f"date_from={first}&date_to={last}"
+
+
+# Run in this order in isolated mode: rows created by the POST scenarios are
+# updated and then deleted, children before parents.
+SCENARIOS = [
+    Scenario("GET /property/", lambda p: ("/property/", None), weight=2),
+    Scenario(
+        "GET /property/{property_id}",
+        lambda p: (f"/property/{p.pick('property')}", None),
+        weight=5,
+    ),
+    Scenario("GET /concept/", lambda p: ("/concept/", None), weight=2),
+    Scenario(
+        "GET /concept/{concept_id}",
+        lambda p: (f"/concept/{p.pick('concept')}", None),
+        weight=2,
+    ),
+    Scenario("GET /contract/", lambda p: ("/contract/", None), weight=2),
+    Scenario(
+        "GET /contract/{contract_id}",
+        lambda p: (f"/contract/{p.pick('contract')}", None),
+        weight=3,
+    ),
+    Scenario(
+        "GET /contract/ending-in/{months}",
+        lambda p: (f"/contract/ending-in/{p.rng.randint(1, 12)}", None),
+        weight=3,
+    ),
+    Scenario(
+        "GET /properties-concepts/", lambda p: ("/properties-concepts/", None), weight=1
+    ),
+    Scenario(
+        "GET /properties-concepts/get-combos",
+        lambda p: ("/properties-concepts/get-combos", None),
+        weight=1,
+    ),
+    Scenario(
+        "GET /properties-concepts/lookup",
+        lambda p: ("/properties-concepts/lookup", None),
+        weight=5,
+    ),
+    Scenario(
+        "GET /properties-concepts/{properties_concepts_id}",
+        lambda p: (f"/properties-concepts/{p.pick('properties_concepts')}", None),
+        weight=3,
+    ),
+    Scenario(
+        "GET /reports/arrears",
+        lambda p: (f"/reports/arrears?from={(period := p.period())}&to={period}", None),
+        weight=1,
+    ),
+    Scenario(
+        "GET /reports/cashflow",
+        lambda p: (
+            "/reports/cashflow?"
+            + p.rng.choice(("group_by=property", "group_by=concept&group_by=month"))
+            + f"&{month_range(p)}",
+            None,
+        ),
+        weight=2,
+    ),
+    Scenario(
+        "GET /transaction/balance",
+        lambda p: (f"/transaction/balance?property_id={p.pick('property')}", None),
+        weight=5,
+    ),
+    Scenario(
+        "GET /transaction/export",
+        lambda p: (f"/transaction/export?format=ndjson&{month_range(p)}", None),
+        weight=1,
+    ),
+    Scenario(
+        "GET /transaction/view",
+        lambda p: (
+            (
+                f"/transaction/view?page={p.rng.randint(1, 20)}"
+                f"&sort={p.rng.choice(('date', 'amount', 'property'))}"
+            ),
+            None,
+        ),
+        weight=10,
+    ),
+    Scenario(
+        "GET /transaction/{transaction_id}",
+        lambda p: (f"/transaction/{p.pick('transaction')}", None),
+        weight=5,
+    ),
+    Scenario(
+        "GET /transaction/",
+        lambda p: (
+            (
+                "/transaction/?limit=100"
+                f"&properties_concepts_id={p.pick('properties_concepts')}"
+            ),
+            None,
+        ),
+        weight=10,
+    ),
+    Scenario(
+        "POST /property/",
+        lambda p: ("/property/", property_body(p)),
+        creates="property",
+    ),
+    Scenario(
+        "POST /concept/", lambda p: ("/concept/", concept_body(p)), creates="concept"
+    ),
+    Scenario(
+        "POST /contract/",
+        lambda p: ("/contract/", contract_body(p.claim("property")["id"], p)),
+        creates="contract",
+    ),
+    Scenario(
+        "POST /properties-concepts/",
+        lambda p: (
+            "/properties-concepts/",
+            combo_body(p.claim("property_combo")["id"], True),
+        ),
+        creates="properties_concepts",
+    ),
+    Scenario(
+        "POST /transaction/",
+        lambda p: ("/transaction/", p.transaction()),
+        weight=3,
+        creates="transaction",
+    ),
+    Scenario(
+        "POST /transaction/bulk",
+        lambda p: ("/transaction/bulk", [p.transaction() for _ in range(20)]),
+    ),
+    Scenario(
+        "POST /transaction/recurring",
+        lambda p: (
+            f"/transaction/recurring?from={(period := p.period())}&to={period}",
+            None,
+        ),
+    ),
+    Scenario(
+        "PUT /property/{property_id}",
+        lambda p: (f"/property/{p.edit('property')['id']}", property_body(p)),
+    ),
+    Scenario(
+        "PUT /concept/{concept_id}",
+        lambda p: (f"/concept/{p.edit('concept')['id']}", concept_body(p)),
+    ),
+    Scenario(
+        "PUT /contract/{contract_id}",
+        lambda p: (
+            f"/contract/{(row := p.edit('contract'))['id']}",
+            contract_body(row["property_id"], p),
+        ),
+    ),
+    Scenario(
+        "PUT /properties-concepts/{properties_concepts_id}",
+        lambda p: (
+            f"/properties-concepts/{(row := p.edit('properties_concepts'))['id']}",
+            combo_body(row["property_id"], p.rng.random() < 0.5),
+        ),
+    ),
+    Scenario(
+        "PUT /transaction/{transaction_id}",
+        lambda p: (f"/transaction/{p.pick('transaction')}", p.transaction()),
+        weight=2,
+    ),
+    Scenario(
+        "DELETE /transaction/{transaction_id}",
+        lambda p: (f"/transaction/{p.release('transaction')['id']}", None),
+    ),
+    Scenario(
+        "DELETE /properties-concepts/{properties_concepts_id}",
+        lambda p: (
+            f"/properties-concepts/{p.release('properties_concepts')['id']}",
+            None,
+        ),
+    ),
+    Scenario(
+        "DELETE /contract/{contract_id}",
+        lambda p: (f"/contract/{p.release('contract')['id']}", None),
+    ),
+    Scenario(
+        "DELETE /concept/{concept_id}",
+        lambda p: (f"/concept/{p.release('concept')['id']}", None),
+    ),
+    Scenario(
+        "DELETE /property/{property_id}",
+        lambda p: (f"/property/{p.release('property')['id']}", None),
+    ),
+]
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+    app.add_middleware(CorrelationIdMiddleware)
+    for r in routers_v1:
+        app.include_router(r, prefix=API_V1_PREFIX)
+    return app
+
+
+def prepare_database(path: Path, properties: int, transactions: int) -> str:
+    url = f"sqlite:///{path}"
+    if path.exists():
+        print(f"Reusing {path}")
+        return url
+
+    print(f"Seeding {properties} properties and {transactions} transactions...")
+    started = time.perf_counter()
+    engine = create_engine(url)
+    database.Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        seed(conn, properties, transactions)
+    with Session(engine) as db:
+        BalanceRepository(db).rebuild()
+        db.commit()
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+    engine.dispose()
+    print(f"Seeded in {time.perf_counter() - started:.1f} s")
+    return url
+
+
+def bind_database(url: str, use_async: bool) -> Callable[[], None]:
+    engine = create_engine(url, connect_args={"check_same_thread": False})
+    database.apply_sqlite_pragmas(engine, database.sqlite_pragmas(database.settings))
+    database.SessionLocal.configure(bind=engine)
+    async_engine = create_async_engine(database.to_async_url(url))
+    database.apply_sqlite_pragmas(
+        async_engine.sync_engine, database.sqlite_pragmas(database.settings)
+    )
+    database.AsyncSessionLocal.configure(bind=async_engine)
+    database.DATABASE_ASYNC = use_async
+
+    def dispose() -> None:
+        asyncio.run(async_engine.dispose())
+        engine.dispose()
+
+    return dispose
+
+
+async def discover_ids(client: httpx.AsyncClient, rng: random.Random) -> Pool:
+    async def ids_of(path: str) -> list[int]:
+        response = await client.get(f"{API_V1_PREFIX}{path}")
+        response.raise_for_status()
+        body = response.json()
+        rows = body["items"] if isinstance(body, dict) else body
+        return [row["id"] for row in rows]
+
+    ids = {
+        "property": await ids_of("/property/"),
+        "concept": await ids_of("/concept/"),
+        "contract": await ids_of("/contract/"),
+        "properties_concepts": await ids_of("/properties-concepts/"),
+    }
+    response = await client.get(f"{API_V1_PREFIX}/transaction/view?page_size=1")
+    response.raise_for_status()
+    pages = max(1, response.json()["total"] // 500)
+    ids["transaction"] = [
+        row_id
+        for page in rng.sample(range(1, pages + 1), min(pages, 4))
+        for row_id in await ids_of(f"/transaction/view?page_size=500&page={page}")
+    ]
+    for kind, values in ids.items():
+        if not values:
+            raise SystemExit(f"No {kind} rows to sample, seed the database first")
+    return Pool(ids, rng.randint(0, 2**32))
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+
+    async def send(
+        self, client: httpx.AsyncClient, scenario: Scenario, pool: Pool
+    ) -> None:
+        try:
+            path, body = scenario.build(pool)
+        except IndexError:
+            # Nothing left to update or delete; the POST scenario did not run.
+            self.errors[scenario.route] += 1
+            return
+
+        started = time.perf_counter()
+        try:
+            response = await client.request(
+                scenario.method, f"{API_V1_PREFIX}{path}", json=body
+            )
+            await response.aread()
+        except httpx.HTTPError:
+            self.errors[scenario.route] += 1
+            return
+        self.latencies[scenario.route].append((time.perf_counter() - started) * 1000)
+
+        if response.status_code >= 400:
+            self.errors[scenario.route] += 1
+        elif scenario.creates:
+            row = response.json()
+            pool.created[scenario.creates].append(row)
+            if scenario.creates == "property":
+                # New properties take one contract and one combo each.
+                pool.created["property_combo"].append(row)
+
+    def summary(self, route: str, elapsed_s: float) -> dict[str, Any]:
+        samples = self.latencies[route] or [0.0]
+        return {
+            "requests": len(self.latencies[route]),
+            "errors": self.errors[route],
+            "throughput_rps": round(len(self.latencies[route]) / elapsed_s, 2),
+            "mean_ms": round(statistics.fmean(samples), 2),
+            "p50_ms": round(percentile(samples, 50), 2),
+            "p95_ms": round(percentile(samples, 95), 2),
+            "p99_ms": round(percentile(samples, 99), 2),
+            "max_ms": round(max(samples), 2),
+        }
+
+
+async def run_route(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    pool: Pool,
+    requests: int,
+    concurrency: int,
+) -> dict[str, Any]:
+    recorder = Recorder()
+    pending = iter(range(requests))
+
+    async def worker() -> None:
+        for _ in pending:
+            await recorder.send(client, scenario, pool)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return recorder.summary(scenario.route, time.perf_counter() - started)
+
+
+async def run_isolated(
+    client: httpx.AsyncClient,
+    scenarios: list[Scenario],
+    pool: Pool,
+    requests: int,
+    concurrency: int,
+) -> dict[str, dict[str, Any]]:
+    results = {}
+    for scenario in scenarios:
+        results[scenario.route] = await run_route(
+            client, scenario, pool, requests, concurrency
+        )
+        print_row(scenario.route, results[scenario.route])
+    return results
+
+
+async def run_mix(
+    client: httpx.AsyncClient,
+    scenarios: list[Scenario],
+    pool: Pool,
+    users: int,
+    duration_s: float,
+    think_time_s: float,
+) -> dict[str, dict[str, Any]]:
+    recorder = Recorder()
+    weighted = [s for s in scenarios if s.weight]
+    weights = [s.weight for s in weighted]
+    deadline = time.perf_counter() + duration_s
+
+    async def user(rng: random.Random) -> None:
+        while time.perf_counter() < deadline:
+            await recorder.send(client, rng.choices(weighted, weights)[0], pool)
+            if think_time_s:
+                await asyncio.sleep(rng.uniform(0, 2 * think_time_s))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(user(random.Random(i)) for i in range(users)))
+    elapsed = time.perf_counter() - started
+    results = {}
+    for scenario in weighted:
+        results[scenario.route] = recorder.summary(scenario.route, elapsed)
+        print_row(scenario.route, results[scenario.route])
+    return results
+
+
+def print_row(route: str, stats: dict[str, Any]) -> None:
+    print(
+        f"{route:>52}: {stats['throughput_rps']:8.1f} req/s"
+        f" | p50 {stats['p50_ms']:8.1f} ms"
+        f" | p95 {stats['p95_ms']:8.1f} ms"
+        f" | p99 {stats['p99_ms']:8.1f} ms"
+        f" | {stats['errors']:4d} errors"
+    )
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], tolerance: float
+) -> list[str]:
+    regressions = []
+    for mode, routes in current["results"].items():
+        for route, stats in routes.items():
+            before = baseline["results"].get(mode, {}).get(route)
+            if not before or not stats["requests"]:
+                continue
+            if stats["p95_ms"] > before["p95_ms"] * (1 + tolerance):
+                regressions.append(
+                    f"{mode} {route}: p95 {before['p95_ms']} -> {stats['p95_ms']} ms"
+                )
+            if stats["throughput_rps"] < before["throughput_rps"] * (1 - tolerance):
+                regressions.append(
+                    f"{mode} {route}: throughput {before['throughput_rps']}"
+                    f" -> {stats['throughput_rps']} req/s"
+                )
+            if stats["errors"] > before["errors"]:
+                regressions.append(
+                    f"{mode} {route}: errors {before['errors']} -> {stats['errors']}"
+                )
+    return regressions
+
+
+def git_revision() -> None | str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args: argparse.Namespace, client: httpx.AsyncClient) -> dict[str, Any]:
+    pool = await discover_ids(client, random.Random(args.seed))
+    scenarios = [
+        s
+        for s in SCENARIOS
+        if not args.routes or any(pattern in s.route for pattern in args.routes)
+    ]
+    results = {}
+    if args.mode in ("isolated", "both"):
+        print(f"isolated: {args.requests} requests per route at {args.concurrency}")
+        results["isolated"] = await run_isolated(
+            client, scenarios, pool, args.requests, args.concurrency
+        )
+    if args.mode in ("mix", "both"):
+        print(
+            f"mix: {args.users} users for {args.duration} s,"
+            f" think time {args.think_time_ms} ms"
+        )
+        results["mix"] = await run_mix(
+            client,
+            scenarios,
+            pool,
+            args.users,
+            args.duration,
+            args.think_time_ms / 1000,
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--properties", type=int, default=10000)
+    parser.add_argument("--transactions", type=int, default=1000000)
+    parser.add_argument("--db", type=Path, help="seeded SQLite file, kept and reused")
+    parser.add_argument("--async-db", action="store_true")
+    parser.add_argument("--base-url", help="load a running server instead")
+    parser.add_argument("--mode", choices=("isolated", "mix", "both"), default="both")
+    parser.add_argument("--routes", nargs="*", help="only routes containing these")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--users", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--think-time-ms", type=float, default=50.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--compare", type=Path)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.base_url:
+            target = args.base_url
+            client = httpx.AsyncClient(
+                base_url=args.base_url,
+                timeout=60,
+                limits=httpx.Limits(max_connections=max(args.concurrency, args.users)),
+            )
+            dispose = None
+        else:
+            url = prepare_database(
+                args.db or Path(tmp) / "bench.db", args.properties, args.transactions
+            )
+            target = "in-process"
+            dispose = bind_database(url, args.async_db)
+            client = httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=build_app()),
+                base_url="http://bench",
+                timeout=60,
+            )
+
+        async def run_with_client() -> dict[str, Any]:
+            async with client:
+                return await run(args, client)
+
+        results = asyncio.run(run_with_client())
+        if dispose:
+            dispose()
+
+    report = {
+        "meta": {
+            "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "target": target,
+            "database_async": args.async_db,
+            "properties": args.properties,
+            "transactions": args.transactions,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "users": args.users,
+            "duration_s": args.duration,
+            "think_time_ms": args.think_time_ms,
+        },
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Results written to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare(baseline, report, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regression beyond {args.tolerance:.0%} against {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
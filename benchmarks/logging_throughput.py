@@ -0,0 +1,170 @@
+"""Measure write-endpoint throughput with logging on: the previous synchronous
+StreamHandler with text formatting against the queued JSON handler, with and
+without payload sampling/truncation.
+
+Every configuration writes its log to a file in a temporary directory, so the
+numbers include real I/O. --sink-delay-ms adds a sleep to each write to model
+a slow log sink (a full pipe, a network collector).
+
+Run from the repository root:
+
+    python -m benchmarks.logging_throughput --requests 2000 --concurrency 16
+"""
+
+import argparse
+import asyncio
+import logging
+import tempfile
+import time
+from datetime import date
+from logging.config import dictConfig
+from pathlib import Path
+from typing import Any, Callable, TextIO
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import create_engine
+
+import database
+from benchmarks.query_plans import seed
+from core.logging.logging_config import TEXT_FORMAT, setup_logging, stop_logging
+from core.middlewares.correlation import CorrelationIdMiddleware
+from core.middlewares.metrics import MetricsMiddleware
+from core.settings import Settings
+from main import API_V1_PREFIX, routers_v1
+
+ENDPOINT = f"{API_V1_PREFIX}/transaction/"
+
+
+class SlowStream:
+    def __init__(self, stream: TextIO, delay_s: float) -> None:
+        self.stream = stream
+        self.delay_s = delay_s
+
+    def write(self, text: str) -> int:
+        if self.delay_s:
+            time.sleep(self.delay_s)
+        return self.stream.write(text)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+
+def legacy_logging(stream: Any) -> None:
+    stop_logging()
+    dictConfig(
+        {
+            "version": 1,
+            "disable_existing_loggers": False,
+            "formatters": {"default": {"format": TEXT_FORMAT}},
+            "filters": {
+                "correlation_id": {
+                    "()": "core.logging.logger_with_correlation_id.CorrelationIdFilter"
+                }
+            },
+            "handlers": {
+                "default": {
+                    "class": "logging.StreamHandler",
+                    "formatter": "default",
+                    "filters": ["correlation_id"],
+                    "stream": stream,
+                }
+            },
+            "root": {"level": "INFO", "handlers": ["default"]},
+        }
+    )
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+    app.add_middleware(CorrelationIdMiddleware)
+    for r in routers_v1:
+        app.include_router(r, prefix=API_V1_PREFIX)
+    return app
+
+
+async def run_load(app: FastAPI, requests: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    pending = iter(range(requests))
+    body = {
+        "date": date.today().isoformat(),
+        "properties_concepts_id": 1,
+        "transaction_type": "income",
+        "period": date.today().strftime("%Y-%m"),
+        "amount": "1500.00",
+    }
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as c:
+
+        async def worker() -> None:
+            for _ in pending:
+                (await c.post(ENDPOINT, json=body)).raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return requests / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--sink-delay-ms", type=float, default=0.0)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    configs: dict[str, Callable[[Any], None]] = {
+        "sync StreamHandler, text": legacy_logging,
+        "queue, JSON": lambda stream: setup_logging(
+            Settings(log_format="json"), stream
+        ),
+        "queue, JSON, 10% payloads": lambda stream: setup_logging(
+            Settings(log_format="json", log_payload_sample_rate=0.1), stream
+        ),
+        "queue, JSON, 256 char payloads": lambda stream: setup_logging(
+            Settings(log_format="json", log_payload_max_length=256), stream
+        ),
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{Path(tmp) / 'bench.db'}"
+        engine = create_engine(url, connect_args={"check_same_thread": False})
+        database.apply_sqlite_pragmas(
+            engine, database.sqlite_pragmas(database.settings)
+        )
+        database.Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            seed(conn, 100, 1000)
+        database.SessionLocal.configure(bind=engine)
+        database.DATABASE_ASYNC = False
+        app = build_app()
+
+        print(
+            f"{args.requests} x POST {ENDPOINT} at concurrency {args.concurrency}, "
+            f"sink delay {args.sink_delay_ms} ms (best of {args.rounds})"
+        )
+        # Rounds are interleaved so the growing tables do not favour one setup.
+        best: dict[str, tuple[float, float]] = {}
+        for _ in range(args.rounds):
+            for name, configure in configs.items():
+                log_path = Path(tmp) / "app.log"
+                with log_path.open("w") as log_file:
+                    configure(SlowStream(log_file, args.sink_delay_ms / 1000))
+                    logging.getLogger("httpx").setLevel(logging.WARNING)
+                    throughput = asyncio.run(
+                        run_load(app, args.requests, args.concurrency)
+                    )
+                    # Queued records are still written before the size is read.
+                    stop_logging()
+                size_kib = log_path.stat().st_size / 1024
+                best[name] = max(best.get(name, (0.0, 0.0)), (throughput, size_kib))
+
+        for name, (throughput, size_kib) in best.items():
+            print(f"{name:>32}: {throughput:8.1f} req/s | {size_kib:8.0f} KiB logged")
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Measure requests/sec through the full middleware stack (correlation id,
+CORS, rate limiter) with the BaseHTTPMiddleware implementations the app used
+before and with the current pure ASGI ones.
+
+The legacy classes below reproduce the previous dispatch() code paths on top
+of the same rate limiter backend, so the difference is the middleware
+plumbing alone.
+
+Run from the repository root:
+
+    python -m benchmarks.middleware_stack --requests 5000 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.responses import Response
+from starlette.types import ASGIApp
+
+from core.logging.logger_with_correlation_id import get_logger
+from core.middlewares.correlation import CorrelationIdMiddleware
+from core.middlewares.rate_limiter import RateLimiterMiddleware
+from core.rate_limiting.base import RateLimit, RateLimiterBackend
+from core.rate_limiting.memory import InMemorySlidingWindowBackend
+
+UNLIMITED = 10**9
+
+
+class LegacyCorrelationIdMiddleware(BaseHTTPMiddleware):
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        correlation_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
+        request.state.correlation_id = correlation_id
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = correlation_id
+        return response
+
+
+class LegacyRateLimiterMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app: ASGIApp, backend: RateLimiterBackend) -> None:
+        super().__init__(app)
+        self.backend = backend
+        self.limit = RateLimit(UNLIMITED)
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        assert request.client is not None
+        result = await self.backend.hit(f"*|{request.client.host}", self.limit)
+        response = await call_next(request)
+        response.headers["X-RateLimit-Remaining"] = str(result.remaining)
+        return response
+
+
+def build_app(legacy: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health() -> dict[str, str]:
+        get_logger("bench").debug("health")
+        return {"status": "ok"}
+
+    backend = InMemorySlidingWindowBackend()
+    if legacy:
+        app.add_middleware(LegacyCorrelationIdMiddleware)
+    else:
+        app.add_middleware(CorrelationIdMiddleware)
+    app.add_middleware(CORSMiddleware, allow_origins=["*"])
+    if legacy:
+        app.add_middleware(LegacyRateLimiterMiddleware, backend=backend)
+    else:
+        app.add_middleware(
+            RateLimiterMiddleware, backend=backend, requests_per_minute=UNLIMITED
+        )
+    return app
+
+
+async def run_load(app: FastAPI, requests: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    pending = iter(range(requests))
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as c:
+
+        async def worker() -> None:
+            for _ in pending:
+                (await c.get("/health")).raise_for_status()
+
+        # Warm-up: the middleware stack is built on the first request.
+        (await c.get("/health")).raise_for_status()
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return requests / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    for name, legacy in (("BaseHTTPMiddleware", True), ("pure ASGI", False)):
+        throughput = asyncio.run(
+            run_load(build_app(legacy), args.requests, args.concurrency)
+        )
+        print(f"{name:>18}: {throughput:8.1f} req/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""Compare SQLite query plans and timings of the hot repository queries
+before and after the indexes added in revision 5c3e1a9b7d42.
+
+Run from the repository root:
+
+    python -m benchmarks.query_plans --properties 2000 --transactions 300000
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.engine import Connection
+
+from database import Base
+from models.concept import Concept
+from models.contract import Contract
+from models.properties_concepts import PropertiesConcepts
+from models.property import Property
+from models.transaction import Transaction
+
+SEED_BATCH_SIZE = 50000
+
+NEW_INDEXES = (
+    "ix_transactions_properties_concepts_id_period",
+    "ix_transactions_date",
+    "ix_contracts_end_date",
+    "uq_properties_concepts_property_id_concept_id",
+)
+
+# Query shapes issued by the repositories, written as the SQL they compile to.
+QUERIES: dict[str, tuple[str, dict[str, Any]]] = {
+    "contracts ending within 3 months": (
+        "SELECT * FROM contracts "
+        "WHERE end_date >= date('now') AND end_date <= date('now', '+3 months') "
+        "ORDER BY end_date ASC",
+        {},
+    ),
+    "transactions of a combo and period": (
+        "SELECT * FROM transactions "
+        "WHERE properties_concepts_id = :pc_id AND period = :period",
+        {"pc_id": 42, "period": "2025-06"},
+    ),
+    "transactions first page (date, id)": (
+        "SELECT * FROM transactions ORDER BY date DESC, id DESC LIMIT 101",
+        {},
+    ),
+    "transactions in a date range": (
+        "SELECT * FROM transactions WHERE date >= :date_from AND date <= :date_to",
+        {"date_from": "2025-03-01", "date_to": "2025-03-31"},
+    ),
+    "properties_concepts by property and concept": (
+        "SELECT * FROM properties_concepts "
+        "WHERE property_id = :property_id AND concept_id = :concept_id",
+        {"property_id": 42, "concept_id": 2},
+    ),
+}
+
+
+def seed(conn: Connection, properties: int, transactions: int) -> None:
+    rng = random.Random(0)
+    today = date.today()
+
+    conn.execute(
+        insert(Property),
+        [
+            {"id": i, "location": f"Property {i}", "valuation": 100000}
+            for i in range(1, properties + 1)
+        ],
+    )
+    conn.execute(
+        insert(Concept),
+        [
+            {"id": i, "name": f"Concept {i}", "is_ordinary": True, "periodicity": i}
+            for i in range(1, 5)
+        ],
+    )
+    starts = [today - timedelta(days=rng.randint(0, 1000)) for _ in range(properties)]
+    conn.execute(
+        insert(Contract),
+        [
+            {
+                "property_id": i,
+                "start_date": start,
+                "end_date": start + timedelta(days=rng.randint(0, 2000)),
+            }
+            for i, start in enumerate(starts, start=1)
+        ],
+    )
+    combos = [
+        {"property_id": p, "concept_id": c, "enabled": True}
+        for p in range(1, properties + 1)
+        for c in range(1, 5)
+    ]
+    conn.execute(insert(PropertiesConcepts), combos)
+    # Inserted in batches so a million rows do not sit in memory at once.
+    for offset in range(0, transactions, SEED_BATCH_SIZE):
+        conn.execute(
+            insert(Transaction),
+            [
+                {
+                    "date": today - timedelta(days=rng.randint(0, 3650)),
+                    "properties_concepts_id": rng.randint(1, len(combos)),
+                    "transaction_type": rng.choice(("income", "expense")),
+                    "period": f"{rng.randint(2016, 2026)}-{rng.randint(1, 12):02d}",
+                    "amount": rng.randint(1, 100000),
+                }
+                for _ in range(min(SEED_BATCH_SIZE, transactions - offset))
+            ],
+        )
+
+
+def measure(conn: Connection, repeat: int) -> dict[str, tuple[list[str], float]]:
+    results = {}
+    for name, (sql, params) in QUERIES.items():
+        plan = [
+            row.detail
+            for row in conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"), params)
+        ]
+        started = time.perf_counter()
+        for _ in range(repeat):
+            conn.execute(text(sql), params).all()
+        elapsed_ms = (time.perf_counter() - started) * 1000 / repeat
+        results[name] = (plan, elapsed_ms)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--properties", type=int, default=2000)
+    parser.add_argument("--transactions", type=int, default=200000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        Base.metadata.create_all(engine)
+
+        with engine.begin() as conn:
+            for index_name in NEW_INDEXES:
+                conn.execute(text(f"DROP INDEX {index_name}"))
+            seed(conn, args.properties, args.transactions)
+            conn.execute(text("ANALYZE"))
+
+        with engine.connect() as conn:
+            before = measure(conn, args.repeat)
+
+        with engine.begin() as conn:
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(conn)
+            conn.execute(text("ANALYZE"))
+
+        with engine.connect() as conn:
+            after = measure(conn, args.repeat)
+
+        engine.dispose()
+
+    for name in QUERIES:
+        plan_before, ms_before = before[name]
+        plan_after, ms_after = after[name]
+        print(f"== {name}")
+        print(f"   before ({ms_before:8.3f} ms): {' | '.join(plan_before)}")
+        print(f"   after  ({ms_after:8.3f} ms): {' | '.join(plan_after)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Profile peak memory and time of the repositories' list reads: the previous
+full ORM entity loading (identity map + model_validate) against the current
+column-projected select() rows built into DTOs directly.
+
+Run from the repository root:
+
+    python -m benchmarks.repository_memory --properties 20000 --transactions 200000
+"""
+
+import argparse
+import gc
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, joinedload
+
+from benchmarks.query_plans import seed
+from database import Base
+from models.concept import Concept
+from models.contract import Contract
+from models.properties_concepts import PropertiesConcepts
+from models.property import Property
+from models.transaction import Transaction
+from repositories.concept_repository import ConceptRepository
+from repositories.contract_repository import ContractRepository
+from repositories.properties_concepts_repository import PropertiesConceptsRepository
+from repositories.property_repository import PropertyRepository
+from repositories.transaction_repository import TransactionRepository
+
+
+# Timing runs without tracemalloc, whose per-allocation hooks skew it.
+def profile(read: Callable[[], list[Any]]) -> tuple[int, float, float]:
+    gc.collect()
+    started = time.perf_counter()
+    count = len(read())
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    gc.collect()
+    tracemalloc.start()
+    read()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, peak / 2**20, elapsed_ms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--properties", type=int, default=20000)
+    parser.add_argument("--transactions", type=int, default=200000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            seed(conn, args.properties, args.transactions)
+
+        cases: dict[str, tuple[Any, Callable[[Session], Any]]] = {
+            "transactions": (TransactionRepository, lambda db: db.query(Transaction)),
+            "contracts": (ContractRepository, lambda db: db.query(Contract)),
+            "properties": (PropertyRepository, lambda db: db.query(Property)),
+            "concepts": (ConceptRepository, lambda db: db.query(Concept)),
+            "properties_concepts": (
+                PropertiesConceptsRepository,
+                lambda db: db.query(PropertiesConcepts).options(
+                    joinedload(PropertiesConcepts.concept),
+                    joinedload(PropertiesConcepts.property),
+                ),
+            ),
+        }
+
+        print(
+            f"{'table':<20} {'rows':>8} {'ORM MiB':>9} {'rows MiB':>9} "
+            f"{'ORM ms':>9} {'rows ms':>9}"
+        )
+        for table, (repository_class, orm_query) in cases.items():
+            with Session(engine) as db:
+                repository = repository_class(db)
+
+                def orm_read() -> list[Any]:
+                    db.expunge_all()
+                    dtos: list[Any] = repository.to_dto_list(orm_query(db).all())
+                    return dtos
+
+                count, orm_mib, orm_ms = profile(orm_read)
+                _, rows_mib, rows_ms = profile(repository.get_all)
+            print(
+                f"{table:<20} {count:>8} {orm_mib:>9.1f} {rows_mib:>9.1f} "
+                f"{orm_ms:>9.1f} {rows_ms:>9.1f}"
+            )
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Compare the default SQLite settings (rollback journal, synchronous=FULL)
+against the pragma profile applied by database.py under a mixed load: one
+writer committing single transactions, as the repositories do, while reader
+threads keep running the transactions listing query.
+
+Run from the repository root:
+
+    python -m benchmarks.sqlite_pragmas --readers 4 --seconds 10
+"""
+
+import argparse
+import statistics
+import tempfile
+import threading
+import time
+from datetime import date
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.engine import Engine
+
+from benchmarks.query_plans import seed
+from core.settings import Settings
+from database import Base, apply_sqlite_pragmas, engine_options, sqlite_pragmas
+from models.transaction import Transaction
+
+READ_QUERY = text("SELECT * FROM transactions ORDER BY date DESC, id DESC LIMIT 100")
+
+PROFILES: dict[str, dict[str, str | int]] = {
+    "default": {"journal_mode": "delete", "synchronous": "full"},
+    "tuned": sqlite_pragmas(Settings()),
+}
+
+
+def build_engine(url: str, pragmas: dict[str, str | int]) -> Engine:
+    settings = Settings()
+    engine = create_engine(url, **engine_options(url, settings, is_async=False))
+    apply_sqlite_pragmas(
+        engine, {"busy_timeout": settings.database_statement_timeout_ms, **pragmas}
+    )
+    return engine
+
+
+def run_load(engine: Engine, readers: int, seconds: float) -> dict[str, float]:
+    stop = threading.Event()
+    writes = 0
+    read_latencies: list[list[float]] = [[] for _ in range(readers)]
+
+    def writer() -> None:
+        nonlocal writes
+        while not stop.is_set():
+            with engine.begin() as conn:
+                conn.execute(
+                    insert(Transaction),
+                    {
+                        "date": date.today(),
+                        "properties_concepts_id": 1,
+                        "transaction_type": "income",
+                        "period": "2026-01",
+                        "amount": 1,
+                    },
+                )
+            writes += 1
+
+    def reader(samples: list[float]) -> None:
+        while not stop.is_set():
+            started = time.perf_counter()
+            with engine.connect() as conn:
+                conn.execute(READ_QUERY).all()
+            samples.append((time.perf_counter() - started) * 1000)
+
+    threads = [threading.Thread(target=writer)] + [
+        threading.Thread(target=reader, args=(samples,)) for samples in read_latencies
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    reads = sorted(sample for samples in read_latencies for sample in samples)
+    return {
+        "writes/s": writes / seconds,
+        "reads/s": len(reads) / seconds,
+        "read p50 ms": statistics.median(reads),
+        "read p99 ms": reads[min(len(reads) - 1, int(len(reads) * 0.99))],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--properties", type=int, default=500)
+    parser.add_argument("--transactions", type=int, default=50000)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=10)
+    args = parser.parse_args()
+
+    results = {}
+    for profile, pragmas in PROFILES.items():
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = build_engine(f"sqlite:///{Path(tmp) / 'bench.db'}", pragmas)
+            Base.metadata.create_all(engine)
+            with engine.begin() as conn:
+                seed(conn, args.properties, args.transactions)
+            results[profile] = run_load(engine, args.readers, args.seconds)
+            engine.dispose()
+
+    print(f"1 writer + {args.readers} readers for {args.seconds:g}s")
+    for profile, metrics in results.items():
+        print(
+            f"{profile:>8}: "
+            + " | ".join(f"{name} {value:9.1f}" for name, value in metrics.items())
+        )
+
+
+if __name__ == "__main__":
+    main()
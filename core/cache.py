@@ -0,0 +1,100 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, TypeVar, cast
+from core.settings import get_settings
+
+T = TypeVar("T")
+
+
+class TTLCache:
+    def __init__(self, max_entries: int, ttl_s: float) -> None:
+        self.entries: OrderedDict[tuple[str, Hashable], tuple[float, Hashable, Any]] = (
+            OrderedDict()
+        )
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self.stats: dict[str, dict[str, int]] = {}
+        # Services run in the threadpool, so lookups and writes can interleave.
+        self.lock = threading.Lock()
+
+    def _count(self, namespace: str, event: str) -> None:
+        counters = self.stats.setdefault(
+            namespace, {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+        )
+        counters[event] += 1
+
+    # An entry stored under another version is treated as a miss.
+    def get_or_load(
+        self,
+        namespace: str,
+        key: Hashable,
+        loader: Callable[[], T],
+        version: Hashable = None,
+    ) -> T:
+        cache_key = (namespace, key)
+        now = time.monotonic()
+
+        with self.lock:
+            entry = self.entries.get(cache_key)
+            if entry is not None and entry[0] > now and entry[1] == version:
+                self.entries.move_to_end(cache_key)
+                self._count(namespace, "hits")
+                # Stored by a loader for the same key, so it has its return type.
+                return cast(T, entry[2])
+            self._count(namespace, "misses")
+            generation = self.generation(namespace)
+
+        value = loader()
+
+        with self.lock:
+            # Skip storing a value loaded before a concurrent invalidation.
+            if generation == self.generation(namespace):
+                self.entries[cache_key] = (now + self.ttl_s, version, value)
+                self.entries.move_to_end(cache_key)
+                while len(self.entries) > self.max_entries:
+                    (evicted_namespace, _), _ = self.entries.popitem(last=False)
+                    self._count(evicted_namespace, "evictions")
+        return value
+
+    def generation(self, namespace: str) -> int:
+        return self.stats.get(namespace, {}).get("invalidations", 0)
+
+    def invalidate(self, *namespaces: str) -> None:
+        with self.lock:
+            for cache_key in [key for key in self.entries if key[0] in namespaces]:
+                del self.entries[cache_key]
+            for namespace in namespaces:
+                self._count(namespace, "invalidations")
+
+    def snapshot(self) -> dict[str, Any]:
+        with self.lock:
+            return {
+                "entries": len(self.entries),
+                "max_entries": self.max_entries,
+                "ttl_s": self.ttl_s,
+                "namespaces": {name: dict(c) for name, c in self.stats.items()},
+            }
+
+
+settings = get_settings()
+
+# Properties, concepts and their combos, read on every Streamlit rerun.
+# Combos embed the property and concept, so writes to either invalidate them.
+PROPERTY_NAMESPACE = "property"
+CONCEPT_NAMESPACE = "concept"
+PROPERTIES_CONCEPTS_NAMESPACE = "properties_concepts"
+
+# Entries are stored under the versions of the tables they are read from, the
+# same versions the ETags are built from, so a write committed by another
+# worker is never answered with this worker's older copy.
+NAMESPACE_TABLES = {
+    PROPERTY_NAMESPACE: ("properties",),
+    CONCEPT_NAMESPACE: ("concepts",),
+    PROPERTIES_CONCEPTS_NAMESPACE: ("properties_concepts", "properties", "concepts"),
+}
+
+reference_cache = TTLCache(
+    max_entries=settings.reference_cache_max_entries,
+    ttl_s=settings.reference_cache_ttl_s,
+)
@@ -0,0 +1,41 @@
+import hashlib
+from typing import Annotated, Awaitable, Callable
+from fastapi import Depends, HTTPException, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from core.dependencies.service_runner import ServiceRunner, get_runner_db
+from repositories.table_version_repository import TableVersionRepository
+
+
+def if_none_match(request: Request) -> set[str]:
+    header = request.headers.get("If-None-Match", "")
+    return {tag.strip().removeprefix("W/") for tag in header.split(",") if tag.strip()}
+
+
+# The ETag only depends on the URL and the versions of the tables the response
+# is built from, so an unchanged resource is answered without reading its rows.
+# Only meant for GET routes: on a write it would skip the write with a 304.
+def etag_guard(*tables: str) -> Callable[..., Awaitable[None]]:
+    async def check_etag(
+        request: Request,
+        response: Response,
+        db: Annotated[Session | AsyncSession, Depends(get_runner_db)],
+    ) -> None:
+        versions = await ServiceRunner(TableVersionRepository, db).run(
+            TableVersionRepository.get_versions, tables
+        )
+        fingerprint = "|".join(
+            [str(request.url.path), str(request.url.query)]
+            + [f"{table}={version}" for table, version in sorted(versions.items())]
+        )
+        etag = f'"{hashlib.sha1(fingerprint.encode()).hexdigest()}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+        requested = if_none_match(request)
+        if etag in requested or "*" in requested:
+            raise HTTPException(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+            )
+        response.headers.update(headers)
+
+    return check_etag
@@ -0,0 +1,17 @@
+import secrets
+from fastapi import HTTPException, Request, status
+from database import settings
+
+
+# Reports are only served to holders of the profiling token; anyone else gets
+# the same 404 as when profiling is disabled.
+def require_profiling_token(request: Request) -> None:
+    supplied = request.headers.get(settings.profiling_header)
+    if (
+        not settings.profiling_token
+        or supplied is None
+        or not secrets.compare_digest(
+            supplied.encode(), settings.profiling_token.encode()
+        )
+    ):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,46 @@
+from functools import partial
+from typing import AsyncIterator, Callable, Concatenate, Generic, ParamSpec, TypeVar
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+import database
+from core.profiling import run_profiled
+
+S = TypeVar("S")
+T = TypeVar("T")
+P = ParamSpec("P")
+
+
+class ServiceRunner(Generic[S]):
+    def __init__(
+        self, factory: Callable[[Session], S], db: Session | AsyncSession
+    ) -> None:
+        self.factory = factory
+        self.db = db
+
+    async def run(
+        self,
+        method: Callable[Concatenate[S, P], T],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        if isinstance(self.db, AsyncSession):
+            return await self.db.run_sync(
+                lambda session: method(self.factory(session), *args, **kwargs)
+            )
+        return await run_in_threadpool(
+            run_profiled, partial(method, self.factory(self.db), *args, **kwargs)
+        )
+
+
+async def get_runner_db() -> AsyncIterator[Session | AsyncSession]:
+    if database.DATABASE_ASYNC:
+        async with database.AsyncSessionLocal() as async_db:
+            yield async_db
+        return
+
+    db = database.SessionLocal()
+    try:
+        yield db
+    finally:
+        await run_in_threadpool(db.close)
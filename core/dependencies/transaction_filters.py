@@ -0,0 +1,20 @@
+from datetime import date
+from typing import Annotated, Literal
+from fastapi import Query
+from schemas.transaction import TransactionFilters
+
+
+def get_transaction_filters(
+    date_from: None | date = None,
+    date_to: None | date = None,
+    period: Annotated[None | str, Query(pattern=r"^\d{4}-(0[1-9]|1[0-2])$")] = None,
+    transaction_type: None | Literal["income", "expense"] = None,
+    properties_concepts_id: Annotated[None | int, Query(ge=1)] = None,
+) -> TransactionFilters:
+    return TransactionFilters(
+        date_from=date_from,
+        date_to=date_to,
+        period=period,
+        transaction_type=transaction_type,
+        properties_concepts_id=properties_concepts_id,
+    )
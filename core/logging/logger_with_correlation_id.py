@@ -1,9 +1,17 @@
 import logging
-from typing import Any, MutableMapping
+from contextvars import ContextVar
+from typing import Any, Mapping, MutableMapping
 from fastapi import Request
 
+# Set by CorrelationIdMiddleware for the duration of each request, so loggers
+# created without a Request still tag their records with its correlation id.
+correlation_id_var: ContextVar[str] = ContextVar("correlation_id", default="N/A")
+
 
 class CorrelationLoggerAdapter(logging.LoggerAdapter[logging.Logger]):
+    # Always set to a dict by __init__, never None.
+    extra: Mapping[str, object]
+
     def __init__(
         self, logger: logging.Logger, extra: MutableMapping[str, Any] | None = None
     ) -> None:
@@ -16,15 +24,24 @@ class CorrelationLoggerAdapter(logging.LoggerAdapter[logging.Logger]):
         if not isinstance(extra, dict):
             extra = dict(extra or {})
         if "correlation_id" not in extra:
-            extra["correlation_id"] = "N/A"
+            extra["correlation_id"] = self.extra.get(
+                "correlation_id", correlation_id_var.get()
+            )
 
         kwargs["extra"] = extra
         return msg, kwargs
 
 
+class CorrelationIdFilter(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "correlation_id"):
+            record.correlation_id = correlation_id_var.get()
+        return True
+
+
 def get_logger(name: str, request: None | Request = None) -> CorrelationLoggerAdapter:
     logger = logging.getLogger(name)
-    correlation_id = (
-        getattr(request.state, "correlation_id", "N/A") if request else "N/A"
+    correlation_id = getattr(request.state, "correlation_id", None) if request else None
+    return CorrelationLoggerAdapter(
+        logger, {"correlation_id": correlation_id} if correlation_id else {}
     )
-    return CorrelationLoggerAdapter(logger, {"correlation_id": correlation_id})
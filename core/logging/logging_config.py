@@ -1,23 +1,74 @@
-from logging.config import dictConfig
-
-LOGGING = {
-    "version": 1,
-    "disable_existing_loggers": False,
-    "formatters": {
-        "default": {
-            "format": "%(asctime)s [%(levelname)s] %(name)s "
-            "[correlation_id=%(correlation_id)s] %(message)s"
-        }
-    },
-    "handlers": {
-        "default": {
-            "class": "logging.StreamHandler",
-            "formatter": "default",
-        }
-    },
-    "root": {"level": "INFO", "handlers": ["default"]},
-}
-
-
-def setup_logging() -> None:
-    dictConfig(LOGGING)
+import atexit
+import copy
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import TextIO
+from core.logging.json_formatter import JsonFormatter
+from core.logging.logger_with_correlation_id import CorrelationIdFilter
+from core.logging.payload_filter import PayloadFilter
+from core.settings import Settings, get_settings
+
+TEXT_FORMAT = (
+    "%(asctime)s [%(levelname)s] %(name)s "
+    "[correlation_id=%(correlation_id)s] %(message)s"
+)
+
+_listener: None | QueueListener = None
+
+
+class RecordQueueHandler(QueueHandler):
+    # The listener lives in this process, so records are queued as they are
+    # instead of being formatted for pickling. Only the message is resolved
+    # here, before its arguments can change; formatting happens in the
+    # listener thread.
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
+def setup_logging(
+    settings: None | Settings = None, stream: None | TextIO = None
+) -> None:
+    global _listener
+    settings = settings or get_settings()
+    stop_logging()
+
+    output = logging.StreamHandler(stream)
+    output.setFormatter(
+        JsonFormatter()
+        if settings.log_format == "json"
+        else logging.Formatter(TEXT_FORMAT)
+    )
+
+    # Request threads only enqueue records; a listener thread formats and
+    # writes them. Filters stay on the queue side, where the correlation id
+    # ContextVar of the request is still set.
+    handler = RecordQueueHandler(queue.SimpleQueue())
+    handler.addFilter(CorrelationIdFilter())
+    handler.addFilter(
+        PayloadFilter(settings.log_payload_sample_rate, settings.log_payload_max_length)
+    )
+
+    root = logging.getLogger()
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(settings.log_level)
+
+    _listener = QueueListener(handler.queue, output)
+    _listener.start()
+
+
+# Flushes the records still queued, e.g. when a script exits.
+def stop_logging() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop_logging)
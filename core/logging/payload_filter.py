@@ -0,0 +1,41 @@
+import logging
+import random
+import orjson
+
+# extra= keys holding request/entity payloads, e.g. a model_dump() of a write.
+PAYLOAD_FIELDS = ("data",)
+
+
+class PayloadFilter(logging.Filter):
+    def __init__(
+        self,
+        sample_rate: float = 1.0,
+        max_length: int = 0,
+        fields: tuple[str, ...] = PAYLOAD_FIELDS,
+    ) -> None:
+        super().__init__()
+        self.sample_rate = sample_rate
+        self.max_length = max_length
+        self.fields = fields
+
+    # Records are always kept; only their payloads are dropped or shortened.
+    def filter(self, record: logging.LogRecord) -> bool:
+        present = [field for field in self.fields if field in record.__dict__]
+        if not present:
+            return True
+
+        if self.sample_rate < 1 and random.random() >= self.sample_rate:
+            for field in present:
+                setattr(record, field, "<sampled out>")
+            return True
+
+        if self.max_length:
+            for field in present:
+                serialized = orjson.dumps(getattr(record, field), default=str)
+                if len(serialized) > self.max_length:
+                    setattr(
+                        record,
+                        field,
+                        serialized[: self.max_length].decode(errors="ignore") + "...",
+                    )
+        return True
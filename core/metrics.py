@@ -0,0 +1,124 @@
+import os
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from core.slow_query_log import SlowQueryLog
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "Requests answered, by route template and status code",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time to answer a request, up to the start of its response",
+    ["method", "route"],
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "Requests being processed",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+HTTP_REQUEST_DB_QUERIES = Histogram(
+    "http_request_db_queries",
+    "SQL statements executed per request; high counts point at N+1 queries",
+    ["method", "route"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 250),
+)
+HTTP_REQUEST_DB_DURATION = Histogram(
+    "http_request_db_duration_seconds",
+    "Time spent executing SQL statements per request",
+    ["method", "route"],
+)
+DB_QUERIES = Counter(
+    "db_queries_total", "SQL statements executed, by statement type", ["statement"]
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Execution time of single SQL statements",
+    ["statement"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+
+# Labels are limited to the statement's leading keyword to bound cardinality.
+STATEMENT_TYPES = {"SELECT", "INSERT", "UPDATE", "DELETE", "WITH", "PRAGMA"}
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    duration_s: float = 0.0
+
+
+# Set by MetricsMiddleware for each request. The object is shared, not copied,
+# with the threadpool and greenlet contexts the queries run in, so the
+# cursor hooks below can add to it from any of them.
+query_stats_var: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def statement_type(statement: str) -> str:
+    keyword = statement.lstrip().split(None, 1)[0].upper() if statement else ""
+    return keyword if keyword in STATEMENT_TYPES else "OTHER"
+
+
+def instrument_engine(
+    engine: Engine, slow_query_log: SlowQueryLog | None = None
+) -> None:
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_query_timer(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def record_query(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        elapsed = time.perf_counter() - conn.info["query_started_at"].pop()
+        label = statement_type(statement)
+        DB_QUERIES.labels(label).inc()
+        DB_QUERY_DURATION.labels(label).observe(elapsed)
+
+        stats = query_stats_var.get()
+        if stats is not None:
+            stats.count += 1
+            stats.duration_s += elapsed
+
+        if slow_query_log is not None:
+            slow_query_log.record(
+                conn, statement, parameters, executemany, label, elapsed
+            )
+
+    @event.listens_for(engine, "handle_error")
+    def discard_query_timer(context: Any) -> None:
+        if context.connection is not None:
+            started = context.connection.info.get("query_started_at")
+            if started:
+                started.pop()
+
+
+# With several workers each process only sees its own samples; when
+# PROMETHEUS_MULTIPROC_DIR is set they are written there and merged on scrape.
+def render_metrics() -> tuple[bytes, str]:
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
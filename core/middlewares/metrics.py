@@ -0,0 +1,72 @@
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from core.logging.logger_with_correlation_id import get_logger
+from core.metrics import (
+    HTTP_REQUEST_DB_DURATION,
+    HTTP_REQUEST_DB_QUERIES,
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    HTTP_REQUESTS_IN_PROGRESS,
+    QueryStats,
+    query_stats_var,
+)
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.logger = get_logger(__name__)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        stats = QueryStats()
+        status_code = 500
+        started = time.perf_counter()
+        elapsed = 0.0
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code, elapsed
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed = time.perf_counter() - started
+            await send(message)
+
+        token = query_stats_var.set(stats)
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            in_progress.dec()
+            query_stats_var.reset(token)
+
+            # The router stores the matched route in the scope; using its
+            # template keeps ids out of the labels. Unmatched paths, and
+            # responses sent before routing (429s, CORS preflights), share one.
+            route = getattr(scope.get("route"), "path", "unmatched")
+            elapsed = elapsed or time.perf_counter() - started
+            HTTP_REQUESTS.labels(method, route, str(status_code)).inc()
+            HTTP_REQUEST_DURATION.labels(method, route).observe(elapsed)
+            HTTP_REQUEST_DB_QUERIES.labels(method, route).observe(stats.count)
+            HTTP_REQUEST_DB_DURATION.labels(method, route).observe(stats.duration_s)
+
+            self.logger.info(
+                "%s %s %s in %.1f ms (%d queries, %.1f ms in the database)",
+                method,
+                route,
+                status_code,
+                elapsed * 1000,
+                stats.count,
+                stats.duration_s * 1000,
+                extra={
+                    "route": route,
+                    "status": status_code,
+                    "duration_ms": round(elapsed * 1000, 3),
+                    "db_queries": stats.count,
+                    "db_duration_ms": round(stats.duration_s * 1000, 3),
+                },
+            )
@@ -0,0 +1,96 @@
+import re
+import secrets
+import uuid
+from pathlib import Path
+from typing import Any
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from core.logging.logger_with_correlation_id import get_logger
+from core.profiling import worker_sessions_var
+
+# Correlation ids come from the client, so only safe ones name report files.
+REPORT_ID_PATTERN = r"^[A-Za-z0-9_-]{1,64}$"
+REPORTS_PATH = "/debug/profiles/"
+
+
+def render_report(session: Any, worker_sessions: list[Any]) -> str:
+    from pyinstrument.renderers import HTMLRenderer
+    from pyinstrument.session import Session
+
+    for worker_session in worker_sessions:
+        session = Session.combine(session, worker_session)
+    report: str = HTMLRenderer().render(session)
+    return report
+
+
+class ProfilingMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        token: str,
+        header: str,
+        output_dir: str,
+        interval_s: float = 0.001,
+    ) -> None:
+        # Imported here so a missing package fails at startup, not mid-request.
+        from pyinstrument import Profiler
+
+        self.app = app
+        self.profiler_class = Profiler
+        self.token = token
+        self.header = header
+        self.output_dir = Path(output_dir)
+        self.interval_s = interval_s
+        self.logger = get_logger(__name__)
+
+    def authorized(self, scope: Scope) -> bool:
+        supplied = Headers(scope=scope).get(self.header)
+        return supplied is not None and secrets.compare_digest(
+            supplied.encode(), self.token.encode()
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or not self.authorized(scope)
+            or scope["path"].startswith(REPORTS_PATH)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        correlation_id = scope.get("state", {}).get("correlation_id", "")
+        report_id = (
+            correlation_id
+            if re.fullmatch(REPORT_ID_PATTERN, correlation_id)
+            else uuid.uuid4().hex
+        )
+
+        async def send_with_report_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Profile-Report"] = report_id
+            await send(message)
+
+        worker_sessions: list[Any] = []
+        token = worker_sessions_var.set(worker_sessions)
+        profiler = self.profiler_class(interval=self.interval_s, async_mode="enabled")
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_with_report_id)
+        finally:
+            session = profiler.stop()
+            worker_sessions_var.reset(token)
+            await run_in_threadpool(
+                self.store_report, report_id, session, worker_sessions
+            )
+
+    def store_report(
+        self, report_id: str, session: Any, worker_sessions: list[Any]
+    ) -> None:
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            path = self.output_dir / f"{report_id}.html"
+            path.write_text(render_report(session, worker_sessions), encoding="utf-8")
+            self.logger.info("Profile report stored", extra={"report": str(path)})
+        except Exception:
+            self.logger.exception("Failed to store profile report")
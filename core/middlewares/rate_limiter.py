@@ -1,54 +1,105 @@
-from fastapi import Depends, Request, status
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+import math
+from fastapi import status
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.responses import Response
-from starlette.types import ASGIApp
-import time
-from core.dependencies.logger import get_request_logger
-from core.logging.logger_with_correlation_id import CorrelationLoggerAdapter
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from core.logging.logger_with_correlation_id import get_logger
+from core.rate_limiting.base import RateLimit, RateLimiterBackend
 
 
-class RateLimiterMiddleware(BaseHTTPMiddleware):
+class RateLimiterMiddleware:
     def __init__(
         self,
         app: ASGIApp,
+        backend: RateLimiterBackend,
         requests_per_minute: int = 60,
-        logger: CorrelationLoggerAdapter = Depends(get_request_logger),
+        route_limits: dict[str, int] | None = None,
+        key_limits: dict[str, int] | None = None,
+        key_header: str | None = None,
     ) -> None:
-        super().__init__(app)
-        self.requests_per_minute = requests_per_minute
-        self.requests: dict[str, list[float]] = {}
-        self.logger = logger
-
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        client = request.client
-        if client is None or not client.host:
-            return Response(
+        self.app = app
+        self.backend = backend
+        self.default_limit = RateLimit(requests_per_minute)
+        # Longest prefix first, so the most specific route limit wins.
+        self.route_limits = sorted(
+            (
+                (prefix, RateLimit(limit))
+                for prefix, limit in (route_limits or {}).items()
+            ),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+        self.key_limits = {
+            key: RateLimit(limit) for key, limit in (key_limits or {}).items()
+        }
+        self.key_header = key_header
+        self.logger = get_logger(__name__)
+
+    # Only header values listed in key_limits are honoured; any other value
+    # would let a client pick a fresh bucket on every request.
+    def client_key(self, scope: Scope) -> str | None:
+        if self.key_header:
+            key = Headers(scope=scope).get(self.key_header)
+            if key in self.key_limits:
+                return key
+        client = scope.get("client")
+        return client[0] if client and client[0] else None
+
+    # A matching route limit and the client's key limit both apply; the
+    # default limit only covers paths without a route limit.
+    def resolve_limits(self, path: str, client_key: str) -> list[tuple[str, RateLimit]]:
+        limits = []
+        for prefix, limit in self.route_limits:
+            if path.startswith(prefix):
+                limits.append((f"{prefix}|{client_key}", limit))
+                break
+        key_limit = self.key_limits.get(client_key)
+        if key_limit or not limits:
+            limits.append((f"*|{client_key}", key_limit or self.default_limit))
+        return limits
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        client_key = self.client_key(scope)
+        if client_key is None:
+            response = Response(
                 content="Cannot determine client address.",
                 status_code=status.HTTP_400_BAD_REQUEST,
                 media_type="text/plain",
             )
+            await response(scope, receive, send)
+            return
 
-        client_ip = client.host
-        current_time = time.monotonic()
-
-        if client_ip not in self.requests:
-            self.requests[client_ip] = []
-
-        self.requests[client_ip] = [
-            ts for ts in self.requests[client_ip] if current_time - ts < 60
+        hits = [
+            (limit, await self.backend.hit(bucket, limit))
+            for bucket, limit in self.resolve_limits(scope["path"], client_key)
         ]
+        # The most restrictive outcome is reported: a rejection first, then
+        # the fewest remaining requests.
+        limit, result = min(hits, key=lambda hit: (hit[1].allowed, hit[1].remaining))
 
-        if len(self.requests[client_ip]) >= self.requests_per_minute:
-            self.logger.warning("Rate limit exceeded", extra={"client_ip": client_ip})
-            return Response(
+        if not result.allowed:
+            self.logger.warning("Rate limit exceeded", extra={"client_key": client_key})
+            response = Response(
                 content="Rate limit exceeded. Please try again later.",
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                headers={"Retry-After": "60"},
+                headers={
+                    "Retry-After": str(math.ceil(result.retry_after_s)),
+                    "X-RateLimit-Limit": str(limit.requests),
+                    "X-RateLimit-Remaining": "0",
+                },
             )
+            await response(scope, receive, send)
+            return
 
-        self.requests[client_ip].append(current_time)
+        async def send_with_limit_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-RateLimit-Limit"] = str(limit.requests)
+                headers["X-RateLimit-Remaining"] = str(result.remaining)
+            await send(message)
 
-        response = await call_next(request)
-        return response
+        await self.app(scope, receive, send_with_limit_headers)
@@ -0,0 +1,17 @@
+import base64
+from datetime import date
+
+
+def encode_cursor(last_date: date, last_id: int) -> str:
+    raw = f"{last_date.isoformat()}|{last_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[date, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        date_part, id_part = raw.split("|", 1)
+        return date.fromisoformat(date_part), int(id_part)
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
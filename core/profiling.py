@@ -0,0 +1,28 @@
+from contextvars import ContextVar
+from typing import Any, Callable, ParamSpec, TypeVar
+
+T = TypeVar("T")
+P = ParamSpec("P")
+
+# Set by ProfilingMiddleware while a profiled request runs. The profiler only
+# samples the event loop thread, so service calls sent to the threadpool on
+# the request's behalf profile themselves and leave their sessions here to be
+# merged into the report.
+worker_sessions_var: ContextVar[list[Any] | None] = ContextVar(
+    "worker_profile_sessions", default=None
+)
+
+
+def run_profiled(fn: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    sessions = worker_sessions_var.get()
+    if sessions is None:
+        return fn(*args, **kwargs)
+
+    from pyinstrument import Profiler
+
+    profiler = Profiler(async_mode="disabled")
+    profiler.start()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        sessions.append(profiler.stop())
@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+from typing import NamedTuple, Protocol
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimit:
+    requests: int
+    window_s: float = 60
+
+
+class RateLimitResult(NamedTuple):
+    allowed: bool
+    remaining: int
+    retry_after_s: float
+
+
+class RateLimiterBackend(Protocol):
+    async def hit(self, key: str, limit: RateLimit) -> RateLimitResult: ...
+
+
+# Sliding window counter: the previous fixed window is weighted by how much of
+# it still overlaps the sliding window, so only two counters per key are kept.
+def sliding_window_estimate(
+    previous: int, current: int, limit: RateLimit, now: float
+) -> float:
+    elapsed = (now % limit.window_s) / limit.window_s
+    return previous * (1 - elapsed) + current
+
+
+def sliding_window_result(
+    estimate: float, limit: RateLimit, now: float
+) -> RateLimitResult:
+    if estimate + 1 > limit.requests:
+        return RateLimitResult(False, 0, limit.window_s - now % limit.window_s)
+    return RateLimitResult(True, int(limit.requests - estimate - 1), 0)
@@ -0,0 +1,17 @@
+from core.rate_limiting.base import RateLimiterBackend
+from core.rate_limiting.memory import (
+    InMemorySlidingWindowBackend,
+    InMemoryTokenBucketBackend,
+)
+from core.rate_limiting.shared import RedisRateLimiterBackend, SqliteRateLimiterBackend
+from core.settings import Settings
+
+
+def build_rate_limiter_backend(settings: Settings) -> RateLimiterBackend:
+    if settings.rate_limit_backend == "sqlite":
+        return SqliteRateLimiterBackend(settings.rate_limit_sqlite_path)
+    if settings.rate_limit_backend == "redis":
+        return RedisRateLimiterBackend.from_url(settings.rate_limit_redis_url)
+    if settings.rate_limit_algorithm == "token_bucket":
+        return InMemoryTokenBucketBackend()
+    return InMemorySlidingWindowBackend()
@@ -0,0 +1,103 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+from core.rate_limiting.base import (
+    RateLimit,
+    RateLimitResult,
+    sliding_window_estimate,
+    sliding_window_result,
+)
+
+
+@dataclass(slots=True)
+class _Window:
+    index: int
+    current: int
+    previous: int
+    expires_at: float
+
+
+@dataclass(slots=True)
+class _Bucket:
+    tokens: float
+    updated_at: float
+    expires_at: float
+
+
+V = TypeVar("V", _Window, _Bucket)
+
+
+# Entries are kept in least-recently-hit order, so idle keys are evicted from
+# the front without scanning the whole table.
+class _ExpiringTable(Generic[V]):
+    def __init__(self, max_keys: int) -> None:
+        self.entries: OrderedDict[str, V] = OrderedDict()
+        self.max_keys = max_keys
+
+    def get(self, key: str) -> V | None:
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, entry: V) -> None:
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+
+    def evict(self, now: float) -> None:
+        while self.entries:
+            _, oldest = next(iter(self.entries.items()))
+            if oldest.expires_at > now and len(self.entries) <= self.max_keys:
+                break
+            self.entries.popitem(last=False)
+
+
+class InMemorySlidingWindowBackend:
+    def __init__(self, max_keys: int = 100_000) -> None:
+        self.windows: _ExpiringTable[_Window] = _ExpiringTable(max_keys)
+
+    async def hit(self, key: str, limit: RateLimit) -> RateLimitResult:
+        now = time.monotonic()
+        index = int(now // limit.window_s)
+        window = self.windows.get(key)
+
+        if window is None or index - window.index > 1:
+            window = _Window(index, 0, 0, 0)
+        elif index - window.index == 1:
+            window = _Window(index, 0, window.current, 0)
+        window.expires_at = (index + 2) * limit.window_s
+        self.windows.put(key, window)
+        self.windows.evict(now)
+
+        estimate = sliding_window_estimate(window.previous, window.current, limit, now)
+        result = sliding_window_result(estimate, limit, now)
+        if result.allowed:
+            window.current += 1
+        return result
+
+
+class InMemoryTokenBucketBackend:
+    def __init__(self, max_keys: int = 100_000) -> None:
+        self.buckets: _ExpiringTable[_Bucket] = _ExpiringTable(max_keys)
+
+    async def hit(self, key: str, limit: RateLimit) -> RateLimitResult:
+        now = time.monotonic()
+        rate = limit.requests / limit.window_s
+        bucket = self.buckets.get(key)
+
+        if bucket is None:
+            bucket = _Bucket(limit.requests, now, 0)
+        else:
+            elapsed = now - bucket.updated_at
+            bucket.tokens = min(limit.requests, bucket.tokens + elapsed * rate)
+            bucket.updated_at = now
+        # A bucket idle for a whole window is full again, same as a new one.
+        bucket.expires_at = now + limit.window_s
+        self.buckets.put(key, bucket)
+        self.buckets.evict(now)
+
+        if bucket.tokens < 1:
+            return RateLimitResult(False, 0, (1 - bucket.tokens) / rate)
+        bucket.tokens -= 1
+        return RateLimitResult(True, int(bucket.tokens), 0)
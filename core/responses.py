@@ -0,0 +1,11 @@
+from typing import Any
+import orjson
+from pydantic_core import to_jsonable_python
+from starlette.responses import JSONResponse
+
+
+# Serializes pydantic models (including ones built with model_construct) with
+# orjson; returned directly, it skips FastAPI's response_model revalidation.
+class ORJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=to_jsonable_python)
@@ -0,0 +1,152 @@
+from functools import lru_cache
+from typing import Annotated, Literal
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_file=".env", env_file_encoding="utf-8", extra="ignore"
+    )
+
+    database_url: Annotated[
+        str, Field(description="SQLAlchemy URL of the (sync) database")
+    ] = "sqlite:///./database.db"
+    database_async: Annotated[
+        bool, Field(description="Serve requests through the async database driver")
+    ] = False
+    database_pool_size: Annotated[
+        int, Field(ge=1, description="Connections kept open per worker process")
+    ] = 5
+    database_max_overflow: Annotated[
+        int, Field(ge=0, description="Extra connections allowed above the pool size")
+    ] = 10
+    database_pool_timeout: Annotated[
+        float, Field(gt=0, description="Seconds to wait for a free pooled connection")
+    ] = 30
+    database_pool_pre_ping: Annotated[
+        bool, Field(description="Test connections for liveness on checkout")
+    ] = True
+    database_pool_recycle: Annotated[
+        int, Field(description="Seconds after which connections are replaced (-1 off)")
+    ] = 1800
+    database_statement_timeout_ms: Annotated[
+        int,
+        Field(
+            ge=0,
+            description="Per-statement timeout; busy timeout on SQLite (0 disables)",
+        ),
+    ] = 30000
+
+    sqlite_journal_mode: Annotated[
+        Literal["delete", "truncate", "persist", "memory", "wal", "off"],
+        Field(description="SQLite journal mode; WAL lets readers run during writes"),
+    ] = "wal"
+    sqlite_synchronous: Annotated[
+        Literal["off", "normal", "full", "extra"],
+        Field(description="SQLite fsync policy; NORMAL is durable enough under WAL"),
+    ] = "normal"
+    sqlite_cache_size: Annotated[
+        int, Field(description="SQLite page cache (pages, or KiB when negative)")
+    ] = -64000
+    sqlite_mmap_size: Annotated[
+        int, Field(ge=0, description="Bytes of the SQLite file to memory-map")
+    ] = 268435456
+    sqlite_temp_store: Annotated[
+        Literal["default", "file", "memory"],
+        Field(description="Where SQLite keeps temporary tables and indices"),
+    ] = "memory"
+    sqlite_foreign_keys: Annotated[
+        bool, Field(description="Enforce foreign key constraints on SQLite")
+    ] = True
+    sqlite_maintenance_interval_s: Annotated[
+        int,
+        Field(
+            ge=0,
+            description="Seconds between WAL checkpoint/optimize runs (0 disables)",
+        ),
+    ] = 300
+
+    reference_cache_ttl_s: Annotated[
+        float,
+        Field(ge=0, description="Seconds property/concept lookups stay cached"),
+    ] = 60
+    reference_cache_max_entries: Annotated[
+        int, Field(ge=1, description="Maximum cached property/concept lookups")
+    ] = 1024
+
+    log_level: Annotated[
+        Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        Field(description="Minimum level of the application logs"),
+    ] = "INFO"
+    log_format: Annotated[
+        Literal["json", "text"],
+        Field(description="One JSON object per line, or the human readable format"),
+    ] = "json"
+    log_payload_sample_rate: Annotated[
+        float,
+        Field(ge=0, le=1, description="Share of log records that keep their payload"),
+    ] = 1.0
+    log_payload_max_length: Annotated[
+        int,
+        Field(ge=0, description="Characters a logged payload is cut to (0 disables)"),
+    ] = 2048
+
+    slow_query_threshold_ms: Annotated[
+        float,
+        Field(ge=0, description="Log statements slower than this (0 disables)"),
+    ] = 200
+    slow_query_explain: Annotated[
+        bool, Field(description="Attach the query plan to slow query logs")
+    ] = True
+    slow_query_plan_ttl_s: Annotated[
+        float, Field(gt=0, description="Seconds a captured query plan is reused")
+    ] = 3600
+
+    profiling_token: Annotated[
+        str | None,
+        Field(description="Requests sending it in the profiling header are profiled"),
+    ] = None
+    profiling_header: Annotated[
+        str, Field(description="Header carrying the profiling token")
+    ] = "X-Profile-Token"
+    profiling_dir: Annotated[
+        str, Field(description="Directory of the HTML reports of profiled requests")
+    ] = "./profiles"
+    profiling_interval_s: Annotated[
+        float, Field(gt=0, description="Sampling interval of the profiler")
+    ] = 0.001
+
+    rate_limit_backend: Annotated[
+        Literal["memory", "sqlite", "redis"],
+        Field(description="Where rate limit counters live; shared stores span workers"),
+    ] = "memory"
+    rate_limit_algorithm: Annotated[
+        Literal["sliding_window", "token_bucket"],
+        Field(description="Algorithm of the in-memory backend"),
+    ] = "sliding_window"
+    rate_limit_requests_per_minute: Annotated[
+        int, Field(ge=1, description="Default requests per minute per client")
+    ] = 100
+    rate_limit_routes: Annotated[
+        dict[str, int],
+        Field(description="Requests per minute per path prefix, e.g. bulk imports"),
+    ] = {}
+    rate_limit_keys: Annotated[
+        dict[str, int], Field(description="Requests per minute per client key")
+    ] = {}
+    rate_limit_key_header: Annotated[
+        str | None,
+        Field(description="Header identifying the client instead of its address"),
+    ] = None
+    rate_limit_sqlite_path: Annotated[
+        str, Field(description="SQLite file shared by the workers' rate limiters")
+    ] = "./rate_limits.db"
+    rate_limit_redis_url: Annotated[
+        str, Field(description="Redis (or compatible) URL of the rate limit store")
+    ] = "redis://localhost:6379/0"
+
+
+@lru_cache
+def get_settings() -> Settings:
+    return Settings()
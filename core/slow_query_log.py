@@ -0,0 +1,99 @@
+from typing import Any
+from sqlalchemy.engine import Connection
+from core.cache import TTLCache
+from core.logging.logger_with_correlation_id import CorrelationLoggerAdapter
+
+EXPLAIN_PREFIXES = {"sqlite": "EXPLAIN QUERY PLAN ", "postgresql": "EXPLAIN "}
+EXPLAINED_STATEMENTS = {"SELECT", "WITH", "UPDATE", "DELETE"}
+# Dialects where a failed statement aborts the whole transaction.
+SAVEPOINT_DIALECTS = {"postgresql"}
+SAVEPOINT_NAME = "slow_query_explain"
+PLAN_NAMESPACE = "plan"
+MAX_PARAMS_LENGTH = 500
+
+
+class SlowQueryLog:
+    def __init__(
+        self,
+        threshold_ms: float,
+        logger: CorrelationLoggerAdapter,
+        explain: bool = True,
+        plan_ttl_s: float = 3600,
+    ) -> None:
+        self.threshold_s = threshold_ms / 1000
+        self.logger = logger
+        self.explain = explain
+        # Plans are cached per distinct SQL text, so a hot slow query is only
+        # explained again once its entry expires and the data may have grown.
+        self.plan_cache = TTLCache(max_entries=256, ttl_s=plan_ttl_s)
+
+    def record(
+        self,
+        conn: Connection,
+        statement: str,
+        parameters: Any,
+        executemany: bool,
+        statement_type: str,
+        elapsed_s: float,
+    ) -> None:
+        if elapsed_s < self.threshold_s:
+            return
+
+        plan = None
+        if self.explain and not executemany and statement_type in EXPLAINED_STATEMENTS:
+            plan = self.plan(conn, statement, parameters)
+
+        params = repr(parameters)
+        if len(params) > MAX_PARAMS_LENGTH:
+            params = params[:MAX_PARAMS_LENGTH] + "..."
+
+        self.logger.warning(
+            "Slow query (%.1f ms): %s\n  params: %s%s",
+            elapsed_s * 1000,
+            statement,
+            params,
+            "".join(f"\n  plan: {line}" for line in plan or ()),
+            extra={
+                "sql": statement,
+                "params": params,
+                "duration_ms": round(elapsed_s * 1000, 3),
+                "plan": plan,
+            },
+        )
+
+    def plan(
+        self, conn: Connection, statement: str, parameters: Any
+    ) -> list[str] | None:
+        prefix = EXPLAIN_PREFIXES.get(conn.dialect.name)
+        if prefix is None:
+            return None
+
+        # The plan is read through a raw DBAPI cursor on the same connection,
+        # so it sees the same transaction and does not re-enter these hooks.
+        # Where an error would abort that transaction, the EXPLAIN runs in a
+        # savepoint that is rolled back if it fails.
+        savepoint = conn.dialect.name in SAVEPOINT_DIALECTS
+
+        def explain() -> list[str]:
+            cursor = conn.connection.cursor()
+            try:
+                if savepoint:
+                    cursor.execute(f"SAVEPOINT {SAVEPOINT_NAME}")
+                try:
+                    cursor.execute(prefix + statement, parameters)
+                    return [str(row[-1]) for row in cursor.fetchall()]
+                except Exception:
+                    if savepoint:
+                        cursor.execute(f"ROLLBACK TO SAVEPOINT {SAVEPOINT_NAME}")
+                    raise
+                finally:
+                    if savepoint:
+                        cursor.execute(f"RELEASE SAVEPOINT {SAVEPOINT_NAME}")
+            finally:
+                cursor.close()
+
+        try:
+            return self.plan_cache.get_or_load(PLAN_NAMESPACE, statement, explain)
+        except Exception:
+            self.logger.debug("Could not explain slow query", exc_info=True)
+            return None
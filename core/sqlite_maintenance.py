@@ -0,0 +1,36 @@
+import asyncio
+from typing import Literal
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from starlette.concurrency import run_in_threadpool
+from core.logging.logger_with_correlation_id import CorrelationLoggerAdapter
+
+
+Checkpoint = Literal["PASSIVE", "TRUNCATE"]
+
+
+# PASSIVE copies what it can from the WAL without waiting on readers or
+# blocking writers, so it is safe to run while serving. TRUNCATE also waits for
+# them to reset the WAL file, so it is only run once traffic has stopped.
+def run_sqlite_maintenance(engine: Engine, checkpoint: Checkpoint = "PASSIVE") -> None:
+    with engine.connect() as connection:
+        connection.exec_driver_sql(f"PRAGMA wal_checkpoint({checkpoint})")
+        connection.exec_driver_sql("PRAGMA optimize")
+
+
+async def sqlite_maintenance(
+    engine: Engine, logger: CorrelationLoggerAdapter, checkpoint: Checkpoint = "PASSIVE"
+) -> None:
+    try:
+        await run_in_threadpool(run_sqlite_maintenance, engine, checkpoint)
+        logger.debug("SQLite maintenance completed", extra={"checkpoint": checkpoint})
+    except SQLAlchemyError:
+        logger.exception("SQLite maintenance failed", extra={"checkpoint": checkpoint})
+
+
+async def sqlite_maintenance_loop(
+    engine: Engine, interval_s: float, logger: CorrelationLoggerAdapter
+) -> None:
+    while True:
+        await asyncio.sleep(interval_s)
+        await sqlite_maintenance(engine, logger)
@@ -1,22 +1,135 @@
 from __future__ import annotations
 
-from typing import Iterator
-from sqlalchemy import create_engine
+from typing import Any, Iterator
+from sqlalchemy import create_engine, event, make_url
 from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from core.logging.logger_with_correlation_id import get_logger
+from core.metrics import instrument_engine
+from core.slow_query_log import SlowQueryLog
+from core.settings import Settings, get_settings
 
 
-SQLALCHEMY_DB_URL = "sqlite:///./database.db"
+settings = get_settings()
+
+SQLALCHEMY_DB_URL = settings.database_url
+
+# Route handlers use the AsyncSession when enabled, otherwise the blocking
+# Session in the threadpool.
+DATABASE_ASYNC = settings.database_async
+
+ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+
+
+def to_async_url(url: str) -> str:
+    sync_url = make_url(url)
+    backend = sync_url.get_backend_name()
+    async_driver = ASYNC_DRIVERS.get(backend)
+    if async_driver is None:
+        raise ValueError(
+            f"DATABASE_ASYNC is not supported for the {backend!r} backend, "
+            f"only for {', '.join(ASYNC_DRIVERS)}"
+        )
+    return sync_url.set(drivername=async_driver).render_as_string(hide_password=False)
+
+
+def engine_options(url: str, settings: Settings, is_async: bool) -> dict[str, Any]:
+    db_url = make_url(url)
+    backend = db_url.get_backend_name()
+    timeout_ms = settings.database_statement_timeout_ms
+    options: dict[str, Any] = {
+        "pool_pre_ping": settings.database_pool_pre_ping,
+        "pool_recycle": settings.database_pool_recycle,
+    }
+    connect_args: dict[str, Any] = {}
+
+    if backend == "sqlite":
+        # The busy timeout is applied with the rest of the pragma profile.
+        connect_args["check_same_thread"] = False
+        # In-memory databases live in a single connection, so there is no
+        # pool to size.
+        if db_url.database in (None, "", ":memory:"):
+            return {**options, "connect_args": connect_args}
+    elif backend == "postgresql" and timeout_ms:
+        if is_async:
+            connect_args["server_settings"] = {"statement_timeout": str(timeout_ms)}
+        else:
+            connect_args["options"] = f"-c statement_timeout={timeout_ms}"
+
+    return {
+        **options,
+        "connect_args": connect_args,
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow,
+        "pool_timeout": settings.database_pool_timeout,
+    }
+
+
+def sqlite_pragmas(settings: Settings) -> dict[str, str | int]:
+    return {
+        "journal_mode": settings.sqlite_journal_mode,
+        "synchronous": settings.sqlite_synchronous,
+        "busy_timeout": settings.database_statement_timeout_ms,
+        "cache_size": settings.sqlite_cache_size,
+        "mmap_size": settings.sqlite_mmap_size,
+        "temp_store": settings.sqlite_temp_store,
+        "foreign_keys": "ON" if settings.sqlite_foreign_keys else "OFF",
+    }
+
+
+def apply_sqlite_pragmas(engine: Engine, pragmas: dict[str, str | int]) -> None:
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection: Any, _: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
 
 engine: Engine = create_engine(
-    SQLALCHEMY_DB_URL,
-    connect_args={"check_same_thread": False},
+    SQLALCHEMY_DB_URL, **engine_options(SQLALCHEMY_DB_URL, settings, is_async=False)
 )
 
 SessionLocal: sessionmaker[Session] = sessionmaker(
     bind=engine, autoflush=False, autocommit=False
 )
 
+if engine.dialect.name == "sqlite":
+    apply_sqlite_pragmas(engine, sqlite_pragmas(settings))
+
+slow_query_log = (
+    SlowQueryLog(
+        settings.slow_query_threshold_ms,
+        get_logger("sql.slow_query"),
+        explain=settings.slow_query_explain,
+        plan_ttl_s=settings.slow_query_plan_ttl_s,
+    )
+    if settings.slow_query_threshold_ms
+    else None
+)
+instrument_engine(engine, slow_query_log)
+
+AsyncSessionLocal: async_sessionmaker[AsyncSession] = async_sessionmaker(
+    autoflush=False, autocommit=False, expire_on_commit=True
+)
+
+# Only built when enabled, so backends without an async driver keep working
+# with the blocking Session.
+async_engine: AsyncEngine | None = None
+if DATABASE_ASYNC:
+    async_engine = create_async_engine(
+        to_async_url(SQLALCHEMY_DB_URL),
+        **engine_options(SQLALCHEMY_DB_URL, settings, is_async=True),
+    )
+    if engine.dialect.name == "sqlite":
+        apply_sqlite_pragmas(async_engine.sync_engine, sqlite_pragmas(settings))
+    instrument_engine(async_engine.sync_engine, slow_query_log)
+    AsyncSessionLocal.configure(bind=async_engine)
+
 
 class Base(DeclarativeBase):
     pass
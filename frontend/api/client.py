@@ -1,19 +1,137 @@
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
 import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from urllib3.util.retry import Retry
 
 API_URL = "http://localhost:8000/api/v1"
 
+# (connect, read) timeouts in seconds
+TIMEOUT = (3.05, 30)
+CACHE_TTL_S = 60
+MAX_WORKERS = 8
+ETAG_CACHE_MAX_ENTRIES = 256
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    # urllib3 only retries idempotent methods by default, so a POST is never
+    # replayed after the server may have applied it.
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+    adapter = HTTPAdapter(
+        pool_connections=1, pool_maxsize=MAX_WORKERS, max_retries=retry
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Keep-alive connections shared by every call, rerun and fetch thread.
+_session = _build_session()
+
+# ETag and body of the last 200 per URL, least recently used first; a 304
+# reuses the stored body. Bounded, as every page and sort of a listing is a
+# URL of its own, and shared by the fetch threads.
+_etag_cache: OrderedDict[str, tuple[str, bytes]] = OrderedDict()
+_etag_lock = threading.Lock()
+
 
 def get(path):
-    return requests.get(f"{API_URL}{path}")
+    return _session.get(f"{API_URL}{path}", timeout=TIMEOUT)
 
 
 def post(path, data):
-    return requests.post(f"{API_URL}{path}", json=data)
+    return _invalidate_on_success(
+        path, _session.post(f"{API_URL}{path}", json=data, timeout=TIMEOUT)
+    )
 
 
 def put(path, data):
-    return requests.put(f"{API_URL}{path}", json=data)
+    return _invalidate_on_success(
+        path, _session.put(f"{API_URL}{path}", json=data, timeout=TIMEOUT)
+    )
 
 
 def delete(path):
-    return requests.delete(f"{API_URL}{path}")
+    return _invalidate_on_success(
+        path, _session.delete(f"{API_URL}{path}", timeout=TIMEOUT)
+    )
+
+
+# Failed requests raise so that st.cache_data does not keep them for the TTL.
+@st.cache_data(ttl=CACHE_TTL_S, show_spinner=False)
+def _cached_json(path: str) -> Any:
+    url = f"{API_URL}{path}"
+    with _etag_lock:
+        cached = _etag_cache.get(url)
+    headers = {"If-None-Match": cached[0]} if cached else {}
+
+    response = _session.get(url, headers=headers, timeout=TIMEOUT)
+    if response.status_code == 304 and cached:
+        with _etag_lock:
+            if url in _etag_cache:
+                _etag_cache.move_to_end(url)
+        return json.loads(cached[1])
+
+    response.raise_for_status()
+    data = response.json()
+    etag = response.headers.get("ETag")
+    if etag:
+        with _etag_lock:
+            _etag_cache[url] = (etag, response.content)
+            _etag_cache.move_to_end(url)
+            if len(_etag_cache) > ETAG_CACHE_MAX_ENTRIES:
+                _etag_cache.popitem(last=False)
+    return data
+
+
+def fetch_json(path: str, default: Any = None) -> Any:
+    try:
+        return _cached_json(path)
+    except requests.RequestException:
+        return default
+
+
+# Runs independent calls on worker threads, so a page waits for the slowest
+# request instead of the sum of all of them. Workers inherit the script run
+# context that st.cache_data and the other Streamlit APIs rely on.
+def fetch_concurrently(*calls: Callable[[], Any]) -> list[Any]:
+    ctx = get_script_run_ctx()
+
+    def run(call: Callable[[], Any]) -> Any:
+        add_script_run_ctx(ctx=ctx)
+        return call()
+
+    with ThreadPoolExecutor(max_workers=min(len(calls), MAX_WORKERS)) as pool:
+        return list(pool.map(run, calls))
+
+
+def fetch_all(*paths: str) -> list[Any]:
+    return fetch_concurrently(*(lambda path=path: fetch_json(path) for path in paths))
+
+
+def _resource(path: str) -> str:
+    return path.lstrip("/").split("?", 1)[0].split("/", 1)[0]
+
+
+# Cached bodies may embed the written rows, so they are all dropped. Stored
+# ETags stay valid to send, as the server tells which ones changed, except
+# those of the written resource, which certainly did.
+def _invalidate_on_success(path: str, response: requests.Response) -> requests.Response:
+    if response.ok:
+        _cached_json.clear()
+        resource = _resource(path)
+        with _etag_lock:
+            for url in [
+                url
+                for url in _etag_cache
+                if _resource(url.removeprefix(API_URL)) == resource
+            ]:
+                del _etag_cache[url]
+    return response
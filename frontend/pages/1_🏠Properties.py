@@ -1,13 +1,12 @@
 import streamlit as st
 from streamlit import column_config as cc
-from api.client import get, post, delete, put
+from api.client import fetch_json, post, delete, put
 
 st.set_page_config(page_title="Properties", page_icon="🏠", layout="wide")
 st.title("Properties")
 
 # Data fetch
-list_properties_response = get("/property")
-properties = list_properties_response.json() if list_properties_response.ok else []
+properties = fetch_json("/property", [])
 
 # Lookups / Select options
 property_by_id_lookup = {t["id"]: t for t in properties} if properties else {}
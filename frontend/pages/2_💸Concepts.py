@@ -1,13 +1,12 @@
 import streamlit as st
 from streamlit import column_config as cc
-from api.client import get, post, delete, put
+from api.client import fetch_json, post, delete, put
 
 st.set_page_config(page_title="Concepts", page_icon="💸", layout="wide")
 st.title("Concepts")
 
 # Data fetch
-list_concepts_response = get("/concept")
-concepts = list_concepts_response.json() if list_concepts_response.ok else []
+concepts = fetch_json("/concept", [])
 
 # Lookups / Select options
 concept_by_id_lookup = {t["id"]: t for t in concepts} if concepts else {}
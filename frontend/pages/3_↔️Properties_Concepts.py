@@ -1,6 +1,6 @@
 import streamlit as st
 from streamlit import column_config as cc
-from api.client import get, post, delete, put
+from api.client import fetch_json, post, delete, put
 
 st.set_page_config(page_title="Properties Concepts", page_icon="↔️", layout="wide")
 st.title("Properties Concepts")
@@ -8,12 +8,7 @@ st.title("Properties Concepts")
 # Utility functions
 
 # Data fetch
-list_properties_concepts_response = get("/properties-concepts/get-combos")
-properties_concepts = (
-    list_properties_concepts_response.json()
-    if list_properties_concepts_response.ok
-    else []
-)
+properties_concepts = fetch_json("/properties-concepts/get-combos", [])
 
 # Lookups / Select options
 properties_concepts_by_id_lookup = (
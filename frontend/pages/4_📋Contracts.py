@@ -1,7 +1,7 @@
 from datetime import date, datetime
 import streamlit as st
 from streamlit import column_config as cc
-from api.client import get, post, delete, put
+from api.client import fetch_all, post, delete, put
 
 st.set_page_config(page_title="Contracts", page_icon="📋", layout="wide")
 st.title("Contracts")
@@ -13,11 +13,9 @@ def validate_contract_dates(start_date: date, end_date: date):
 
 
 # Data fetch
-list_contracts_response = get("/contract")
-contracts = list_contracts_response.json() if list_contracts_response.ok else []
-
-list_properties_response = get("/property")
-properties = list_properties_response.json() if list_properties_response.ok else []
+contracts, properties = fetch_all("/contract", "/property")
+contracts = contracts or []
+properties = properties or []
 
 # Lookups / Select options
 contract_by_id_lookup = {c["id"]: c for c in contracts} if contracts else {}
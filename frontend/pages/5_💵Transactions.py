@@ -1,7 +1,7 @@
 from datetime import datetime
 import streamlit as st
 from streamlit import column_config as cc
-from api.client import get, post, delete, put
+from api.client import fetch_all, fetch_json, post, delete, put
 
 st.set_page_config(page_title="Transactions", page_icon="💵", layout="wide")
 st.title("Transactions")
@@ -20,27 +20,40 @@ def validate_period(period_input: None | str):
 
 
 # Data fetch
-list_transactions_response = get("/transaction")
-transactions = (
-    list_transactions_response.json() if list_transactions_response.ok else []
-)
+view_sort_lookup = {
+    "Date": "date",
+    "ID": "id",
+    "Amount": "amount",
+    "Period": "period",
+    "Transaction Type": "transaction_type",
+    "Property": "property",
+    "Concept": "concept",
+}
+view_order_lookup = {"Descending": "desc", "Ascending": "asc"}
 
-list_properties_concepts_response = get("/properties-concepts/get-combos")
-properties_concepts = (
-    list_properties_concepts_response.json()
-    if list_properties_concepts_response.ok
-    else []
+# The table controls are drawn below the editor but the page they select is
+# needed now; Streamlit keeps widget values in session_state across reruns.
+view_sort = st.session_state.get("view_sort", "Date")
+view_order = st.session_state.get("view_order", "Descending")
+view_page = st.session_state.get("view_page", 1)
+view_page_size = st.session_state.get("view_page_size", 50)
+
+transactions_view, properties_concepts = fetch_all(
+    f"/transaction/view?sort={view_sort_lookup[view_sort]}"
+    f"&order={view_order_lookup[view_order]}"
+    f"&page={view_page}&page_size={view_page_size}",
+    "/properties-concepts/lookup",
 )
+transactions = transactions_view["items"] if transactions_view else []
 
 # Lookups / Select options
-transaction_by_id_lookup = {t["id"]: t for t in transactions} if transactions else {}
 properties_concepts_lookup = {
-    f"{pc.get('property', {}).get('location', 'Unknown location')} - {(pc.get('concept') or {}).get('name', 'Unknown concept')}": pc.get(
-        "id"
-    )
-    for pc in (properties_concepts or [])
+    label: properties_concepts_id
+    for properties_concepts_id, label in (properties_concepts or [])
 }
 transaction_type_lookup = {"Income": "income", "Expense": "expense"}
+# Update and delete take any transaction id, not only the rows of this page.
+default_id = transactions[0]["id"] if transactions else 1
 
 
 with st.expander("➕ Create / ✏️ Update / ❌ Delete Transactions", expanded=False):
@@ -110,11 +123,14 @@ with st.expander("➕ Create / ✏️ Update / ❌ Delete Transactions", expande
     with col2:
         st.subheader("Update Transaction")
 
-        ids = list(transaction_by_id_lookup.keys())
-        selected_id = st.selectbox("Select Transaction ID to Update", ids)
+        selected_id = st.number_input(
+            "Transaction ID to Update", min_value=1, step=1, value=default_id
+        )
+        tx = fetch_json(f"/transaction/{selected_id}")
 
-        if selected_id:
-            tx = transaction_by_id_lookup[selected_id]
+        if not tx:
+            st.info(f"Transaction {selected_id} not found")
+        else:
             properties_concepts_index = 0
             transaction_type_index = 0
 
@@ -182,7 +198,13 @@ with st.expander("➕ Create / ✏️ Update / ❌ Delete Transactions", expande
     with col3:
         st.subheader("Delete Transaction")
 
-        id_to_delete = st.selectbox("Pick ID to delete", ids, key="delete_id")
+        id_to_delete = st.number_input(
+            "Transaction ID to delete",
+            min_value=1,
+            step=1,
+            value=default_id,
+            key="delete_id",
+        )
 
         if st.button("Delete"):
             resp = delete(f"/transaction/{id_to_delete}")
@@ -195,26 +217,39 @@ with st.expander("➕ Create / ✏️ Update / ❌ Delete Transactions", expande
 # Table
 st.subheader("📄 All Transactions")
 
-reversed_properties_concepts_combo: dict[int, str] = {
-    pc_id: label for label, pc_id in properties_concepts_lookup.items()
-}
-reversed_transaction_type_combo = {v: k for k, v in transaction_type_lookup.items()}
+
+def reset_view_page():
+    st.session_state["view_page"] = 1
+
+
+sort_col, order_col, size_col, page_col = st.columns(4)
+with sort_col:
+    st.selectbox(
+        "Sort by", view_sort_lookup.keys(), key="view_sort", on_change=reset_view_page
+    )
+with order_col:
+    st.selectbox(
+        "Order", view_order_lookup.keys(), key="view_order", on_change=reset_view_page
+    )
+with size_col:
+    st.selectbox(
+        "Rows per page",
+        [25, 50, 100, 250, 500],
+        index=1,
+        key="view_page_size",
+        on_change=reset_view_page,
+    )
+with page_col:
+    st.number_input("Page", min_value=1, step=1, key="view_page")
+
+if transactions_view:
+    total_pages = max(1, -(-transactions_view["total"] // view_page_size))
+    st.caption(
+        f"{transactions_view['total']} transactions, page {view_page} of {total_pages}"
+    )
 
 transactions_display = [
-    {
-        **{
-            key: value
-            for key, value in tx.items()
-            if key not in ("properties_concepts_id", "transaction_type")
-        },
-        "property_concept": reversed_properties_concepts_combo.get(
-            tx.get("properties_concepts_id"), "Unknown"
-        ),
-        "transaction_type": reversed_transaction_type_combo.get(
-            tx.get("transaction_type"), "Unknown"
-        ),
-    }
-    for tx in (transactions or [])
+    {**tx, "transaction_type": tx["transaction_type_label"]} for tx in transactions
 ]
 
 if transactions_display:
@@ -238,5 +273,7 @@ if transactions_display:
             "amount",
         ],
     )
+elif transactions_view:
+    st.info("No Transactions on this page")
 else:
     st.error("Could not load Transactions")
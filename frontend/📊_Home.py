@@ -55,7 +55,7 @@
 
 import streamlit as st
 from streamlit import column_config as cc
-from api.client import get
+from api.client import fetch_all
 
 # -------------------------------------------------
 # Page Config
@@ -79,23 +79,8 @@ st.markdown(
 
 st.markdown("---")
 
-# Balance section
-balance_res = get("/transaction/balance")
-balance = balance_res.json().get("balance") if balance_res.ok else 0
-
-st.subheader("💰 Transactions Balance")
-color = "green" if balance >= 0 else "red"
-st.markdown(
-    f"""
-    <div style="padding:12px; border-radius:8px; background:#f7f7f7;">
-        <p style="margin:0; color:#666;">Current Balance</p>
-        <h2 style="margin:0; color:{color};">
-            ${balance:,.2f}
-        </h2>
-    </div>
-    """,
-    unsafe_allow_html=True,
-)
+# Balance section, filled in once the page data arrives
+balance_section = st.container()
 
 st.markdown("---")
 
@@ -108,10 +93,27 @@ months_to_check = st.selectbox(
     index=11,
 )
 
-contracts_res = get(f"/contract/ending-in/{months_to_check}")
-contracts = contracts_res.json() if contracts_res.ok else []
-properties_res = get("/property")
-properties = properties_res.json() if properties_res.ok else []
+balance_res, contracts, properties = fetch_all(
+    "/transaction/balance", f"/contract/ending-in/{months_to_check}", "/property"
+)
+balance = balance_res.get("balance") if balance_res else 0
+contracts = contracts or []
+properties = properties or []
+
+with balance_section:
+    st.subheader("💰 Transactions Balance")
+    color = "green" if balance >= 0 else "red"
+    st.markdown(
+        f"""
+        <div style="padding:12px; border-radius:8px; background:#f7f7f7;">
+            <p style="margin:0; color:#666;">Current Balance</p>
+            <h2 style="margin:0; color:{color};">
+                ${balance:,.2f}
+            </h2>
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
 
 
 property_lookup = {p["id"]: p["location"] for p in properties}
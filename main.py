@@ -1,26 +1,72 @@
-from fastapi import Depends, FastAPI
+import asyncio
+import re
+from contextlib import asynccontextmanager, suppress
+from pathlib import Path
+from typing import Any, AsyncIterator
+from fastapi import Depends, FastAPI, HTTPException, Response, status
+from fastapi.responses import FileResponse
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import text
 from sqlalchemy.orm import Session
+from core.cache import reference_cache
+from core.dependencies.profiling import require_profiling_token
 from core.logging.logger_with_correlation_id import get_logger
 from core.logging.logging_config import setup_logging
+from core.metrics import render_metrics
 from core.middlewares.correlation import CorrelationIdMiddleware
+from core.middlewares.metrics import MetricsMiddleware
+from core.middlewares.profiling import (
+    REPORT_ID_PATTERN,
+    REPORTS_PATH,
+    ProfilingMiddleware,
+)
 from core.middlewares.rate_limiter import RateLimiterMiddleware
+from core.rate_limiting.factory import build_rate_limiter_backend
+from core.sqlite_maintenance import sqlite_maintenance, sqlite_maintenance_loop
 
-from database import get_db
+from database import engine, get_db, settings
 from api.v1.routes.concept import router as concept_router
 from api.v1.routes.contract import router as contract_router
 from api.v1.routes.properties_concepts import router as properties_concepts_router
 from api.v1.routes.property import router as property_router
+from api.v1.routes.report import router as report_router
 from api.v1.routes.transaction import router as transaction_router
 
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    maintenance = None
+    if engine.dialect.name == "sqlite" and settings.sqlite_maintenance_interval_s:
+        maintenance = asyncio.create_task(
+            sqlite_maintenance_loop(
+                engine, settings.sqlite_maintenance_interval_s, get_logger("app")
+            )
+        )
+    yield
+    if maintenance:
+        maintenance.cancel()
+        with suppress(asyncio.CancelledError):
+            await maintenance
+        await sqlite_maintenance(engine, get_logger("app"), "TRUNCATE")
+
+
 app = FastAPI(
     title="Real Estate Tracker",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 setup_logging()
-app.add_middleware(CorrelationIdMiddleware)
+# Only installed when a token is configured, so unprofiled deployments do not
+# pay even the header check. Innermost, to name reports by correlation id.
+if settings.profiling_token:
+    app.add_middleware(
+        ProfilingMiddleware,
+        token=settings.profiling_token,
+        header=settings.profiling_header,
+        output_dir=settings.profiling_dir,
+        interval_s=settings.profiling_interval_s,
+    )
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -28,7 +74,19 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
-app.add_middleware(RateLimiterMiddleware, requests_per_minute=100)
+app.add_middleware(
+    RateLimiterMiddleware,
+    backend=build_rate_limiter_backend(settings),
+    requests_per_minute=settings.rate_limit_requests_per_minute,
+    route_limits=settings.rate_limit_routes,
+    key_limits=settings.rate_limit_keys,
+    key_header=settings.rate_limit_key_header,
+)
+# Outside the rate limiter and CORS, so 429s and preflight responses are
+# counted too, and inside CorrelationIdMiddleware so request logs carry the
+# correlation id.
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(CorrelationIdMiddleware)
 
 
 API_V1_PREFIX = "/api/v1"
@@ -37,6 +95,7 @@ routers_v1 = [
     contract_router,
     properties_concepts_router,
     property_router,
+    report_router,
     transaction_router,
 ]
 
@@ -60,6 +119,32 @@ def db_healthcheck(db: Session = Depends(get_db)) -> dict[str, str]:
         return {"status": "error"}
 
 
+@app.get("/health/cache", tags=["Monitoring"])
+def cache_stats() -> dict[str, Any]:
+    return reference_cache.snapshot()
+
+
+@app.get("/metrics", tags=["Monitoring"], include_in_schema=False)
+def metrics() -> Response:
+    content, media_type = render_metrics()
+    return Response(content=content, media_type=media_type)
+
+
+@app.get(
+    REPORTS_PATH + "{report_id}",
+    tags=["Monitoring"],
+    include_in_schema=False,
+    dependencies=[Depends(require_profiling_token)],
+)
+def profile_report(report_id: str) -> FileResponse:
+    path = Path(settings.profiling_dir) / f"{report_id}.html"
+    if not re.fullmatch(REPORT_ID_PATTERN, report_id) or not path.is_file():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Profile report not found"
+        )
+    return FileResponse(path, media_type="text/html")
+
+
 @app.get("/version", tags=["Meta"])
 def version() -> dict[str, str]:
     return {"version": app.version}
@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Integer, Numeric, String, UniqueConstraint
+from database import Base
+
+
+class Balance(Base):
+    __tablename__ = "balances"
+    __table_args__ = (UniqueConstraint("scope", "scope_key"),)
+
+    id = Column(Integer, primary_key=True)
+    scope = Column(String, nullable=False)
+    scope_key = Column(String, nullable=False)
+    income = Column(Numeric(19, 2), nullable=False, default=0)
+    expense = Column(Numeric(19, 2), nullable=False, default=0)
@@ -1,9 +1,10 @@
-from sqlalchemy import Column, Date, ForeignKey, Integer, String
+from sqlalchemy import Column, Date, ForeignKey, Index, Integer, String
 from database import Base
 
 
 class Contract(Base):
     __tablename__ = "contracts"
+    __table_args__ = (Index("ix_contracts_end_date", "end_date"),)
 
     id = Column(Integer, primary_key=True)
     property_id = Column(
@@ -1,10 +1,18 @@
 from sqlalchemy.orm import relationship
-from sqlalchemy import Boolean, Column, ForeignKey, Integer
+from sqlalchemy import Boolean, Column, ForeignKey, Index, Integer
 from database import Base
 
 
 class PropertiesConcepts(Base):
     __tablename__ = "properties_concepts"
+    __table_args__ = (
+        Index(
+            "uq_properties_concepts_property_id_concept_id",
+            "property_id",
+            "concept_id",
+            unique=True,
+        ),
+    )
 
     id = Column(Integer, primary_key=True)
     concept_id = Column(Integer, ForeignKey("concepts.id"), nullable=False)
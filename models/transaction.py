@@ -1,9 +1,17 @@
-from sqlalchemy import Column, Date, ForeignKey, Integer, Numeric, String
+from sqlalchemy import Column, Date, ForeignKey, Index, Integer, Numeric, String
 from database import Base
 
 
 class Transaction(Base):
     __tablename__ = "transactions"
+    __table_args__ = (
+        Index(
+            "ix_transactions_properties_concepts_id_period",
+            "properties_concepts_id",
+            "period",
+        ),
+        Index("ix_transactions_date", "date"),
+    )
 
     id = Column(Integer, primary_key=True)
     date = Column(Date, nullable=False)
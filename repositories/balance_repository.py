@@ -0,0 +1,211 @@
+from collections import defaultdict
+from decimal import Decimal
+from typing import Any, Sequence
+from sqlalchemy import String, case, cast, delete, func, insert, literal, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from models.balance import Balance
+from models.properties_concepts import PropertiesConcepts
+from models.transaction import Transaction
+
+GLOBAL_SCOPE = "global"
+PROPERTY_SCOPE = "property"
+CONCEPT_SCOPE = "concept"
+PERIOD_SCOPE = "period"
+
+
+# Writes are only executed on the session; the caller's commit or rollback
+# applies them atomically together with the transaction change.
+class BalanceRepository:
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def get_balance(self, scope: str = GLOBAL_SCOPE, scope_key: str = "") -> float:
+        row = self.db.execute(
+            select(Balance.income - Balance.expense).where(
+                Balance.scope == scope, Balance.scope_key == scope_key
+            )
+        ).scalar()
+        return float(row or 0.0)
+
+    def apply(self, transaction: Transaction, sign: int) -> None:
+        self.apply_many([transaction], sign)
+
+    def apply_many(self, transactions: Sequence[Any], sign: int) -> None:
+        combo_ids = {t.properties_concepts_id for t in transactions}
+        combos = {
+            row.id: row
+            for row in self.db.execute(
+                select(
+                    PropertiesConcepts.id,
+                    PropertiesConcepts.property_id,
+                    PropertiesConcepts.concept_id,
+                ).where(PropertiesConcepts.id.in_(combo_ids))
+            )
+        }
+
+        deltas: dict[tuple[str, str], list[Decimal]] = defaultdict(
+            lambda: [Decimal(0), Decimal(0)]
+        )
+        for t in transactions:
+            income, expense = self._split(t.transaction_type, t.amount, sign)
+            for scope_key in self._scope_keys(
+                t.period, combos.get(t.properties_concepts_id)
+            ):
+                deltas[scope_key][0] += income
+                deltas[scope_key][1] += expense
+
+        self._add_many(deltas)
+
+    def move_combo(
+        self,
+        properties_concepts_id: int,
+        old: tuple[int, int],
+        new: tuple[int, int],
+    ) -> None:
+        if old == new:
+            return
+
+        sums = self.db.execute(
+            select(*self._sums()).where(
+                Transaction.properties_concepts_id == properties_concepts_id
+            )
+        ).one()
+        income, expense = (Decimal(str(value)) for value in sums)
+
+        old_property_id, old_concept_id = old
+        new_property_id, new_concept_id = new
+        self._add(
+            [
+                (PROPERTY_SCOPE, str(old_property_id)),
+                (CONCEPT_SCOPE, str(old_concept_id)),
+            ],
+            -income,
+            -expense,
+        )
+        self._add(
+            [
+                (PROPERTY_SCOPE, str(new_property_id)),
+                (CONCEPT_SCOPE, str(new_concept_id)),
+            ],
+            income,
+            expense,
+        )
+
+    def rebuild(self) -> None:
+        columns = ["scope", "scope_key", "income", "expense"]
+        joined = select(Transaction).join(
+            PropertiesConcepts,
+            PropertiesConcepts.id == Transaction.properties_concepts_id,
+        )
+
+        self.db.execute(delete(Balance))
+        self.db.execute(
+            insert(Balance).from_select(
+                columns, select(literal(GLOBAL_SCOPE), literal(""), *self._sums())
+            )
+        )
+        self.db.execute(
+            insert(Balance).from_select(
+                columns,
+                joined.with_only_columns(
+                    literal(PROPERTY_SCOPE),
+                    cast(PropertiesConcepts.property_id, String),
+                    *self._sums(),
+                ).group_by(PropertiesConcepts.property_id),
+            )
+        )
+        self.db.execute(
+            insert(Balance).from_select(
+                columns,
+                joined.with_only_columns(
+                    literal(CONCEPT_SCOPE),
+                    cast(PropertiesConcepts.concept_id, String),
+                    *self._sums(),
+                ).group_by(PropertiesConcepts.concept_id),
+            )
+        )
+        self.db.execute(
+            insert(Balance).from_select(
+                columns,
+                select(
+                    literal(PERIOD_SCOPE), Transaction.period, *self._sums()
+                ).group_by(Transaction.period),
+            )
+        )
+
+    def _add(
+        self, scope_keys: list[tuple[str, str]], income: Decimal, expense: Decimal
+    ) -> None:
+        self._add_many({scope_key: [income, expense] for scope_key in scope_keys})
+
+    def _add_many(self, deltas: dict[tuple[str, str], list[Decimal]]) -> None:
+        if not deltas:
+            return
+
+        insert_stmt: Any = (
+            postgresql.insert(Balance)
+            if self.db.get_bind().dialect.name == "postgresql"
+            else sqlite.insert(Balance)
+        )
+        stmt = insert_stmt.on_conflict_do_update(
+            index_elements=[Balance.scope, Balance.scope_key],
+            set_={
+                "income": Balance.income + insert_stmt.excluded.income,
+                "expense": Balance.expense + insert_stmt.excluded.expense,
+            },
+        )
+        self.db.execute(
+            stmt,
+            [
+                {
+                    "scope": scope,
+                    "scope_key": scope_key,
+                    "income": income,
+                    "expense": expense,
+                }
+                for (scope, scope_key), (income, expense) in deltas.items()
+            ],
+        )
+
+    @staticmethod
+    def _scope_keys(period: Any, combo: Any) -> list[tuple[str, str]]:
+        scope_keys = [(GLOBAL_SCOPE, ""), (PERIOD_SCOPE, str(period))]
+        if combo:
+            scope_keys.append((PROPERTY_SCOPE, str(combo.property_id)))
+            scope_keys.append((CONCEPT_SCOPE, str(combo.concept_id)))
+        return scope_keys
+
+    @staticmethod
+    def _split(
+        transaction_type: Any, amount: Any, sign: int
+    ) -> tuple[Decimal, Decimal]:
+        value = Decimal(amount) * sign
+        if transaction_type == "income":
+            return value, Decimal(0)
+        if transaction_type == "expense":
+            return Decimal(0), value
+        return Decimal(0), Decimal(0)
+
+    @staticmethod
+    def _sums() -> tuple[Any, Any]:
+        return (
+            func.coalesce(
+                func.sum(
+                    case(
+                        (Transaction.transaction_type == "income", Transaction.amount),
+                        else_=0,
+                    )
+                ),
+                0,
+            ),
+            func.coalesce(
+                func.sum(
+                    case(
+                        (Transaction.transaction_type == "expense", Transaction.amount),
+                        else_=0,
+                    )
+                ),
+                0,
+            ),
+        )
@@ -1,11 +1,26 @@
 from typing import Any, Iterable, TypeVar, Generic
 from pydantic import BaseModel
+from sqlalchemy import Column, Row, select
+from sqlalchemy.orm import Session
 
 T = TypeVar("T", bound=BaseModel)
 
+DEPENDENTS_SAMPLE_SIZE = 5
+
+
+# "contracts 3; properties_concepts 1, 2, 3, 4, 5, ..." for error messages.
+def describe_dependents(dependents: dict[str, list[int]]) -> str:
+    return "; ".join(
+        f"{table} "
+        + ", ".join(map(str, ids[:DEPENDENTS_SAMPLE_SIZE]))
+        + (", ..." if len(ids) > DEPENDENTS_SAMPLE_SIZE else "")
+        for table, ids in dependents.items()
+    )
+
 
 class BaseRepository(Generic[T]):
     dto_model: type[T]
+    db: Session
 
     def to_dto(self, orm_obj: Any) -> T:
         dto = self.dto_model.model_validate(orm_obj)
@@ -13,3 +28,30 @@ class BaseRepository(Generic[T]):
 
     def to_dto_list(self, orm_list: Iterable[Any]) -> list[T]:
         return [self.to_dto(o) for o in orm_list]
+
+    # Trusted read path: rows selected from our own tables were validated when
+    # written, so the DTOs are built without running the field validators.
+    def row_to_dto(self, row: Row[Any]) -> T:
+        return self.dto_model.model_construct(**row._mapping)
+
+    def rows_to_dto_list(self, rows: Iterable[Row[Any]]) -> list[T]:
+        construct = self.dto_model.model_construct
+        return [construct(**row._mapping) for row in rows]
+
+    # Ids of the rows still referencing a row through each foreign key column,
+    # per table, so a delete the foreign keys would reject can name them.
+    def get_dependents(
+        self, references: Iterable[tuple[Column[int], int]]
+    ) -> dict[str, list[int]]:
+        dependents = {}
+        for column, value in references:
+            table = column.table
+            ids = self.db.scalars(
+                select(table.c.id)
+                .where(column == value)
+                .order_by(table.c.id)
+                .limit(DEPENDENTS_SAMPLE_SIZE + 1)
+            ).all()
+            if ids:
+                dependents[table.name] = list(ids)
+        return dependents
@@ -1,33 +1,49 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from models.concept import Concept
+from models.properties_concepts import PropertiesConcepts
 from repositories.base_repository import BaseRepository
+from repositories.table_version_repository import TableVersionRepository
 from schemas.concept import ConceptResponse, CreateConcept, UpdateConcept
 
 
+RESPONSE_COLUMNS = (
+    Concept.id,
+    Concept.name,
+    Concept.is_ordinary,
+    Concept.periodicity,
+    Concept.description,
+)
+
+
 class ConceptRepository(BaseRepository[ConceptResponse]):
     dto_model = ConceptResponse
 
     def __init__(self, db: Session) -> None:
         self.db = db
+        self.versions = TableVersionRepository(db)
 
     def get_by_id(self, concept_id: int) -> None | ConceptResponse:
-        result = self.db.get(Concept, concept_id)
+        result = self.db.execute(
+            select(*RESPONSE_COLUMNS).where(Concept.id == concept_id)
+        ).first()
 
         if not result:
             return None
 
-        return self.to_dto(result)
+        return self.row_to_dto(result)
 
     def get_all(self) -> list[ConceptResponse]:
-        results = self.db.query(Concept).all()
-        return self.to_dto_list(results)
+        results = self.db.execute(select(*RESPONSE_COLUMNS))
+        return self.rows_to_dto_list(results)
 
     def create(self, concept: CreateConcept) -> ConceptResponse:
         new_concept = Concept(**concept.model_dump())
 
         try:
             self.db.add(new_concept)
+            self.versions.bump(Concept.__tablename__)
             self.db.commit()
             self.db.refresh(new_concept)
 
@@ -44,20 +60,28 @@ class ConceptRepository(BaseRepository[ConceptResponse]):
                 setattr(db_concept, key, value)
 
             try:
+                self.versions.bump(Concept.__tablename__)
                 self.db.commit()
                 self.db.refresh(db_concept)
             except SQLAlchemyError:
                 self.db.rollback()
         return self.to_dto(db_concept)
 
+    def get_dependents_of(self, concept_id: int) -> dict[str, list[int]]:
+        return self.get_dependents([(PropertiesConcepts.concept_id, concept_id)])
+
     def delete(self, concept_id: int) -> bool:
         db_concept = self.db.get(Concept, concept_id)
 
         if db_concept:
             try:
                 self.db.delete(db_concept)
+                self.versions.bump(Concept.__tablename__)
                 self.db.commit()
                 return True
+            except IntegrityError:
+                self.db.rollback()
+                raise
             except SQLAlchemyError:
                 self.db.rollback()
                 return False
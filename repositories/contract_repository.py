@@ -1,39 +1,54 @@
-from sqlalchemy import func
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 from models.contract import Contract
 from repositories.base_repository import BaseRepository
+from repositories.table_version_repository import TableVersionRepository
 from schemas.contract import ContractResponse, CreateContract, UpdateContract
 from sqlalchemy.exc import SQLAlchemyError
 
 
+RESPONSE_COLUMNS = (
+    Contract.id,
+    Contract.property_id,
+    Contract.start_date,
+    Contract.end_date,
+    Contract.details,
+)
+
+
 class ContractRepository(BaseRepository[ContractResponse]):
     dto_model = ContractResponse
 
     def __init__(self, db: Session) -> None:
         self.db = db
+        self.versions = TableVersionRepository(db)
 
     def get_by_id(self, contract_id: int) -> None | ContractResponse:
-        result = self.db.get(Contract, contract_id)
+        result = self.db.execute(
+            select(*RESPONSE_COLUMNS).where(Contract.id == contract_id)
+        ).first()
 
         if not result:
             return None
 
-        return self.to_dto(result)
+        return self.row_to_dto(result)
 
     def get_all(self) -> list[ContractResponse]:
-        results = self.db.query(Contract).all()
-        return self.to_dto_list(results)
+        results = self.db.execute(select(*RESPONSE_COLUMNS))
+        return self.rows_to_dto_list(results)
 
     def create(self, contract: CreateContract) -> ContractResponse:
         new_contract = Contract(**contract.model_dump())
 
         try:
             self.db.add(new_contract)
+            self.versions.bump(Contract.__tablename__)
             self.db.commit()
             self.db.refresh(new_contract)
 
         except SQLAlchemyError:
             self.db.rollback()
+            raise
 
         return self.to_dto(new_contract)
 
@@ -45,10 +60,12 @@ class ContractRepository(BaseRepository[ContractResponse]):
                 setattr(db_contract, key, value)
 
             try:
+                self.versions.bump(Contract.__tablename__)
                 self.db.commit()
                 self.db.refresh(db_contract)
             except SQLAlchemyError:
                 self.db.rollback()
+                raise
         return self.to_dto(db_contract)
 
     def delete(self, contract_id: int) -> bool:
@@ -57,6 +74,7 @@ class ContractRepository(BaseRepository[ContractResponse]):
         if db_contract:
             try:
                 self.db.delete(db_contract)
+                self.versions.bump(Contract.__tablename__)
                 self.db.commit()
                 return True
             except SQLAlchemyError:
@@ -68,13 +86,12 @@ class ContractRepository(BaseRepository[ContractResponse]):
         if months <= 0:
             raise ValueError("Months must be > 0")
 
-        results = (
-            self.db.query(Contract)
-            .filter(
+        results = self.db.execute(
+            select(*RESPONSE_COLUMNS)
+            .where(
                 Contract.end_date >= func.date("now"),
                 Contract.end_date <= func.date("now", f"+{months} months"),
             )
             .order_by(Contract.end_date.asc())
-            .all()
         )
-        return self.to_dto_list(results)
+        return self.rows_to_dto_list(results)
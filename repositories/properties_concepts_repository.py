@@ -1,12 +1,39 @@
-from sqlalchemy.orm import Session, joinedload
+from typing import Any, Iterable, cast
+from sqlalchemy import ColumnElement, Row, Select, func, select
+from sqlalchemy.orm import Session
+from models.concept import Concept
 from models.properties_concepts import PropertiesConcepts
+from models.property import Property
+from models.transaction import Transaction
+from repositories.balance_repository import BalanceRepository
 from repositories.base_repository import BaseRepository
+from repositories.concept_repository import RESPONSE_COLUMNS as CONCEPT_COLUMNS
+from repositories.property_repository import RESPONSE_COLUMNS as PROPERTY_COLUMNS
+from repositories.table_version_repository import TableVersionRepository
+from schemas.concept import ConceptResponse
 from schemas.properties_concepts import (
     CreatePropertiesConcepts,
     PropertiesConceptsResponse,
     UpdatePropertiesConcepts,
 )
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from schemas.property import PropertyResponse
+
+RESPONSE_COLUMNS = (
+    PropertiesConcepts.id,
+    PropertiesConcepts.concept_id,
+    PropertiesConcepts.property_id,
+    PropertiesConcepts.enabled,
+)
+
+
+# "location - concept" label of a combo; needs Property and Concept joined.
+def combo_label() -> ColumnElement[str]:
+    return (
+        func.coalesce(Property.location, "Unknown location")
+        + " - "
+        + func.coalesce(Concept.name, "Unknown concept")
+    )
 
 
 class PropertiesConceptsRepository(BaseRepository[PropertiesConceptsResponse]):
@@ -14,28 +41,93 @@ class PropertiesConceptsRepository(BaseRepository[PropertiesConceptsResponse]):
 
     def __init__(self, db: Session) -> None:
         self.db = db
+        self.versions = TableVersionRepository(db)
 
     def get_by_id(
         self, properties_concepts_id: int
     ) -> None | PropertiesConceptsResponse:
-        result = self.db.get(PropertiesConcepts, properties_concepts_id)
+        result = self.db.execute(
+            self.select_with_navigations().where(
+                PropertiesConcepts.id == properties_concepts_id
+            )
+        ).first()
 
         if not result:
             return None
 
-        return self.to_dto(result)
+        return self.row_to_dto(result)
 
     def get_all(self) -> list[PropertiesConceptsResponse]:
-        results = self.db.query(PropertiesConcepts).all()
-        return self.to_dto_list(results)
+        return self.get_with_navigations()
+
+    def get_existing_ids(self, properties_concepts_ids: Iterable[int]) -> set[int]:
+        results = self.db.scalars(
+            select(PropertiesConcepts.id).where(
+                PropertiesConcepts.id.in_(set(properties_concepts_ids))
+            )
+        )
+        return set(results)
+
+    def get_id_by_pair(self, property_id: int, concept_id: int) -> None | int:
+        return self.db.scalar(
+            select(PropertiesConcepts.id).where(
+                PropertiesConcepts.property_id == property_id,
+                PropertiesConcepts.concept_id == concept_id,
+            )
+        )
 
     def get_with_navigations(self) -> list[PropertiesConceptsResponse]:
-        results = self.db.query(PropertiesConcepts).options(
-            joinedload(PropertiesConcepts.concept),
-            joinedload(PropertiesConcepts.property),
+        results = self.db.execute(self.select_with_navigations())
+        return self.rows_to_dto_list(results)
+
+    def get_lookup(self, enabled_only: bool = False) -> list[tuple[int, str]]:
+        label = combo_label().label("label")
+        stmt = (
+            select(PropertiesConcepts.id, label)
+            .outerjoin(Concept, Concept.id == PropertiesConcepts.concept_id)
+            .outerjoin(Property, Property.id == PropertiesConcepts.property_id)
+            .order_by(label)
+        )
+        if enabled_only:
+            stmt = stmt.where(PropertiesConcepts.enabled.is_(True))
+
+        return [(row.id, row.label) for row in self.db.execute(stmt)]
+
+    # Responses embed the related concept and property, selected in the same
+    # query under "concept__" / "property__" prefixed labels.
+    @staticmethod
+    def select_with_navigations() -> Select[Any]:
+        return (
+            select(
+                *RESPONSE_COLUMNS,
+                *(c.label(f"concept__{c.key}") for c in CONCEPT_COLUMNS),
+                *(c.label(f"property__{c.key}") for c in PROPERTY_COLUMNS),
+            )
+            .outerjoin(Concept, Concept.id == PropertiesConcepts.concept_id)
+            .outerjoin(Property, Property.id == PropertiesConcepts.property_id)
+        )
+
+    def row_to_dto(self, row: Row[Any]) -> PropertiesConceptsResponse:
+        values = row._mapping
+        concept = property = None
+        if values["concept__id"] is not None:
+            concept = ConceptResponse.model_construct(
+                **{c.key: values[f"concept__{c.key}"] for c in CONCEPT_COLUMNS}
+            )
+        if values["property__id"] is not None:
+            property = PropertyResponse.model_construct(
+                **{c.key: values[f"property__{c.key}"] for c in PROPERTY_COLUMNS}
+            )
+        return self.dto_model.model_construct(
+            **{c.key: values[c.key] for c in RESPONSE_COLUMNS},
+            concept=concept,
+            property=property,
         )
 
-        return self.to_dto_list(results)
+    def rows_to_dto_list(
+        self, rows: Iterable[Row[Any]]
+    ) -> list[PropertiesConceptsResponse]:
+        return [self.row_to_dto(row) for row in rows]
 
     def create(
         self, properties_concepts: CreatePropertiesConcepts
@@ -44,11 +136,13 @@ class PropertiesConceptsRepository(BaseRepository[PropertiesConceptsResponse]):
 
         try:
             self.db.add(new_properties_concepts)
+            self.versions.bump(PropertiesConcepts.__tablename__)
             self.db.commit()
             self.db.refresh(new_properties_concepts)
 
         except SQLAlchemyError:
             self.db.rollback()
+            raise
 
         return self.to_dto(new_properties_concepts)
 
@@ -58,24 +152,44 @@ class PropertiesConceptsRepository(BaseRepository[PropertiesConceptsResponse]):
         db_properties_concepts = self.db.get(PropertiesConcepts, properties_concepts_id)
 
         if db_properties_concepts:
+            old_keys = cast(
+                tuple[int, int],
+                (db_properties_concepts.property_id, db_properties_concepts.concept_id),
+            )
             for key, value in propertiesConcepts.model_dump().items():
                 setattr(db_properties_concepts, key, value)
 
             try:
+                BalanceRepository(self.db).move_combo(
+                    properties_concepts_id,
+                    old_keys,
+                    (propertiesConcepts.property_id, propertiesConcepts.concept_id),
+                )
+                self.versions.bump(PropertiesConcepts.__tablename__)
                 self.db.commit()
                 self.db.refresh(db_properties_concepts)
             except SQLAlchemyError:
                 self.db.rollback()
+                raise
         return self.to_dto(db_properties_concepts)
 
+    def get_dependents_of(self, properties_concepts_id: int) -> dict[str, list[int]]:
+        return self.get_dependents(
+            [(Transaction.properties_concepts_id, properties_concepts_id)]
+        )
+
     def delete(self, properties_concepts_id: int) -> bool:
         db_properties_concepts = self.db.get(PropertiesConcepts, properties_concepts_id)
 
         if db_properties_concepts:
             try:
                 self.db.delete(db_properties_concepts)
+                self.versions.bump(PropertiesConcepts.__tablename__)
                 self.db.commit()
                 return True
+            except IntegrityError:
+                self.db.rollback()
+                raise
             except SQLAlchemyError:
                 self.db.rollback()
                 return False
@@ -1,8 +1,21 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from models.contract import Contract
+from models.properties_concepts import PropertiesConcepts
 from models.property import Property
 from repositories.base_repository import BaseRepository
+from repositories.table_version_repository import TableVersionRepository
 from schemas.property import CreateProperty, PropertyResponse, UpdateProperty
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+
+RESPONSE_COLUMNS = (
+    Property.id,
+    Property.location,
+    Property.area,
+    Property.valuation,
+    Property.details,
+)
 
 
 class PropertyRepository(BaseRepository[PropertyResponse]):
@@ -10,24 +23,28 @@ class PropertyRepository(BaseRepository[PropertyResponse]):
 
     def __init__(self, db: Session) -> None:
         self.db = db
+        self.versions = TableVersionRepository(db)
 
     def get_by_id(self, property_id: int) -> None | PropertyResponse:
-        result = self.db.get(Property, property_id)
+        result = self.db.execute(
+            select(*RESPONSE_COLUMNS).where(Property.id == property_id)
+        ).first()
 
         if not result:
             return None
 
-        return self.to_dto(result)
+        return self.row_to_dto(result)
 
     def get_all(self) -> list[PropertyResponse]:
-        results = self.db.query(Property).all()
-        return self.to_dto_list(results)
+        results = self.db.execute(select(*RESPONSE_COLUMNS))
+        return self.rows_to_dto_list(results)
 
     def create(self, property: CreateProperty) -> PropertyResponse:
         new_property = Property(**property.model_dump())
 
         try:
             self.db.add(new_property)
+            self.versions.bump(Property.__tablename__)
             self.db.commit()
             self.db.refresh(new_property)
 
@@ -44,20 +61,33 @@ class PropertyRepository(BaseRepository[PropertyResponse]):
                 setattr(db_property, key, value)
 
             try:
+                self.versions.bump(Property.__tablename__)
                 self.db.commit()
                 self.db.refresh(db_property)
             except SQLAlchemyError:
                 self.db.rollback()
         return self.to_dto(db_property)
 
+    def get_dependents_of(self, property_id: int) -> dict[str, list[int]]:
+        return self.get_dependents(
+            [
+                (Contract.property_id, property_id),
+                (PropertiesConcepts.property_id, property_id),
+            ]
+        )
+
     def delete(self, property_id: int) -> bool:
         db_property = self.db.get(Property, property_id)
 
         if db_property:
             try:
                 self.db.delete(db_property)
+                self.versions.bump(Property.__tablename__)
                 self.db.commit()
                 return True
+            except IntegrityError:
+                self.db.rollback()
+                raise
             except SQLAlchemyError:
                 self.db.rollback()
                 return False
@@ -0,0 +1,160 @@
+from typing import Any
+from sqlalchemy import (
+    CTE,
+    Date,
+    Integer,
+    Select,
+    String,
+    and_,
+    case,
+    cast,
+    exists,
+    func,
+    insert,
+    literal,
+    select,
+    true,
+)
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from models.concept import Concept
+from models.properties_concepts import PropertiesConcepts
+from models.transaction import Transaction
+from repositories.balance_repository import BalanceRepository
+from repositories.table_version_repository import TableVersionRepository
+
+
+def period_to_month_index(period: str) -> int:
+    return int(period[:4]) * 12 + int(period[5:7]) - 1
+
+
+class RecurrenceRepository:
+    def __init__(self, db: Session) -> None:
+        self.db = db
+        self.versions = TableVersionRepository(db)
+
+    def months(self, start_index: int, end_index: int) -> CTE:
+        months = select(literal(start_index).label("month_index")).cte(
+            "months", recursive=True
+        )
+        return months.union_all(
+            select(months.c.month_index + 1).where(months.c.month_index < end_index)
+        )
+
+    def period_label(self, month_index: Any) -> Any:
+        month = month_index % 12 + 1
+        return (
+            cast(month_index // 12, String)
+            .concat("-")
+            .concat(case((month < 10, "0"), else_=""))
+            .concat(cast(month, String))
+        )
+
+    def month_index_of(self, period: Any) -> Any:
+        return (
+            cast(func.substr(period, 1, 4), Integer) * 12
+            + cast(func.substr(period, 6, 2), Integer)
+            - 1
+        )
+
+    # A concept with periodicity N is due every N months counting from the
+    # latest period recorded for each combo, so combos without transactions
+    # have no schedule yet.
+    def due_periods(self, start_index: int, end_index: int) -> Select[Any]:
+        months = self.months(start_index, end_index)
+        anchors = (
+            select(
+                Transaction.properties_concepts_id,
+                func.max(Transaction.period).label("last_period"),
+            )
+            .group_by(Transaction.properties_concepts_id)
+            .subquery("anchors")
+        )
+        return (
+            select(
+                PropertiesConcepts.id.label("properties_concepts_id"),
+                self.period_label(months.c.month_index).label("period"),
+            )
+            .join(Concept, Concept.id == PropertiesConcepts.concept_id)
+            .join(anchors, anchors.c.properties_concepts_id == PropertiesConcepts.id)
+            .join(months, true())
+            .where(
+                PropertiesConcepts.enabled.is_(True),
+                Concept.periodicity > 0,
+                (months.c.month_index - self.month_index_of(anchors.c.last_period))
+                % Concept.periodicity
+                == 0,
+            )
+        )
+
+    def create_missing(self, start_index: int, end_index: int) -> int:
+        due = self.due_periods(start_index, end_index).subquery("due")
+        last = select(
+            Transaction.properties_concepts_id,
+            Transaction.transaction_type,
+            Transaction.amount,
+            func.row_number()
+            .over(
+                partition_by=Transaction.properties_concepts_id,
+                order_by=(Transaction.date.desc(), Transaction.id.desc()),
+            )
+            .label("position"),
+        ).subquery("last")
+
+        first_day = due.c.period.concat("-01")
+        due_date = (
+            cast(first_day, Date)
+            if self.db.get_bind().dialect.name == "postgresql"
+            else func.date(first_day, type_=Date)
+        )
+
+        stmt = (
+            insert(Transaction)
+            .from_select(
+                [
+                    "date",
+                    "properties_concepts_id",
+                    "transaction_type",
+                    "period",
+                    "amount",
+                ],
+                select(
+                    due_date,
+                    due.c.properties_concepts_id,
+                    last.c.transaction_type,
+                    due.c.period,
+                    last.c.amount,
+                )
+                .join(
+                    last,
+                    and_(
+                        last.c.properties_concepts_id == due.c.properties_concepts_id,
+                        last.c.position == 1,
+                    ),
+                )
+                .where(
+                    ~exists().where(
+                        Transaction.properties_concepts_id
+                        == due.c.properties_concepts_id,
+                        Transaction.period == due.c.period,
+                    )
+                ),
+            )
+            .returning(
+                Transaction.properties_concepts_id,
+                Transaction.transaction_type,
+                Transaction.period,
+                Transaction.amount,
+            )
+        )
+
+        try:
+            created = self.db.execute(stmt).all()
+            BalanceRepository(self.db).apply_many(created, 1)
+            self.versions.bump(Transaction.__tablename__)
+            self.db.commit()
+        except SQLAlchemyError:
+            self.db.rollback()
+            raise
+
+        return len(created)
@@ -0,0 +1,173 @@
+from typing import Any
+from sqlalchemy import (
+    Numeric,
+    case,
+    exists,
+    func,
+    literal,
+    null,
+    select,
+    type_coerce,
+    union_all,
+)
+from sqlalchemy.orm import Session
+from models.concept import Concept
+from models.properties_concepts import PropertiesConcepts
+from models.property import Property
+from models.transaction import Transaction
+from repositories.base_repository import BaseRepository
+from repositories.recurrence_repository import RecurrenceRepository
+from repositories.transaction_repository import TransactionRepository
+from schemas.report import ArrearsResponse, CashflowGroup, CashflowRow
+from schemas.transaction import TransactionFilters
+
+
+class ReportRepository(BaseRepository[ArrearsResponse]):
+    dto_model = ArrearsResponse
+
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def get_arrears(
+        self, start_index: int, end_index: int, current_period: str
+    ) -> list[ArrearsResponse]:
+        due = (
+            RecurrenceRepository(self.db)
+            .due_periods(start_index, end_index)
+            .subquery("due")
+        )
+        # Periods before a combo's first transaction predate its schedule.
+        first = (
+            select(
+                Transaction.properties_concepts_id,
+                func.min(Transaction.period).label("first_period"),
+            )
+            .group_by(Transaction.properties_concepts_id)
+            .subquery("first_periods")
+        )
+
+        results = self.db.execute(
+            select(
+                due.c.properties_concepts_id,
+                PropertiesConcepts.property_id,
+                Property.location.label("property_location"),
+                PropertiesConcepts.concept_id,
+                Concept.name.label("concept_name"),
+                due.c.period,
+                (due.c.period < current_period).label("overdue"),
+            )
+            .join(
+                PropertiesConcepts,
+                PropertiesConcepts.id == due.c.properties_concepts_id,
+            )
+            .join(Property, Property.id == PropertiesConcepts.property_id)
+            .join(Concept, Concept.id == PropertiesConcepts.concept_id)
+            .join(first, first.c.properties_concepts_id == due.c.properties_concepts_id)
+            .where(
+                due.c.period >= first.c.first_period,
+                ~exists().where(
+                    Transaction.properties_concepts_id == due.c.properties_concepts_id,
+                    Transaction.period == due.c.period,
+                ),
+            )
+            .order_by(due.c.period, Property.location, Concept.name)
+        ).all()
+
+        return self.to_dto_list(results)
+
+    def get_cashflow(
+        self, group_by: list[CashflowGroup], filters: TransactionFilters, rollup: bool
+    ) -> tuple[list[CashflowRow], CashflowRow]:
+        keys = self._group_keys()
+        income = type_coerce(
+            func.coalesce(
+                func.sum(
+                    case(
+                        (Transaction.transaction_type == "income", Transaction.amount),
+                        else_=0,
+                    )
+                ),
+                0,
+            ),
+            Numeric(19, 2),
+        )
+        expense = type_coerce(
+            func.coalesce(
+                func.sum(
+                    case(
+                        (Transaction.transaction_type == "expense", Transaction.amount),
+                        else_=0,
+                    )
+                ),
+                0,
+            ),
+            Numeric(19, 2),
+        )
+        conditions = TransactionRepository(self.db).filter_conditions(filters)
+
+        levels = range(len(group_by), -1, -1) if rollup else {len(group_by), 0}
+        selects = []
+        for level in levels:
+            grouped = [column for group in group_by[:level] for column in keys[group]]
+            grouped_names = {column.name for column in grouped}
+            columns = [
+                column if column.name in grouped_names else null().label(column.name)
+                for group in keys
+                for column in keys[group]
+            ]
+            selects.append(
+                select(
+                    literal(level).label("level"),
+                    *columns,
+                    income.label("income"),
+                    expense.label("expense"),
+                    (income - expense).label("net"),
+                )
+                .select_from(Transaction)
+                .outerjoin(
+                    PropertiesConcepts,
+                    PropertiesConcepts.id == Transaction.properties_concepts_id,
+                )
+                .outerjoin(Property, Property.id == PropertiesConcepts.property_id)
+                .outerjoin(Concept, Concept.id == PropertiesConcepts.concept_id)
+                .where(*conditions)
+                .group_by(*grouped)
+            )
+
+        rows = union_all(*selects).subquery("cashflow")
+        results = self.db.execute(
+            select(rows).order_by(
+                *(
+                    rows.c[column.name].nulls_last()
+                    for group in group_by
+                    for column in keys[group]
+                ),
+                rows.c.level.desc(),
+            )
+        ).all()
+
+        cashflow = [CashflowRow.model_validate(r) for r in results]
+        totals = next(row for row in cashflow if row.level == 0)
+        return [row for row in cashflow if row.level > 0], totals
+
+    def _group_keys(self) -> dict[CashflowGroup, list[Any]]:
+        if self.db.get_bind().dialect.name == "postgresql":
+            month = func.to_char(Transaction.date, "YYYY-MM")
+            year = func.to_char(Transaction.date, "YYYY")
+        else:
+            month = func.strftime("%Y-%m", Transaction.date)
+            year = func.strftime("%Y", Transaction.date)
+
+        return {
+            "property": [
+                PropertiesConcepts.property_id.label("property_id"),
+                Property.location.label("property_location"),
+            ],
+            "concept": [
+                PropertiesConcepts.concept_id.label("concept_id"),
+                Concept.name.label("concept_name"),
+            ],
+            "period": [Transaction.period.label("period")],
+            "month": [month.label("month")],
+            "year": [year.label("year")],
+        }
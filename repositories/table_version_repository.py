@@ -0,0 +1,36 @@
+from typing import Any, Sequence
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from models.table_version import TableVersion
+
+
+# Bumps are only executed on the session, so a version changes exactly when
+# the caller's write is committed.
+class TableVersionRepository:
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def get_versions(self, tables: Sequence[str]) -> dict[str, int]:
+        rows = self.db.execute(
+            select(TableVersion.table_name, TableVersion.version).where(
+                TableVersion.table_name.in_(tables)
+            )
+        )
+        versions = dict(rows.tuples().all())
+        return {table: versions.get(table, 0) for table in tables}
+
+    def get_version_key(self, tables: Sequence[str]) -> tuple[int, ...]:
+        return tuple(self.get_versions(tables).values())
+
+    def bump(self, *tables: str) -> None:
+        insert_stmt: Any = (
+            postgresql.insert(TableVersion)
+            if self.db.get_bind().dialect.name == "postgresql"
+            else sqlite.insert(TableVersion)
+        )
+        stmt = insert_stmt.on_conflict_do_update(
+            index_elements=[TableVersion.table_name],
+            set_={"version": TableVersion.version + 1},
+        )
+        self.db.execute(stmt, [{"table_name": t, "version": 1} for t in tables])
@@ -1,60 +1,225 @@
-from sqlalchemy import case, func
+from datetime import date
+from typing import Any, Iterator, Sequence
+from sqlalchemy import ColumnElement, Row, and_, case, func, insert, or_, select
 from sqlalchemy.orm import Session
+from models.concept import Concept
+from models.properties_concepts import PropertiesConcepts
+from models.property import Property
 from models.transaction import Transaction
+from repositories.balance_repository import GLOBAL_SCOPE, BalanceRepository
 from repositories.base_repository import BaseRepository
+from repositories.properties_concepts_repository import combo_label
+from repositories.table_version_repository import TableVersionRepository
 from schemas.transaction import (
     CreateTransaction,
+    TransactionFilters,
     TransactionResponse,
+    TransactionViewResponse,
+    TransactionViewSort,
     UpdateTransaction,
 )
 from sqlalchemy.exc import SQLAlchemyError
 
 
+RESPONSE_COLUMNS = (
+    Transaction.id,
+    Transaction.date,
+    Transaction.properties_concepts_id,
+    Transaction.transaction_type,
+    Transaction.period,
+    Transaction.amount,
+)
+
+VIEW_COLUMNS = (
+    *RESPONSE_COLUMNS,
+    case(
+        {"income": "Income", "expense": "Expense"},
+        value=Transaction.transaction_type,
+        else_="Unknown",
+    ).label("transaction_type_label"),
+    Property.location.label("property_location"),
+    Concept.name.label("concept_name"),
+    combo_label().label("property_concept"),
+)
+
+VIEW_SORT_COLUMNS: dict[str, ColumnElement[Any]] = {
+    "date": Transaction.date,
+    "id": Transaction.id,
+    "amount": Transaction.amount,
+    "period": Transaction.period,
+    "transaction_type": Transaction.transaction_type,
+    "property": Property.location,
+    "concept": Concept.name,
+}
+
+
 class TransactionRepository(BaseRepository[TransactionResponse]):
     dto_model = TransactionResponse
 
     def __init__(self, db: Session) -> None:
         self.db = db
+        self.versions = TableVersionRepository(db)
+        self.balances = BalanceRepository(db)
 
     def get_by_id(self, transaction_id: int) -> None | TransactionResponse:
-        result = self.db.get(Transaction, transaction_id)
+        result = self.db.execute(
+            select(*RESPONSE_COLUMNS).where(Transaction.id == transaction_id)
+        ).first()
 
         if not result:
             return None
 
-        return self.to_dto(result)
+        return self.row_to_dto(result)
 
     def get_all(self) -> list[TransactionResponse]:
-        results = self.db.query(Transaction).all()
-        return self.to_dto_list(results)
+        results = self.db.execute(select(*RESPONSE_COLUMNS))
+        return self.rows_to_dto_list(results)
+
+    def get_page(
+        self,
+        filters: TransactionFilters,
+        limit: int,
+        after: None | tuple[date, int] = None,
+    ) -> tuple[list[TransactionResponse], None | tuple[date, int]]:
+        stmt = select(*RESPONSE_COLUMNS).where(*self.filter_conditions(filters))
+
+        if after:
+            after_date, after_id = after
+            stmt = stmt.where(
+                or_(
+                    Transaction.date < after_date,
+                    and_(Transaction.date == after_date, Transaction.id < after_id),
+                )
+            )
+
+        results = self.db.execute(
+            stmt.order_by(Transaction.date.desc(), Transaction.id.desc()).limit(
+                limit + 1
+            )
+        ).all()
+
+        next_key = None
+        if len(results) > limit:
+            results = results[:limit]
+            next_key = (results[-1].date, results[-1].id)
+
+        return self.rows_to_dto_list(results), next_key
+
+    # Rows joined with their combo's property and concept, so clients render a
+    # page as is. Ties are broken by id to keep the offset pages stable.
+    def get_view_page(
+        self,
+        filters: TransactionFilters,
+        sort: TransactionViewSort,
+        descending: bool,
+        limit: int,
+        offset: int,
+    ) -> tuple[list[TransactionViewResponse], int]:
+        conditions = self.filter_conditions(filters)
+        total = self.db.scalar(
+            select(func.count()).select_from(Transaction).where(*conditions)
+        )
+
+        order_by = [VIEW_SORT_COLUMNS[sort], Transaction.id]
+        results = self.db.execute(
+            select(*VIEW_COLUMNS)
+            .outerjoin(
+                PropertiesConcepts,
+                PropertiesConcepts.id == Transaction.properties_concepts_id,
+            )
+            .outerjoin(Property, Property.id == PropertiesConcepts.property_id)
+            .outerjoin(Concept, Concept.id == PropertiesConcepts.concept_id)
+            .where(*conditions)
+            .order_by(*(c.desc() if descending else c.asc() for c in order_by))
+            .limit(limit)
+            .offset(offset)
+        )
+
+        construct = TransactionViewResponse.model_construct
+        return [construct(**row._mapping) for row in results], total or 0
+
+    def iter_batches(
+        self, filters: TransactionFilters, batch_size: int = 1000
+    ) -> Iterator[Sequence[Row[Any]]]:
+        stmt = (
+            select(*RESPONSE_COLUMNS)
+            .where(*self.filter_conditions(filters))
+            .order_by(Transaction.date.asc(), Transaction.id.asc())
+            .execution_options(yield_per=batch_size)
+        )
+
+        yield from self.db.execute(stmt).partitions()
+
+    def filter_conditions(
+        self, filters: TransactionFilters
+    ) -> list[ColumnElement[bool]]:
+        conditions: list[ColumnElement[bool]] = []
+
+        if filters.date_from:
+            conditions.append(Transaction.date >= filters.date_from)
+        if filters.date_to:
+            conditions.append(Transaction.date <= filters.date_to)
+        if filters.period:
+            conditions.append(Transaction.period == filters.period)
+        if filters.transaction_type:
+            conditions.append(Transaction.transaction_type == filters.transaction_type)
+        if filters.properties_concepts_id:
+            conditions.append(
+                Transaction.properties_concepts_id == filters.properties_concepts_id
+            )
+
+        return conditions
 
     def create(self, transaction: CreateTransaction) -> TransactionResponse:
         new_transaction = Transaction(**transaction.model_dump())
 
         try:
             self.db.add(new_transaction)
+            self.balances.apply(new_transaction, 1)
+            self.versions.bump(Transaction.__tablename__)
             self.db.commit()
             self.db.refresh(new_transaction)
 
         except SQLAlchemyError:
             self.db.rollback()
+            raise
 
         return self.to_dto(new_transaction)
 
+    def create_many(self, transactions: Sequence[CreateTransaction]) -> int:
+        # An empty parameter list would run a single insert of default values.
+        if not transactions:
+            return 0
+
+        try:
+            self.db.execute(insert(Transaction), [t.model_dump() for t in transactions])
+            self.balances.apply_many(transactions, 1)
+            self.versions.bump(Transaction.__tablename__)
+            self.db.commit()
+        except SQLAlchemyError:
+            self.db.rollback()
+            raise
+
+        return len(transactions)
+
     def update(
         self, transaction_id: int, transaction: UpdateTransaction
     ) -> TransactionResponse:
         db_transaction = self.db.get(Transaction, transaction_id)
 
         if db_transaction:
-            for key, value in transaction.model_dump().items():
-                setattr(db_transaction, key, value)
-
             try:
+                self.balances.apply(db_transaction, -1)
+                for key, value in transaction.model_dump().items():
+                    setattr(db_transaction, key, value)
+                self.balances.apply(db_transaction, 1)
+
+                self.versions.bump(Transaction.__tablename__)
                 self.db.commit()
                 self.db.refresh(db_transaction)
             except SQLAlchemyError:
                 self.db.rollback()
+                raise
         return self.to_dto(db_transaction)
 
     def delete(self, transaction_id: int) -> bool:
@@ -62,7 +227,9 @@ class TransactionRepository(BaseRepository[TransactionResponse]):
 
         if db_transaction:
             try:
+                self.balances.apply(db_transaction, -1)
                 self.db.delete(db_transaction)
+                self.versions.bump(Transaction.__tablename__)
                 self.db.commit()
                 return True
             except SQLAlchemyError:
@@ -70,26 +237,5 @@ class TransactionRepository(BaseRepository[TransactionResponse]):
                 return False
         return False
 
-    def get_balance(self) -> float:
-        try:
-            balance = self.db.query(
-                func.coalesce(
-                    func.sum(
-                        case(
-                            (
-                                Transaction.transaction_type == "income",
-                                Transaction.amount,
-                            ),
-                            (
-                                Transaction.transaction_type == "expense",
-                                -Transaction.amount,
-                            ),
-                            else_=0,
-                        )
-                    ),
-                    0,
-                )
-            ).scalar()
-            return float(balance or 0.0)
-        except SQLAlchemyError:
-            raise
+    def get_balance(self, scope: str = GLOBAL_SCOPE, scope_key: str = "") -> float:
+        return self.balances.get_balance(scope, scope_key)
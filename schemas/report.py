@@ -0,0 +1,65 @@
+from __future__ import annotations
+from decimal import Decimal
+from typing import Annotated, Literal
+from pydantic import BaseModel, Field, ConfigDict
+
+
+class ArrearsResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    properties_concepts_id: Annotated[
+        int, Field(ge=1, description="Id of the properties_concepts that is due")
+    ]
+    property_id: Annotated[int, Field(ge=1, description="Id of the Property")]
+    property_location: Annotated[str, Field(description="Property's adress")]
+    concept_id: Annotated[int, Field(ge=1, description="Id of the Concept")]
+    concept_name: Annotated[str, Field(description="Concept's name")]
+    period: Annotated[
+        str, Field(description="Period without a recorded Transaction (2026-01)")
+    ]
+    overdue: Annotated[
+        bool, Field(description="True if the period is before the current one")
+    ]
+
+
+CashflowGroup = Literal["property", "concept", "period", "month", "year"]
+
+
+class CashflowRow(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    level: Annotated[
+        int,
+        Field(
+            ge=0,
+            description=(
+                "Number of grouping keys of the row, lower levels are subtotals"
+            ),
+        ),
+    ]
+    property_id: Annotated[None | int, Field(default=None, description="Property id")]
+    property_location: Annotated[
+        None | str, Field(default=None, description="Property's adress")
+    ]
+    concept_id: Annotated[None | int, Field(default=None, description="Concept id")]
+    concept_name: Annotated[None | str, Field(default=None, description="Concept name")]
+    period: Annotated[
+        None | str, Field(default=None, description="Transaction period (2026-01)")
+    ]
+    month: Annotated[
+        None | str, Field(default=None, description="Transaction date month (2026-01)")
+    ]
+    year: Annotated[
+        None | str, Field(default=None, description="Transaction date year (2026)")
+    ]
+    income: Annotated[Decimal, Field(description="Sum of income transactions")]
+    expense: Annotated[Decimal, Field(description="Sum of expense transactions")]
+    net: Annotated[Decimal, Field(description="Income minus expense")]
+
+
+class CashflowResponse(BaseModel):
+    group_by: Annotated[
+        list[CashflowGroup], Field(description="Grouping keys, in order")
+    ]
+    rows: Annotated[list[CashflowRow], Field(description="One row per group")]
+    totals: Annotated[CashflowRow, Field(description="Totals of all the rows")]
@@ -2,7 +2,7 @@ from __future__ import annotations
 from datetime import date
 from decimal import Decimal
 import re
-from typing import Annotated
+from typing import Annotated, Literal
 from pydantic import BaseModel, Field, ConfigDict, field_validator
 
 
@@ -113,3 +113,86 @@ class TransactionResponse(TransactionBase):
 
 class TransactionsBalanceResponse(BaseModel):
     balance: float
+
+
+class TransactionFilters(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    date_from: Annotated[
+        None | date,
+        Field(default=None, description="Only transactions on or after this date"),
+    ]
+    date_to: Annotated[
+        None | date,
+        Field(default=None, description="Only transactions on or before this date"),
+    ]
+    period: Annotated[
+        None | str,
+        Field(
+            default=None,
+            pattern=r"^\d{4}-(0[1-9]|1[0-2])$",
+            description="Only transactions of this period (YYYY-MM)",
+        ),
+    ]
+    transaction_type: Annotated[
+        None | Literal["income", "expense"],
+        Field(default=None, description="Only 'income' or 'expense' transactions"),
+    ]
+    properties_concepts_id: Annotated[
+        None | int,
+        Field(default=None, ge=1, description="Only transactions of this combo"),
+    ]
+
+
+class TransactionPageResponse(BaseModel):
+    items: list[TransactionResponse]
+    next_cursor: Annotated[
+        None | str,
+        Field(description="Cursor for the next page, null when there are no more"),
+    ]
+
+
+TransactionViewSort = Literal[
+    "date", "id", "amount", "period", "transaction_type", "property", "concept"
+]
+
+
+class TransactionViewResponse(TransactionResponse):
+    transaction_type_label: Annotated[
+        str, Field(description="Display label of the type ('Income' or 'Expense')")
+    ]
+    property_location: Annotated[
+        None | str, Field(description="Location of the Transaction's property")
+    ]
+    concept_name: Annotated[
+        None | str, Field(description="Name of the Transaction's concept")
+    ]
+    property_concept: Annotated[
+        str, Field(description="'location - concept' label of the combo")
+    ]
+
+
+class TransactionViewPageResponse(BaseModel):
+    items: list[TransactionViewResponse]
+    total: Annotated[int, Field(ge=0, description="Rows matching the filters")]
+    page: Annotated[int, Field(ge=1, description="One-based page number")]
+    page_size: Annotated[int, Field(ge=1, description="Rows per page")]
+
+
+class BulkTransactionRowError(BaseModel):
+    index: Annotated[
+        int, Field(ge=0, description="Zero-based position of the row in the payload")
+    ]
+    errors: Annotated[list[str], Field(description="Validation errors of the row")]
+
+
+class BulkTransactionResponse(BaseModel):
+    created: Annotated[int, Field(ge=0, description="Number of rows inserted")]
+    errors: Annotated[
+        list[BulkTransactionRowError],
+        Field(description="Rejected rows, when present no row is inserted"),
+    ]
+
+
+class RecurringTransactionsResponse(BaseModel):
+    created: Annotated[int, Field(ge=0, description="Number of rows inserted")]
@@ -0,0 +1,37 @@
+"""Create the missing transactions of enabled recurring concepts.
+
+Each due (properties_concepts, period) pair without a transaction gets one
+with the type and amount of the combo's latest transaction. Running it again
+for the same horizon creates nothing. Run from the repository root:
+
+    python -m scripts.generate_recurring_transactions --from 2026-01 --to 2026-12
+"""
+
+import argparse
+from datetime import date
+
+from core.logging.logger_with_correlation_id import get_logger
+from core.logging.logging_config import setup_logging
+from database import SessionLocal
+from models import concept, property  # noqa: F401  (relationship targets)
+from services.recurrence_service import RecurrenceService
+
+
+def main() -> None:
+    current_period = date.today().strftime("%Y-%m")
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--from", dest="start_period", default=current_period)
+    parser.add_argument("--to", dest="end_period", default=current_period)
+    args = parser.parse_args()
+
+    setup_logging()
+    db = SessionLocal()
+    try:
+        service = RecurrenceService(db, get_logger(__name__))
+        service.generate_missing_transactions(args.start_period, args.end_period)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+"""Recompute the balances table from the transactions table.
+
+Run from the repository root:
+
+    python -m scripts.rebuild_balances
+"""
+
+from database import SessionLocal
+from models import concept, property  # noqa: F401  (relationship targets)
+from repositories.balance_repository import BalanceRepository
+
+
+def main() -> None:
+    db = SessionLocal()
+    try:
+        BalanceRepository(db).rebuild()
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
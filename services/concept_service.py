@@ -1,10 +1,22 @@
+from typing import Callable, Hashable, TypeVar
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
+from core.cache import (
+    CONCEPT_NAMESPACE,
+    NAMESPACE_TABLES,
+    PROPERTIES_CONCEPTS_NAMESPACE,
+    reference_cache,
+)
 from core.logging.logger_with_correlation_id import CorrelationLoggerAdapter
+from repositories.base_repository import describe_dependents
 from repositories.concept_repository import ConceptRepository
 from schemas.concept import ConceptResponse, CreateConcept, UpdateConcept
 
 
+T = TypeVar("T")
+
+
 class ConceptService:
     def __init__(
         self,
@@ -14,8 +26,17 @@ class ConceptService:
         self.concept_repository = ConceptRepository(db)
         self.logger = logger
 
+    def cached(self, key: Hashable, loader: Callable[[], T]) -> T:
+        version = self.concept_repository.versions.get_version_key(
+            NAMESPACE_TABLES[CONCEPT_NAMESPACE]
+        )
+        return reference_cache.get_or_load(CONCEPT_NAMESPACE, key, loader, version)
+
     def get_concept_by_id(self, concept_id: int) -> None | ConceptResponse:
-        existing_concept = self.concept_repository.get_by_id(concept_id)
+        existing_concept = self.cached(
+            concept_id,
+            lambda: self.concept_repository.get_by_id(concept_id),
+        )
 
         if not existing_concept:
             self.logger.warning(
@@ -28,7 +49,7 @@ class ConceptService:
         return existing_concept
 
     def get_all_concepts(self) -> list[ConceptResponse]:
-        return self.concept_repository.get_all()
+        return self.cached("all", self.concept_repository.get_all)
 
     def create_concept(self, concept: CreateConcept) -> ConceptResponse:
         payload = concept.model_dump()
@@ -36,6 +57,7 @@ class ConceptService:
 
         try:
             created_concept = self.concept_repository.create(concept)
+            reference_cache.invalidate(CONCEPT_NAMESPACE, PROPERTIES_CONCEPTS_NAMESPACE)
             self.logger.info(
                 "Concept created successfully",
                 extra={"data": created_concept.model_dump()},
@@ -68,6 +90,7 @@ class ConceptService:
 
         try:
             updated_concept = self.concept_repository.update(concept_id, concept)
+            reference_cache.invalidate(CONCEPT_NAMESPACE, PROPERTIES_CONCEPTS_NAMESPACE)
             self.logger.info(
                 "Concept updated successfully",
                 extra={"data": updated_concept.model_dump()},
@@ -95,6 +118,19 @@ class ConceptService:
                 status_code=status.HTTP_404_NOT_FOUND, detail="Concept not found"
             )
 
+        dependents = self.concept_repository.get_dependents_of(concept_id)
+        if dependents:
+            self.logger.warning(
+                "Delete rejected: Concept is still referenced",
+                extra={"concept_id": concept_id, "dependents": dependents},
+            )
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=(
+                    f"Concept is still referenced by {describe_dependents(dependents)}"
+                ),
+            )
+
         try:
             if not self.concept_repository.delete(concept_id):
                 self.logger.error(
@@ -105,9 +141,19 @@ class ConceptService:
                     detail="An unexpected error occurred while deleting the concept",
                 )
 
+            reference_cache.invalidate(CONCEPT_NAMESPACE, PROPERTIES_CONCEPTS_NAMESPACE)
             self.logger.info(
                 "Concept deleted successfully", extra={"concept_id": concept_id}
             )
+        except IntegrityError:
+            # A row referencing it was added after the check above.
+            self.logger.warning(
+                "Delete rejected by a foreign key", extra={"concept_id": concept_id}
+            )
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Concept is still referenced by other rows",
+            )
         except Exception:
             self.logger.exception(
                 "Failed to delete Concept", extra={"concept_id": concept_id}
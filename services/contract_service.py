@@ -1,7 +1,9 @@
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from core.logging.logger_with_correlation_id import CorrelationLoggerAdapter
 from repositories.contract_repository import ContractRepository
+from repositories.property_repository import PropertyRepository
 from schemas.contract import ContractResponse, CreateContract, UpdateContract
 
 
@@ -12,6 +14,7 @@ class ContractService:
         logger: CorrelationLoggerAdapter,
     ) -> None:
         self.contract_repository = ContractRepository(db)
+        self.property_repository = PropertyRepository(db)
         self.logger = logger
 
     def get_contract_by_id(self, contract_id: int) -> None | ContractResponse:
@@ -31,9 +34,32 @@ class ContractService:
     def get_all_contracts(self) -> list[ContractResponse]:
         return self.contract_repository.get_all()
 
+    def ensure_property_exists(self, property_id: int) -> None:
+        if not self.property_repository.get_by_id(property_id):
+            self.logger.warning(
+                "Contract write rejected: Property not found",
+                extra={"property_id": property_id},
+            )
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail="Property not found",
+            )
+
+    # Raised when the property already has a contract or is deleted between the
+    # check and the write.
+    def conflict(self, payload: dict[str, object]) -> HTTPException:
+        self.logger.warning(
+            "Contract write rejected by a constraint", extra={"data": payload}
+        )
+        return HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="The property already has a contract or no longer exists",
+        )
+
     def create_contract(self, contract: CreateContract) -> ContractResponse:
         payload = contract.model_dump()
         self.logger.info("Creating Contract", extra={"data": payload})
+        self.ensure_property_exists(contract.property_id)
 
         try:
             created_contract = self.contract_repository.create(contract)
@@ -42,6 +68,8 @@ class ContractService:
                 extra={"data": created_contract.model_dump()},
             )
             return created_contract
+        except IntegrityError:
+            raise self.conflict(payload)
         except Exception:
             self.logger.exception("Failed to create Contract", extra={"data": payload})
             raise HTTPException(
@@ -66,6 +94,7 @@ class ContractService:
         self.logger.info(
             "Updating contract", extra={"contract_id": contract_id, "data": payload}
         )
+        self.ensure_property_exists(contract.property_id)
 
         try:
             updated_contract = self.contract_repository.update(contract_id, contract)
@@ -74,6 +103,8 @@ class ContractService:
                 extra={"data": updated_contract.model_dump()},
             )
             return updated_contract
+        except IntegrityError:
+            raise self.conflict(payload)
         except Exception:
             self.logger.exception(
                 "Failed to update Contract",
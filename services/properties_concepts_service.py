@@ -1,6 +1,14 @@
+from typing import Callable, Hashable, TypeVar
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
+from core.cache import (
+    NAMESPACE_TABLES,
+    PROPERTIES_CONCEPTS_NAMESPACE,
+    reference_cache,
+)
 from core.logging.logger_with_correlation_id import CorrelationLoggerAdapter
+from repositories.base_repository import describe_dependents
 from repositories.properties_concepts_repository import PropertiesConceptsRepository
 from schemas.properties_concepts import (
     CreatePropertiesConcepts,
@@ -9,6 +17,9 @@ from schemas.properties_concepts import (
 )
 
 
+T = TypeVar("T")
+
+
 class PropertiesConceptsService:
     def __init__(
         self,
@@ -18,10 +29,21 @@ class PropertiesConceptsService:
         self.repo = PropertiesConceptsRepository(db)
         self.logger = logger
 
+    def cached(self, key: Hashable, loader: Callable[[], T]) -> T:
+        version = self.repo.versions.get_version_key(
+            NAMESPACE_TABLES[PROPERTIES_CONCEPTS_NAMESPACE]
+        )
+        return reference_cache.get_or_load(
+            PROPERTIES_CONCEPTS_NAMESPACE, key, loader, version
+        )
+
     def get_by_id(
         self, properties_concepts_id: int
     ) -> None | PropertiesConceptsResponse:
-        existing_properties_concepts = self.repo.get_by_id(properties_concepts_id)
+        existing_properties_concepts = self.cached(
+            properties_concepts_id,
+            lambda: self.repo.get_by_id(properties_concepts_id),
+        )
 
         if not existing_properties_concepts:
             self.logger.warning(
@@ -36,24 +58,72 @@ class PropertiesConceptsService:
         return existing_properties_concepts
 
     def get_all(self) -> list[PropertiesConceptsResponse]:
-        return self.repo.get_all()
+        return self.cached("all", self.repo.get_all)
 
     def get_combos(self) -> list[PropertiesConceptsResponse]:
-        return self.repo.get_with_navigations()
+        return self.cached("combos", self.repo.get_with_navigations)
+
+    def get_lookup(self, enabled_only: bool) -> list[tuple[int, str]]:
+        return self.cached(
+            ("lookup", enabled_only),
+            lambda: self.repo.get_lookup(enabled_only),
+        )
+
+    def ensure_unique_pair(
+        self,
+        properties_concepts: CreatePropertiesConcepts | UpdatePropertiesConcepts,
+        properties_concepts_id: None | int = None,
+    ) -> None:
+        existing_id = self.repo.get_id_by_pair(
+            properties_concepts.property_id, properties_concepts.concept_id
+        )
+        if existing_id is not None and existing_id != properties_concepts_id:
+            self.logger.warning(
+                "PropertiesConcepts pair already exists",
+                extra={
+                    "properties_concepts_id": existing_id,
+                    "data": properties_concepts.model_dump(),
+                },
+            )
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=(
+                    f"PropertiesConcepts {existing_id} already links this property "
+                    "and concept"
+                ),
+            )
+
+    # Raised when a concurrent write takes the pair first, or the property or
+    # concept does not exist.
+    def conflict(self, payload: dict[str, object]) -> HTTPException:
+        self.logger.warning(
+            "PropertiesConcepts write rejected by a constraint", extra={"data": payload}
+        )
+        return HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=(
+                "The property and concept pair already exists or references a "
+                "missing property or concept"
+            ),
+        )
 
     def create(
         self, properties_concepts: CreatePropertiesConcepts
     ) -> PropertiesConceptsResponse:
         payload = properties_concepts.model_dump()
         self.logger.info("Creating PropertiesConcepts", extra={"data": payload})
+        self.ensure_unique_pair(properties_concepts)
 
         try:
             created_properties_concepts = self.repo.create(properties_concepts)
+            reference_cache.invalidate(PROPERTIES_CONCEPTS_NAMESPACE)
             self.logger.info(
                 "PropertiesConcepts created successfully",
                 extra={"data": created_properties_concepts.model_dump()},
             )
             return created_properties_concepts
+        except IntegrityError:
+            raise self.conflict(payload)
         except Exception:
             self.logger.exception(
                 "Failed to create PropertiesConcepts", extra={"data": payload}
@@ -83,16 +153,20 @@ class PropertiesConceptsService:
             "Updating properties_concepts",
             extra={"properties_concepts_id": properties_concepts_id, "data": payload},
         )
+        self.ensure_unique_pair(properties_concepts, properties_concepts_id)
 
         try:
             updated_properties_concepts = self.repo.update(
                 properties_concepts_id, properties_concepts
             )
+            reference_cache.invalidate(PROPERTIES_CONCEPTS_NAMESPACE)
             self.logger.info(
                 "PropertiesConcepts updated successfully",
                 extra={"data": updated_properties_concepts.model_dump()},
             )
             return updated_properties_concepts
+        except IntegrityError:
+            raise self.conflict(payload)
         except Exception:
             self.logger.exception(
                 "Failed to update PropertiesConcepts",
@@ -123,6 +197,23 @@ class PropertiesConceptsService:
                 detail="PropertiesConcepts not found",
             )
 
+        dependents = self.repo.get_dependents_of(properties_concepts_id)
+        if dependents:
+            self.logger.warning(
+                "Delete rejected: PropertiesConcepts is still referenced",
+                extra={
+                    "properties_concepts_id": properties_concepts_id,
+                    "dependents": dependents,
+                },
+            )
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=(
+                    "PropertiesConcepts is still referenced by "
+                    f"{describe_dependents(dependents)}"
+                ),
+            )
+
         try:
             if not self.repo.delete(properties_concepts_id):
                 self.logger.error(
@@ -134,10 +225,21 @@ class PropertiesConceptsService:
                     detail="An unexpected error occurred while deleting the properties_concepts",
                 )
 
+            reference_cache.invalidate(PROPERTIES_CONCEPTS_NAMESPACE)
             self.logger.info(
                 "PropertiesConcepts deleted successfully",
                 extra={"properties_concepts_id": properties_concepts_id},
             )
+        except IntegrityError:
+            # A row referencing it was added after the check above.
+            self.logger.warning(
+                "Delete rejected by a foreign key",
+                extra={"properties_concepts_id": properties_concepts_id},
+            )
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="PropertiesConcepts is still referenced by other rows",
+            )
         except Exception:
             self.logger.exception(
                 "Failed to delete PropertiesConcepts",
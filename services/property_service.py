@@ -1,10 +1,22 @@
+from typing import Callable, Hashable, TypeVar
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
+from core.cache import (
+    NAMESPACE_TABLES,
+    PROPERTIES_CONCEPTS_NAMESPACE,
+    PROPERTY_NAMESPACE,
+    reference_cache,
+)
 from core.logging.logger_with_correlation_id import CorrelationLoggerAdapter
+from repositories.base_repository import describe_dependents
 from repositories.property_repository import PropertyRepository
 from schemas.property import PropertyResponse, CreateProperty, UpdateProperty
 
 
+T = TypeVar("T")
+
+
 class PropertyService:
     def __init__(
         self,
@@ -14,8 +26,17 @@ class PropertyService:
         self.property_repository = PropertyRepository(db)
         self.logger = logger
 
+    def cached(self, key: Hashable, loader: Callable[[], T]) -> T:
+        version = self.property_repository.versions.get_version_key(
+            NAMESPACE_TABLES[PROPERTY_NAMESPACE]
+        )
+        return reference_cache.get_or_load(PROPERTY_NAMESPACE, key, loader, version)
+
     def get_property_by_id(self, property_id: int) -> None | PropertyResponse:
-        existing_property = self.property_repository.get_by_id(property_id)
+        existing_property = self.cached(
+            property_id,
+            lambda: self.property_repository.get_by_id(property_id),
+        )
 
         if not existing_property:
             self.logger.warning(
@@ -29,7 +50,7 @@ class PropertyService:
         return existing_property
 
     def get_all_properties(self) -> list[PropertyResponse]:
-        return self.property_repository.get_all()
+        return self.cached("all", self.property_repository.get_all)
 
     def create_property(self, property: CreateProperty) -> PropertyResponse:
         payload = property.model_dump()
@@ -37,6 +58,9 @@ class PropertyService:
 
         try:
             created_property = self.property_repository.create(property)
+            reference_cache.invalidate(
+                PROPERTY_NAMESPACE, PROPERTIES_CONCEPTS_NAMESPACE
+            )
             self.logger.info(
                 "Property created successfully",
                 extra={"data": created_property.model_dump()},
@@ -69,6 +93,9 @@ class PropertyService:
 
         try:
             updated_property = self.property_repository.update(property_id, property)
+            reference_cache.invalidate(
+                PROPERTY_NAMESPACE, PROPERTIES_CONCEPTS_NAMESPACE
+            )
             self.logger.info(
                 "Property updated successfully",
                 extra={"data": updated_property.model_dump()},
@@ -96,6 +123,19 @@ class PropertyService:
                 status_code=status.HTTP_404_NOT_FOUND, detail="Property not found"
             )
 
+        dependents = self.property_repository.get_dependents_of(property_id)
+        if dependents:
+            self.logger.warning(
+                "Delete rejected: Property is still referenced",
+                extra={"property_id": property_id, "dependents": dependents},
+            )
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=(
+                    f"Property is still referenced by {describe_dependents(dependents)}"
+                ),
+            )
+
         try:
             if not self.property_repository.delete(property_id):
                 self.logger.error(
@@ -106,9 +146,21 @@ class PropertyService:
                     detail="An unexpected error occurred while deleting the property",
                 )
 
+            reference_cache.invalidate(
+                PROPERTY_NAMESPACE, PROPERTIES_CONCEPTS_NAMESPACE
+            )
             self.logger.info(
                 "Property deleted successfully", extra={"property_id": property_id}
             )
+        except IntegrityError:
+            # A row referencing it was added after the check above.
+            self.logger.warning(
+                "Delete rejected by a foreign key", extra={"property_id": property_id}
+            )
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Property is still referenced by other rows",
+            )
         except Exception:
             self.logger.exception(
                 "Failed to delete Property", extra={"property_id": property_id}
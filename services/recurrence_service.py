@@ -0,0 +1,77 @@
+import re
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from core.logging.logger_with_correlation_id import CorrelationLoggerAdapter
+from repositories.recurrence_repository import (
+    RecurrenceRepository,
+    period_to_month_index,
+)
+
+PERIOD_PATTERN = re.compile(r"^\d{4}-(0[1-9]|1[0-2])$")
+MAX_HORIZON_MONTHS = 120
+
+
+def parse_horizon(
+    start_period: str, end_period: str, logger: CorrelationLoggerAdapter
+) -> tuple[int, int]:
+    if not (PERIOD_PATTERN.match(start_period) and PERIOD_PATTERN.match(end_period)):
+        logger.warning(
+            "Invalid period in horizon",
+            extra={"start_period": start_period, "end_period": end_period},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Periods must follow the YYYY-MM pattern",
+        )
+
+    start_index = period_to_month_index(start_period)
+    end_index = period_to_month_index(end_period)
+    if not 0 <= end_index - start_index < MAX_HORIZON_MONTHS:
+        logger.warning(
+            "Invalid horizon",
+            extra={"start_period": start_period, "end_period": end_period},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=(
+                "The end period must not be before the start period and the "
+                f"horizon must be shorter than {MAX_HORIZON_MONTHS} months"
+            ),
+        )
+
+    return start_index, end_index
+
+
+class RecurrenceService:
+    def __init__(
+        self,
+        db: Session,
+        logger: CorrelationLoggerAdapter,
+    ) -> None:
+        self.recurrence_repository = RecurrenceRepository(db)
+        self.logger = logger
+
+    def generate_missing_transactions(self, start_period: str, end_period: str) -> int:
+        start_index, end_index = parse_horizon(start_period, end_period, self.logger)
+
+        self.logger.info(
+            "Generating recurring transactions",
+            extra={"start_period": start_period, "end_period": end_period},
+        )
+
+        try:
+            created = self.recurrence_repository.create_missing(start_index, end_index)
+            self.logger.info(
+                "Recurring transactions generated successfully",
+                extra={"count": created},
+            )
+            return created
+        except Exception:
+            self.logger.exception(
+                "Failed to generate recurring transactions",
+                extra={"start_period": start_period, "end_period": end_period},
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="An unexpected error occurred while generating transactions",
+            )
@@ -0,0 +1,70 @@
+from datetime import date
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from core.logging.logger_with_correlation_id import CorrelationLoggerAdapter
+from repositories.report_repository import ReportRepository
+from schemas.report import ArrearsResponse, CashflowGroup, CashflowResponse
+from schemas.transaction import TransactionFilters
+from services.recurrence_service import parse_horizon
+
+
+class ReportService:
+    def __init__(
+        self,
+        db: Session,
+        logger: CorrelationLoggerAdapter,
+    ) -> None:
+        self.report_repository = ReportRepository(db)
+        self.logger = logger
+
+    def get_arrears(self, start_period: str, end_period: str) -> list[ArrearsResponse]:
+        start_index, end_index = parse_horizon(start_period, end_period, self.logger)
+
+        self.logger.info(
+            "Fetching arrears",
+            extra={"start_period": start_period, "end_period": end_period},
+        )
+
+        try:
+            arrears = self.report_repository.get_arrears(
+                start_index, end_index, date.today().strftime("%Y-%m")
+            )
+            self.logger.info("Fetched arrears", extra={"count": len(arrears)})
+            return arrears
+        except Exception:
+            self.logger.exception(
+                "Failed to fetch arrears",
+                extra={"start_period": start_period, "end_period": end_period},
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="An unexpected error occurred while fetching arrears",
+            )
+
+    def get_cashflow(
+        self,
+        group_by: list[CashflowGroup],
+        filters: TransactionFilters,
+        rollup: bool,
+    ) -> CashflowResponse:
+        group_by = list(dict.fromkeys(group_by))
+        self.logger.info(
+            "Fetching cashflow",
+            extra={"group_by": group_by, "rollup": rollup},
+        )
+
+        try:
+            rows, totals = self.report_repository.get_cashflow(
+                group_by, filters, rollup
+            )
+            self.logger.info("Fetched cashflow", extra={"count": len(rows)})
+            return CashflowResponse(group_by=group_by, rows=rows, totals=totals)
+        except Exception:
+            self.logger.exception(
+                "Failed to fetch cashflow",
+                extra={"group_by": group_by, "rollup": rollup},
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="An unexpected error occurred while fetching the cashflow",
+            )
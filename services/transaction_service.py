@@ -1,13 +1,44 @@
+import csv
+import io
+import json
+from typing import Any, Iterator, Literal
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from core.logging.logger_with_correlation_id import CorrelationLoggerAdapter
+from core.pagination import decode_cursor, encode_cursor
+from repositories.balance_repository import (
+    CONCEPT_SCOPE,
+    GLOBAL_SCOPE,
+    PERIOD_SCOPE,
+    PROPERTY_SCOPE,
+)
+from repositories.properties_concepts_repository import PropertiesConceptsRepository
 from repositories.transaction_repository import TransactionRepository
 from schemas.transaction import (
+    BulkTransactionResponse,
+    BulkTransactionRowError,
+    TransactionFilters,
+    TransactionPageResponse,
     TransactionResponse,
+    TransactionViewPageResponse,
+    TransactionViewSort,
     CreateTransaction,
     UpdateTransaction,
 )
 
+EXPORT_FIELDS = (
+    "id",
+    "date",
+    "properties_concepts_id",
+    "transaction_type",
+    "period",
+    "amount",
+)
+
+BULK_MAX_ROWS = 10000
+
 
 class TransactionService:
     def __init__(
@@ -16,6 +47,7 @@ class TransactionService:
         logger: CorrelationLoggerAdapter,
     ) -> None:
         self.transaction_repository = TransactionRepository(db)
+        self.properties_concepts_repository = PropertiesConceptsRepository(db)
         self.logger = logger
 
     def get_transaction_by_id(self, transaction_id: int) -> None | TransactionResponse:
@@ -35,9 +67,93 @@ class TransactionService:
     def get_all_transactions(self) -> list[TransactionResponse]:
         return self.transaction_repository.get_all()
 
+    def get_transactions_page(
+        self, filters: TransactionFilters, limit: int, cursor: None | str
+    ) -> TransactionPageResponse:
+        after = None
+        if cursor:
+            try:
+                after = decode_cursor(cursor)
+            except ValueError:
+                self.logger.warning(
+                    "Invalid cursor in get_transactions_page()",
+                    extra={"cursor": cursor},
+                )
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+                )
+
+        items, next_key = self.transaction_repository.get_page(filters, limit, after)
+        next_cursor = encode_cursor(*next_key) if next_key else None
+
+        return TransactionPageResponse(items=items, next_cursor=next_cursor)
+
+    def get_transactions_view(
+        self,
+        filters: TransactionFilters,
+        sort: TransactionViewSort,
+        order: Literal["asc", "desc"],
+        page: int,
+        page_size: int,
+    ) -> TransactionViewPageResponse:
+        items, total = self.transaction_repository.get_view_page(
+            filters, sort, order == "desc", page_size, (page - 1) * page_size
+        )
+
+        return TransactionViewPageResponse(
+            items=items, total=total, page=page, page_size=page_size
+        )
+
+    def export_transactions(
+        self, filters: TransactionFilters, export_format: Literal["ndjson", "csv"]
+    ) -> Iterator[str]:
+        self.logger.info(
+            "Exporting transactions",
+            extra={"format": export_format, "filters": filters.model_dump()},
+        )
+
+        batches = self.transaction_repository.iter_batches(filters)
+
+        if export_format == "csv":
+            yield ",".join(EXPORT_FIELDS) + "\r\n"
+            for batch in batches:
+                buffer = io.StringIO()
+                csv.writer(buffer).writerows(batch)
+                yield buffer.getvalue()
+        else:
+            for batch in batches:
+                yield "".join(
+                    json.dumps(dict(zip(EXPORT_FIELDS, row)), default=str) + "\n"
+                    for row in batch
+                )
+
+    def ensure_combo_exists(self, properties_concepts_id: int) -> None:
+        if not self.properties_concepts_repository.get_existing_ids(
+            [properties_concepts_id]
+        ):
+            self.logger.warning(
+                "Transaction write rejected: PropertiesConcepts not found",
+                extra={"properties_concepts_id": properties_concepts_id},
+            )
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail="PropertiesConcepts not found",
+            )
+
+    # Raised when the combo is deleted between the check and the write.
+    def conflict(self, payload: dict[str, object]) -> HTTPException:
+        self.logger.warning(
+            "Transaction write rejected by a constraint", extra={"data": payload}
+        )
+        return HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="The transaction references a missing properties_concepts",
+        )
+
     def create_transaction(self, transaction: CreateTransaction) -> TransactionResponse:
         payload = transaction.model_dump()
         self.logger.info("Creating Transaction", extra={"data": payload})
+        self.ensure_combo_exists(transaction.properties_concepts_id)
 
         try:
             created_transaction = self.transaction_repository.create(transaction)
@@ -46,6 +162,8 @@ class TransactionService:
                 extra={"data": created_transaction.model_dump()},
             )
             return created_transaction
+        except IntegrityError:
+            raise self.conflict(payload)
         except Exception:
             self.logger.exception(
                 "Failed to create Transaction", extra={"data": payload}
@@ -55,6 +173,78 @@ class TransactionService:
                 detail="An unexpected error occurred while creating the transaction",
             )
 
+    def create_transactions_bulk(self, rows: list[Any]) -> BulkTransactionResponse:
+        if not rows:
+            self.logger.warning("Bulk create rejected: no rows")
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail="At least one transaction is required",
+            )
+
+        if len(rows) > BULK_MAX_ROWS:
+            self.logger.warning(
+                "Bulk create rejected: too many rows", extra={"count": len(rows)}
+            )
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"At most {BULK_MAX_ROWS} transactions can be created at once",
+            )
+
+        self.logger.info("Creating Transactions in bulk", extra={"count": len(rows)})
+
+        valid: list[tuple[int, CreateTransaction]] = []
+        errors: list[BulkTransactionRowError] = []
+        for index, row in enumerate(rows):
+            try:
+                valid.append((index, CreateTransaction.model_validate(row)))
+            except ValidationError as exc:
+                errors.append(
+                    BulkTransactionRowError(
+                        index=index,
+                        errors=[
+                            ": ".join(
+                                filter(None, (".".join(map(str, e["loc"])), e["msg"]))
+                            )
+                            for e in exc.errors()
+                        ],
+                    )
+                )
+
+        existing_ids = self.properties_concepts_repository.get_existing_ids(
+            t.properties_concepts_id for _, t in valid
+        )
+        for index, t in valid:
+            if t.properties_concepts_id not in existing_ids:
+                errors.append(
+                    BulkTransactionRowError(
+                        index=index,
+                        errors=["properties_concepts_id: PropertiesConcepts not found"],
+                    )
+                )
+
+        if errors:
+            errors.sort(key=lambda e: e.index)
+            self.logger.warning(
+                "Bulk create rejected: invalid rows",
+                extra={"count": len(rows), "invalid": len(errors)},
+            )
+            return BulkTransactionResponse(created=0, errors=errors)
+
+        try:
+            created = self.transaction_repository.create_many([t for _, t in valid])
+            self.logger.info(
+                "Transactions created successfully", extra={"count": created}
+            )
+            return BulkTransactionResponse(created=created, errors=[])
+        except Exception:
+            self.logger.exception(
+                "Failed to create Transactions in bulk", extra={"count": len(rows)}
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="An unexpected error occurred while creating the transactions",
+            )
+
     def update_transaction(
         self, transaction_id: int, transaction: UpdateTransaction
     ) -> TransactionResponse:
@@ -74,6 +264,7 @@ class TransactionService:
             "Updating transaction",
             extra={"transaction_id": transaction_id, "data": payload},
         )
+        self.ensure_combo_exists(transaction.properties_concepts_id)
 
         try:
             updated_transaction = self.transaction_repository.update(
@@ -84,6 +275,8 @@ class TransactionService:
                 extra={"data": updated_transaction.model_dump()},
             )
             return updated_transaction
+        except IntegrityError:
+            raise self.conflict(payload)
         except Exception:
             self.logger.exception(
                 "Failed to update Transaction",
@@ -117,7 +310,9 @@ class TransactionService:
                 )
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="An unexpected error occurred while deleting the transaction",
+                    detail=(
+                        "An unexpected error occurred while deleting the transaction"
+                    ),
                 )
 
             self.logger.info(
@@ -133,11 +328,41 @@ class TransactionService:
                 detail="An unexpected error occurred while deleting the transaction",
             )
 
-    def get_balance(self) -> float:
-        self.logger.info("Calculating transactions balance")
+    def get_balance(
+        self,
+        property_id: None | int = None,
+        concept_id: None | int = None,
+        period: None | str = None,
+    ) -> float:
+        scopes = [
+            (scope, str(key))
+            for scope, key in (
+                (PROPERTY_SCOPE, property_id),
+                (CONCEPT_SCOPE, concept_id),
+                (PERIOD_SCOPE, period),
+            )
+            if key is not None
+        ]
+        if len(scopes) > 1:
+            self.logger.warning(
+                "Invalid scope in get_balance(): more than one filter given",
+                extra={"scopes": scopes},
+            )
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=(
+                    "Filter the balance by at most one of property, concept or period"
+                ),
+            )
+        scope, scope_key = scopes[0] if scopes else (GLOBAL_SCOPE, "")
+
+        self.logger.info(
+            "Calculating transactions balance",
+            extra={"scope": scope, "scope_key": scope_key},
+        )
 
         try:
-            balance = self.transaction_repository.get_balance()
+            balance = self.transaction_repository.get_balance(scope, scope_key)
             self.logger.info(
                 "Balance calculated successfully", extra={"balance": balance}
             )